@@ -5,7 +5,10 @@ from __future__ import annotations
 Every model or preprocessing block **must** inherit from either
 `BaseEstimatorBlock` (for estimators with `fit`/`predict`) or
 `BaseTransformerBlock` (for stateless/stateless* preprocessors that expose
-`fit`/`transform`).  These mixins exist purely to enforce a *uniform* public
+`fit`/`transform`).  Blocks that drop training *rows* (outlier removal)
+inherit from `BaseSampleFilterBlock` and run inside
+`components.pipeline.SampleMaskPipeline`, which drops the matching targets
+and sample weights too.  These mixins exist purely to enforce a *uniform* public
 API across the heterogeneous wrappers scattered throughout the harness.
 
 Every AutoML engine wrapper **must** inherit from `BaseEngine` to ensure a
@@ -41,8 +44,8 @@ class BaseEstimatorBlock(BaseComponent):
     """Mixin for estimator-style components (expose `fit`/`predict`)."""
 
     @abstractmethod
-    def fit(self, X, y=None):
-        """Fit the estimator to *X* and *y*."""
+    def fit(self, X, y=None, sample_weight=None):
+        """Fit the estimator to *X* and *y* (optionally weighting the rows)."""
         raise NotImplementedError
 
     @abstractmethod
@@ -50,6 +53,21 @@ class BaseEstimatorBlock(BaseComponent):
         """Predict targets for *X*."""
         raise NotImplementedError
 
+    def _fit_impl(self, X, y, sample_weight=None):
+        """Fit the wrapped ``_impl``, forwarding *sample_weight* when given."""
+        if sample_weight is None:
+            self._impl.fit(X, y)
+            return self
+        from sklearn.utils.validation import has_fit_parameter
+
+        if not has_fit_parameter(self._impl, "sample_weight"):
+            raise TypeError(
+                f"{type(self).__name__} cannot use sample_weight: "
+                f"{type(self._impl).__name__}.fit does not accept it."
+            )
+        self._impl.fit(X, y, sample_weight=sample_weight)
+        return self
+
 
 class BaseTransformerBlock(BaseComponent):
     """Mixin for transformer-style components (expose `fit`/`transform`)."""
@@ -68,6 +86,51 @@ class BaseTransformerBlock(BaseComponent):
         return self.transform(X)
 
 
+class BaseSampleFilterBlock(BaseTransformerBlock):
+    """Mixin for components that remove training samples (e.g. outliers).
+
+    ``fit`` decides which training rows to keep (`get_support_mask`);
+    ``transform`` is a pass-through, so at predict time every row is scored.
+    Rows are only ever dropped through `fit_resample` – directly or via
+    `components.pipeline.SampleMaskPipeline` – which filters ``y`` and the
+    sample weights with the same mask.  Subclasses implement `_inlier_mask`.
+    """
+
+    @abstractmethod
+    def _inlier_mask(self, X, y=None):
+        """Boolean array, ``True`` for the rows of *X* to keep."""
+        raise NotImplementedError
+
+    def fit(self, X, y=None):
+        import numpy as np
+
+        self.support_mask_ = np.asarray(self._inlier_mask(X, y), dtype=bool)
+        return self
+
+    def transform(self, X):
+        return X
+
+    def fit_transform(self, X, y=None):
+        """Fit, then pass *X* through unchanged (use `fit_resample` to drop rows)."""
+        return self.fit(X, y).transform(X)
+
+    def fit_resample(self, X, y=None, sample_weight=None):
+        """Fit and return the kept rows: ``(X, y)``, plus the weights if given."""
+        from components.pipeline import select_rows
+
+        mask = self.fit(X, y).get_support_mask()
+        if sample_weight is None:
+            return select_rows(X, mask), select_rows(y, mask)
+        return select_rows(X, mask), select_rows(y, mask), select_rows(sample_weight, mask)
+
+    def get_support_mask(self):
+        """Boolean mask of the training rows retained by the last `fit`."""
+        mask = getattr(self, "support_mask_", None)
+        if mask is None:
+            raise RuntimeError(f"{type(self).__name__} has not been fitted yet.")
+        return mask
+
+
 class BaseEngine(ABC):
     """Base class for all AutoML engine wrappers."""
 
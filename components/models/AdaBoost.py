@@ -21,11 +21,11 @@ class AdaBoostBlock(BaseEstimatorBlock):
         from sklearn.ensemble import AdaBoostRegressor as _ABR
 
         self._params = kwargs.copy()
-        self._impl = _ABR(random_state=42, **kwargs)
+        kwargs.setdefault("random_state", 42)
+        self._impl = _ABR(**kwargs)
 
-    def fit(self, X, y):
-        self._impl.fit(X, y)
-        return self
+    def fit(self, X, y, sample_weight: Any | None = None):
+        return self._fit_impl(X, y, sample_weight)
 
     def predict(self, X):
         return self._impl.predict(X)
@@ -23,11 +23,11 @@ class LightGBMBlock(BaseEstimatorBlock):
         from lightgbm import LGBMRegressor as _LGBMR
 
         self._params = kwargs.copy()
-        self._impl = _LGBMR(random_state=42, **kwargs)
+        kwargs.setdefault("random_state", 42)
+        self._impl = _LGBMR(**kwargs)
 
-    def fit(self, X, y):
-        self._impl.fit(X, y)
-        return self
+    def fit(self, X, y, sample_weight: Any | None = None):
+        return self._fit_impl(X, y, sample_weight)
 
     def predict(self, X):
         return self._impl.predict(X)
@@ -24,11 +24,11 @@ class MLPBlock(BaseEstimatorBlock):
         from sklearn.neural_network import MLPRegressor as _MLP
 
         self._params = kwargs.copy()
-        self._impl = _MLP(random_state=42, **kwargs)
+        kwargs.setdefault("random_state", 42)
+        self._impl = _MLP(**kwargs)
 
-    def fit(self, X, y):
-        self._impl.fit(X, y)
-        return self
+    def fit(self, X, y, sample_weight: Any | None = None):
+        return self._fit_impl(X, y, sample_weight)
 
     def predict(self, X):
         return self._impl.predict(X)
@@ -24,9 +24,8 @@ class MyNewModelBlock(BaseEstimatorBlock):
         self._params = kwargs.copy()
         self._impl = _KNR(**kwargs)
 
-    def fit(self, X, y):
-        self._impl.fit(X, y)
-        return self
+    def fit(self, X, y, sample_weight: Any | None = None):
+        return self._fit_impl(X, y, sample_weight)
 
     def predict(self, X):
         return self._impl.predict(X)
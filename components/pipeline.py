@@ -0,0 +1,80 @@
+"""Pipeline runtime that lets sample-filter blocks drop training rows.
+
+scikit-learn's ``Pipeline`` only threads ``X`` through its steps, so a step
+that removes outliers cannot remove the matching targets.
+:class:`SampleMaskPipeline` fits `BaseSampleFilterBlock` steps, takes their
+support mask and applies it to ``X``, ``y`` and ``sample_weight`` before the
+next step sees them.  Prediction is unchanged from ``Pipeline``: filters
+pass every row through, so new data is never dropped.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+from sklearn.pipeline import Pipeline
+from sklearn.utils.validation import has_fit_parameter
+
+
+def select_rows(data: Any, mask: np.ndarray) -> Any:
+    """Rows of *data* where *mask* is ``True`` (``None`` passes through).
+
+    pandas objects are selected positionally and keep their index.
+    """
+    if data is None:
+        return None
+    if hasattr(data, "iloc"):
+        return data.iloc[np.flatnonzero(mask)]
+    return np.asarray(data)[mask]
+
+
+def _is_filter(step: Any) -> bool:
+    return hasattr(step, "get_support_mask") and hasattr(step, "fit_resample")
+
+
+class SampleMaskPipeline(Pipeline):
+    """``Pipeline`` whose sample-filter steps drop rows of ``X``, ``y`` and weights in ``fit``.
+
+    ``sample_weight`` is the only fit parameter threaded through; it is
+    passed to the final estimator after all filters have been applied.
+
+    Raises
+    ------
+    TypeError
+        If ``sample_weight`` is given and the final estimator's ``fit`` does
+        not accept it.
+    """
+
+    def fit(self, X: Any, y: Any = None, sample_weight: Any = None) -> "SampleMaskPipeline":
+        final = self._final_estimator
+        if sample_weight is not None and final != "passthrough" and not has_fit_parameter(final, "sample_weight"):
+            raise TypeError(f"Final step {type(final).__name__}.fit does not accept sample_weight.")
+        Xt, yt, weights = self._fit_steps(X, y, sample_weight)
+        if final != "passthrough":
+            kwargs = {} if weights is None else {"sample_weight": weights}
+            final.fit(Xt, yt, **kwargs)
+        return self
+
+    def fit_predict(self, X: Any, y: Any = None, sample_weight: Any = None) -> Any:
+        """Fit on the filtered rows, then predict *every* row of ``X``."""
+        return self.fit(X, y, sample_weight=sample_weight).predict(X)
+
+    def fit_transform(self, X: Any, y: Any = None, sample_weight: Any = None) -> Any:
+        """Fit on the filtered rows, then transform *every* row of ``X``."""
+        return self.fit(X, y, sample_weight=sample_weight).transform(X)
+
+    def _fit_steps(self, X: Any, y: Any, sample_weight: Any) -> tuple[Any, Any, Any]:
+        self._validate_steps()
+        self.sample_mask_ = np.ones(len(X), dtype=bool)
+        for _, _, step in self._iter(with_final=False, filter_passthrough=True):
+            if _is_filter(step):
+                mask = step.fit(X, y).get_support_mask()
+                X, y, sample_weight = (select_rows(v, mask) for v in (X, y, sample_weight))
+                # Positions of the surviving rows in the original input.
+                self.sample_mask_[np.flatnonzero(self.sample_mask_)[~mask]] = False
+            else:
+                X = step.fit_transform(X, y)
+        return X, y, sample_weight
+
+
+__all__ = ["SampleMaskPipeline", "select_rows"]
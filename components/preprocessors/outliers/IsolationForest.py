@@ -6,11 +6,23 @@ import numpy as np
 from sklearn.base import BaseEstimator
 from sklearn.ensemble import IsolationForest as _SkIsolationForest
 
-from components.base import BaseTransformerBlock
+from components.base import BaseSampleFilterBlock
 
 
-class IsolationForestBlock(BaseTransformerBlock, BaseEstimator):
-    """Wrapper around ``sklearn.ensemble.IsolationForest`` that drops detected outliers."""
+class IsolationForestBlock(BaseSampleFilterBlock, BaseEstimator):
+    """Wrapper around ``sklearn.ensemble.IsolationForest`` that drops detected outliers.
+
+    Rows are dropped during ``fit`` through ``SampleMaskPipeline``/
+    ``fit_resample``; ``transform`` passes rows through.
+
+    Every training row is scored exactly once, in ``chunk_rows``-row chunks
+    spread over ``n_jobs`` threads.  The scores are kept in ``scores_``, and
+    both the ``contamination`` threshold and the support mask come from them.
+    ``sample_size`` fits the forest on a random subset of the rows, which
+    bounds the fit cost on large tables; every row is still scored.  The
+    fitted forest stays available: `score_samples`/`predict` score new rows,
+    e.g. successive chunks of a stream, against the same threshold.
+    """
 
     signature = {
         "type": "preprocessor",
@@ -19,26 +31,80 @@ class IsolationForestBlock(BaseTransformerBlock, BaseEstimator):
             "n_estimators": "int",
             "contamination": "float",
             "max_features": "float",
+            "max_samples": "int",
+            "sample_size": "int",
         },
     }
 
-    def __init__(self, **kwargs):
-        self._params = kwargs.copy()
-        self._impl = _SkIsolationForest(**kwargs)
-        self._mask: np.ndarray | None = None
-
-    def fit(self, X: np.ndarray, y: Any = None):
-        self._impl.fit(X)
-        self._mask = self._impl.predict(X) == 1  # 1 for inlier, -1 for outlier
-        return self
-
-    def transform(self, X: np.ndarray):
-        if self._mask is None:
-            # If not fitted transform acts as identity
-            return X
-        return X[self._mask]
-
-    def get_support_mask(self) -> np.ndarray:  # noqa: D401
-        if self._mask is None:
-            raise RuntimeError("IsolationForestBlock has not been fitted yet.")
-        return self._mask 
+    def __init__(
+        self,
+        n_estimators: int = 100,
+        contamination: float | str = "auto",
+        max_features: float = 1.0,
+        random_state: int | None = None,
+        max_samples: int | float | str = "auto",
+        sample_size: int | None = None,
+        chunk_rows: int = 50_000,
+        n_jobs: int | None = None,
+    ):
+        self.n_estimators = n_estimators
+        self.contamination = contamination
+        self.max_features = max_features
+        self.random_state = random_state
+        self.max_samples = max_samples
+        self.sample_size = sample_size
+        self.chunk_rows = chunk_rows
+        self.n_jobs = n_jobs
+
+    def _inlier_mask(self, X: np.ndarray, y: Any = None) -> np.ndarray:
+        # The forest is fitted with contamination="auto" so it does not score
+        # the training rows itself; the threshold is set from `scores_` below.
+        self._impl = _SkIsolationForest(
+            n_estimators=self.n_estimators,
+            max_samples=self.max_samples,
+            contamination="auto",
+            max_features=self.max_features,
+            random_state=self.random_state,
+        )
+        n_rows = X.shape[0]
+        if self.sample_size is not None and n_rows > self.sample_size:
+            rng = np.random.default_rng(self.random_state)
+            rows = np.sort(rng.choice(n_rows, size=self.sample_size, replace=False))
+            self._impl.fit(X.iloc[rows] if hasattr(X, "iloc") else X[rows])
+        else:
+            self._impl.fit(X)
+
+        self.scores_ = self.score_samples(X)
+        if self.contamination != "auto":
+            self._impl.offset_ = np.percentile(self.scores_, 100.0 * self.contamination)
+        self.offset_ = self._impl.offset_
+        return self.scores_ >= self.offset_
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+    def score_samples(self, X: Any) -> np.ndarray:
+        """Anomaly score of each row of *X* (lower = more abnormal), chunked over ``n_jobs`` threads."""
+        from joblib import Parallel, delayed
+
+        impl = getattr(self, "_impl", None)
+        if impl is None:
+            raise RuntimeError(f"{type(self).__name__} has not been fitted yet.")
+        n_rows = X.shape[0]
+        step = max(1, self.chunk_rows)
+        if n_rows <= step:
+            return impl.score_samples(X)
+        rows = X.iloc if hasattr(X, "iloc") else X
+        # Tree traversal releases the GIL, so threads avoid copying the forest.
+        chunks = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(impl.score_samples)(rows[start:start + step]) for start in range(0, n_rows, step)
+        )
+        return np.concatenate(chunks)
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        """Score minus the fitted threshold; negative for outliers."""
+        return self.score_samples(X) - self.offset_
+
+    def predict(self, X: Any) -> np.ndarray:
+        """``1`` for inliers and ``-1`` for outliers among new rows."""
+        return np.where(self.decision_function(X) < 0, -1, 1)
@@ -4,17 +4,32 @@ from typing import Any
 
 import numpy as np
 from sklearn.base import BaseEstimator
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 
-from components.base import BaseTransformerBlock
+from components.base import BaseSampleFilterBlock
 
+MODES = ("auto", "full", "minibatch", "subsample")
 
-class KMeansOutlierBlock(BaseTransformerBlock, BaseEstimator):
+
+class KMeansOutlierBlock(BaseSampleFilterBlock, BaseEstimator):
     """Remove observations belonging to *tiny* K-means clusters.
 
     The heuristic assumes that clusters representing fewer than
     ``min_cluster_size_ratio * n_samples`` are anomalies and should be purged
-    prior to model training.
+    prior to model training.  Rows are dropped during ``fit`` through
+    ``SampleMaskPipeline``/``fit_resample``; ``transform`` passes rows through.
+
+    How the clusters are found is set by ``mode``:
+
+    * ``"full"`` – ``KMeans`` on every row (cost grows with rows x ``n_init``);
+    * ``"minibatch"`` – ``MiniBatchKMeans`` over ``batch_size``-row batches;
+    * ``"subsample"`` – ``KMeans`` on ``sample_size`` random rows, then every
+      row is assigned to its nearest centre;
+    * ``"auto"`` (default) – ``"full"`` up to ``sample_size`` rows,
+      ``"subsample"`` above.
+
+    Cluster sizes are always counted over *all* rows, so the size threshold
+    means the same thing in every mode.
     """
 
     signature = {
@@ -23,33 +38,60 @@ class KMeansOutlierBlock(BaseTransformerBlock, BaseEstimator):
         "hyperparameters": {
             "n_clusters": "int",
             "min_cluster_size_ratio": "float",
+            "mode": "str",
+            "sample_size": "int",
+            "n_init": "int",
         },
     }
 
-    def __init__(self, n_clusters: int = 2, min_cluster_size_ratio: float = 0.05, random_state: int | None = None):
+    def __init__(
+        self,
+        n_clusters: int = 2,
+        min_cluster_size_ratio: float = 0.05,
+        random_state: int | None = None,
+        mode: str = "auto",
+        sample_size: int = 20_000,
+        n_init: int = 10,
+        batch_size: int = 4096,
+    ):
         self.n_clusters = n_clusters
         self.min_cluster_size_ratio = min_cluster_size_ratio
         self.random_state = random_state
+        self.mode = mode
+        self.sample_size = sample_size
+        self.n_init = n_init
+        self.batch_size = batch_size
 
     # ------------------------------------------------------------------
-    def fit(self, X: np.ndarray, y: Any = None):  # noqa: D417
-        self._impl = KMeans(n_clusters=self.n_clusters, random_state=self.random_state, n_init=10)
-        self._impl.fit(X)
-        self._labels = self._impl.labels_
-        return self
-
-    def transform(self, X: np.ndarray):  # noqa: D401
-        labels = getattr(self, "_labels", self._impl.predict(X))
-        counts = np.bincount(labels)
-        small_clusters = {idx for idx, cnt in enumerate(counts) if cnt < self.min_cluster_size_ratio * len(X)}
-        mask = ~np.isin(labels, list(small_clusters))
-        # Drop rows corresponding to small clusters
-        return X[mask]
-
-    # Expose mask for downstream components if needed
-    def get_support_mask(self) -> np.ndarray:  # noqa: D401
-        """Return boolean mask of retained samples after `.fit()`."""
-        labels = self._labels
-        counts = np.bincount(labels)
-        small_clusters = {idx for idx, cnt in enumerate(counts) if cnt < self.min_cluster_size_ratio * len(labels)}
-        return ~np.isin(labels, list(small_clusters)) 
+    def _inlier_mask(self, X: np.ndarray, y: Any = None) -> np.ndarray:  # noqa: D417
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown KMeansOutlier mode {self.mode!r}; choose from {MODES}.")
+        n_rows = X.shape[0]
+        mode = self.mode
+        if mode == "auto":
+            mode = "full" if n_rows <= self.sample_size else "subsample"
+        self.mode_ = mode
+
+        if mode == "minibatch":
+            self._impl = MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                batch_size=self.batch_size,
+                n_init=self.n_init,
+                random_state=self.random_state,
+            )
+            self._labels = self._impl.fit_predict(X)
+        elif mode == "subsample" and n_rows > self.sample_size:
+            rng = np.random.default_rng(self.random_state)
+            rows = np.sort(rng.choice(n_rows, size=self.sample_size, replace=False))
+            sample = X.iloc[rows] if hasattr(X, "iloc") else X[rows]
+            self._impl = KMeans(n_clusters=self.n_clusters, random_state=self.random_state, n_init=self.n_init)
+            self._impl.fit(sample)
+            self._labels = self._impl.predict(X)
+        else:
+            self._impl = KMeans(n_clusters=self.n_clusters, random_state=self.random_state, n_init=self.n_init)
+            self._labels = self._impl.fit_predict(X)
+
+        counts = np.bincount(self._labels, minlength=self.n_clusters)
+        # Per-cluster keep flags, indexed by each row's label.
+        self.small_clusters_ = counts < self.min_cluster_size_ratio * len(self._labels)
+        return ~self.small_clusters_[self._labels]
@@ -6,11 +6,30 @@ import numpy as np
 from sklearn.base import BaseEstimator
 from sklearn.neighbors import LocalOutlierFactor as _SkLOF
 
-from components.base import BaseTransformerBlock
+from components.base import BaseSampleFilterBlock
 
+ALGORITHMS = ("auto", "ball_tree", "kd_tree", "brute", "random_projection")
 
-class LOFBlock(BaseTransformerBlock, BaseEstimator):
-    """Local Outlier Factor based sample pruning."""
+
+class LOFBlock(BaseSampleFilterBlock, BaseEstimator):
+    """Local Outlier Factor based sample pruning.
+
+    Rows are dropped during ``fit`` through ``SampleMaskPipeline``/
+    ``fit_resample``; ``transform`` passes rows through.
+
+    ``algorithm`` selects the neighbour index: scikit-learn's exact
+    ``"ball_tree"``/``"kd_tree"``/``"brute"`` search (``"auto"`` lets it
+    choose), or ``"random_projection"``: a KD-tree over a
+    ``projection_dim``-dimensional Gaussian random projection proposes
+    ``candidate_factor`` times more neighbours than needed and exact
+    distances pick the nearest among them (see `ProjectedNeighbors`).  Trees
+    degrade to brute force on wide tables, which makes exact LOF quadratic
+    in the row count; the projected tree does not.  Neighbour queries run in
+    parallel over ``n_jobs``.
+
+    With ``novelty=True`` the fitted index is kept for inference:
+    `score_samples`/`predict` score new rows against the training data.
+    """
 
     signature = {
         "type": "preprocessor",
@@ -18,27 +37,154 @@ class LOFBlock(BaseTransformerBlock, BaseEstimator):
         "hyperparameters": {
             "n_neighbors": "int",
             "contamination": "float",
+            "algorithm": "str",
+            "novelty": "bool",
         },
     }
 
-    def __init__(self, **kwargs):
-        # LOF does not support `predict` unless novelty=True; we use fit_predict.
-        self._params = kwargs.copy()
-        # Force novelty=False to allow fit_predict (on training data) but we only care train set
-        self._impl = _SkLOF(**kwargs)
-        self._mask: np.ndarray | None = None
+    def __init__(
+        self,
+        n_neighbors: int = 20,
+        contamination: float | str = "auto",
+        algorithm: str = "auto",
+        leaf_size: int = 30,
+        n_jobs: int | None = None,
+        novelty: bool = False,
+        projection_dim: int = 6,
+        candidate_factor: int = 4,
+        random_state: int | None = None,
+    ):
+        self.n_neighbors = n_neighbors
+        self.contamination = contamination
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.n_jobs = n_jobs
+        self.novelty = novelty
+        self.projection_dim = projection_dim
+        self.candidate_factor = candidate_factor
+        self.random_state = random_state
 
-    def fit(self, X: np.ndarray, y: Any = None):
-        labels = self._impl.fit_predict(X)
-        self._mask = labels == 1  # 1 inlier, -1 outlier
-        return self
+    def _inlier_mask(self, X: np.ndarray, y: Any = None) -> np.ndarray:
+        if self.algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown LOF algorithm {self.algorithm!r}; choose from {ALGORITHMS}.")
+        self._index = None
+        params = {"algorithm": self.algorithm}
+        if self.algorithm == "random_projection":
+            self._index = ProjectedNeighbors(
+                projection_dim=self.projection_dim,
+                candidate_factor=self.candidate_factor,
+                leaf_size=self.leaf_size,
+                n_jobs=self.n_jobs,
+                random_state=self.random_state,
+            ).fit(X)
+            # The extra neighbour is the row itself, which sklearn drops.
+            X = self._index.kneighbors_graph(None, self.n_neighbors + 1)
+            params = {"metric": "precomputed"}
+
+        self._impl = _SkLOF(
+            n_neighbors=self.n_neighbors,
+            contamination=self.contamination,
+            leaf_size=self.leaf_size,
+            n_jobs=self.n_jobs,
+            novelty=self.novelty,
+            **params,
+        )
+        self._impl.fit(X)
+        # Same rule as LocalOutlierFactor.fit_predict, available in both modes.
+        return self._impl.negative_outlier_factor_ >= self._impl.offset_
 
-    def transform(self, X: np.ndarray):
-        if self._mask is None:
+    # ------------------------------------------------------------------
+    # Inference (novelty mode)
+    # ------------------------------------------------------------------
+    def score_samples(self, X: Any) -> np.ndarray:
+        """Negated LOF of new rows against the fitted index (lower = more abnormal)."""
+        return self._novelty_impl().score_samples(self._project(X))
+
+    def predict(self, X: Any) -> np.ndarray:
+        """``1`` for inliers and ``-1`` for outliers among new rows."""
+        return self._novelty_impl().predict(self._project(X))
+
+    def _novelty_impl(self) -> _SkLOF:
+        self.get_support_mask()
+        if not self.novelty:
+            raise RuntimeError("LOFBlock scores new rows only when fitted with novelty=True.")
+        return self._impl
+
+    def _project(self, X: Any) -> Any:
+        if self._index is None:
             return X
-        return X[self._mask]
+        return self._index.kneighbors_graph(X, self.n_neighbors)
+
+
+class ProjectedNeighbors:
+    """Approximate k-nearest-neighbour graphs from a randomly projected KD-tree.
+
+    The rows are projected to ``projection_dim`` Gaussian random directions
+    (skipped when they have no more columns than that) and indexed by a
+    KD-tree.  A query asks the tree for ``candidate_factor * k`` candidates,
+    then ranks them by their exact Euclidean distance in the original space
+    and keeps the ``k`` nearest.  The result is a CSR distance graph, the
+    ``metric="precomputed"`` input of scikit-learn's neighbour estimators.
+    """
+
+    # Candidate coordinates gathered per block of query rows (8 MiB of float64).
+    BLOCK_CELLS = 1 << 20
+
+    def __init__(
+        self,
+        projection_dim: int = 6,
+        candidate_factor: int = 4,
+        leaf_size: int = 30,
+        n_jobs: int | None = None,
+        random_state: int | None = None,
+    ):
+        self.projection_dim = projection_dim
+        self.candidate_factor = candidate_factor
+        self.leaf_size = leaf_size
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit(self, X: Any) -> "ProjectedNeighbors":
+        from sklearn.neighbors import NearestNeighbors
+
+        self.fit_X_ = np.ascontiguousarray(X, dtype=np.float64)
+        self.projection_ = None
+        if self.fit_X_.shape[1] > self.projection_dim:
+            from sklearn.random_projection import GaussianRandomProjection
+
+            self.projection_ = GaussianRandomProjection(n_components=self.projection_dim, random_state=self.random_state)
+            self.projection_.fit(self.fit_X_)
+        self.tree_ = NearestNeighbors(algorithm="kd_tree", leaf_size=self.leaf_size, n_jobs=self.n_jobs)
+        self.tree_.fit(self._projected(self.fit_X_))
+        return self
+
+    def kneighbors_graph(self, X: Any, n_neighbors: int) -> Any:
+        """CSR graph of the *n_neighbors* nearest training rows of each row of *X*.
+
+        ``X=None`` queries the training rows, each of which then lists itself
+        at distance zero.
+        """
+        from scipy.sparse import csr_matrix
+
+        queries = self.fit_X_ if X is None else np.ascontiguousarray(X, dtype=np.float64)
+        n_fit = len(self.fit_X_)
+        n_candidates = min(n_fit, max(n_neighbors, self.candidate_factor * n_neighbors))
+        candidates = self.tree_.kneighbors(self._projected(queries), n_candidates, return_distance=False)
+
+        distances = np.empty((len(queries), n_neighbors))
+        indices = np.empty((len(queries), n_neighbors), dtype=np.intp)
+        step = max(1, self.BLOCK_CELLS // (n_candidates * queries.shape[1]))
+        for start in range(0, len(queries), step):
+            block = candidates[start:start + step]
+            diff = self.fit_X_[block] - queries[start:start + step, None, :]
+            exact = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+            nearest = np.argsort(exact, axis=1, kind="stable")[:, :n_neighbors]
+            distances[start:start + step] = np.take_along_axis(exact, nearest, axis=1)
+            indices[start:start + step] = np.take_along_axis(block, nearest, axis=1)
+
+        indptr = np.arange(0, indices.size + 1, n_neighbors)
+        # Explicit zeros (a row's distance to itself) are kept as stored entries.
+        return csr_matrix((distances.ravel(), indices.ravel(), indptr), shape=(len(queries), n_fit))
 
-    def get_support_mask(self) -> np.ndarray:  # noqa: D401
-        if self._mask is None:
-            raise RuntimeError("LOFBlock has not been fitted yet.")
-        return self._mask 
+    def _projected(self, X: np.ndarray) -> np.ndarray:
+        return X if self.projection_ is None else self.projection_.transform(X)
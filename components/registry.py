@@ -0,0 +1,245 @@
+"""Index of the concrete component blocks, built without importing them.
+
+Every block module under ``components/models`` and
+``components/preprocessors`` declares its class-level ``signature`` dict as
+a literal (see `BaseComponent.get_signature`).  :class:`ComponentRegistry`
+reads those literals with :mod:`ast`, so listing the available blocks and
+their hyper-parameters never imports scikit-learn, xgboost or lightgbm.  A
+block class is imported only when it is first requested through
+:meth:`ComponentRegistry.load` / :meth:`ComponentRegistry.create`.
+
+The index is cached as JSON next to this file (``.registry_index.json``)
+together with the size and modification time of every indexed source file;
+only files whose stamp changed are parsed again, so a warm lookup costs one
+``stat`` per module.
+"""
+from __future__ import annotations
+
+import ast
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+import importlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, Dict, List, Mapping
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS_DIR = Path(__file__).resolve().parent
+DEFAULT_CACHE_PATH = COMPONENTS_DIR / ".registry_index.json"
+# Bump when the cached entry layout changes.
+INDEX_VERSION = 1
+
+# Sub-package holding each kind of block.
+KIND_DIRS = {"model": "models", "preprocessor": "preprocessors"}
+
+
+@dataclass
+class ComponentSpec:
+    """Static description of one block module."""
+
+    name: str
+    kind: str
+    module: str
+    class_name: str
+    signature: Dict[str, Any] = field(default_factory=dict)
+    # ``False`` when ``signature`` is not a literal and needs the class loaded.
+    static: bool = True
+    category: str | None = None
+
+    @property
+    def hyperparameters(self) -> Dict[str, Any]:
+        return dict(self.signature.get("hyperparameters", {}))
+
+
+def _declared_signature(node: ast.ClassDef) -> tuple[bool, Dict[str, Any]] | None:
+    """``(is_literal, signature)`` of a class-level ``signature =``, else ``None``."""
+    for stmt in node.body:
+        if isinstance(stmt, ast.Assign):
+            targets, value = stmt.targets, stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            targets, value = [stmt.target], stmt.value
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "signature" for t in targets):
+            try:
+                return True, dict(ast.literal_eval(value))
+            except (ValueError, TypeError, SyntaxError):
+                return False, {}
+    return None
+
+
+def parse_module(path: Path, *, kind: str, root: Path = COMPONENTS_DIR) -> ComponentSpec | None:
+    """Spec of the block class defined in *path*, or ``None`` if it has none.
+
+    The block is the first class that declares a ``signature``; failing
+    that, the first class whose name ends in ``Block``.
+    """
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    classes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    chosen, static, signature = None, False, {}
+    for node in classes:
+        declared = _declared_signature(node)
+        if declared is not None:
+            chosen, (static, signature) = node, declared
+            break
+    if chosen is None:
+        chosen = next((node for node in classes if node.name.endswith("Block")), None)
+        if chosen is None:
+            return None
+
+    relative = path.relative_to(root.parent).with_suffix("")
+    sub_dir = path.parent.relative_to(root / KIND_DIRS[kind])
+    return ComponentSpec(
+        name=path.stem,
+        kind=kind,
+        module=".".join(relative.parts),
+        class_name=chosen.name,
+        signature=signature,
+        static=static,
+        category=sub_dir.parts[0] if sub_dir.parts else None,
+    )
+
+
+class ComponentRegistry:
+    """Lazily loaded, disk-cached index of the component blocks.
+
+    Parameters
+    ----------
+    root : Path
+        The ``components`` package directory.
+    cache_path : Path | None
+        JSON index cache; ``None`` keeps the index in memory only.
+    """
+
+    def __init__(self, root: Path = COMPONENTS_DIR, cache_path: Path | None = DEFAULT_CACHE_PATH):
+        self.root = Path(root)
+        self.cache_path = None if cache_path is None else Path(cache_path)
+        self._specs: Dict[str, ComponentSpec] | None = None
+        self._classes: Dict[str, type] = {}
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+    @property
+    def specs(self) -> Dict[str, ComponentSpec]:
+        """All indexed blocks by name (module file stem)."""
+        if self._specs is None:
+            self._specs = self._build_index()
+        return self._specs
+
+    def names(self, kind: str | None = None) -> List[str]:
+        """Sorted block names, optionally only those of one *kind*."""
+        return sorted(name for name, spec in self.specs.items() if kind is None or spec.kind == kind)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.specs
+
+    def get(self, name: str) -> ComponentSpec:
+        try:
+            return self.specs[name]
+        except KeyError:
+            raise KeyError(f"Unknown component {name!r}; available: {', '.join(self.names())}") from None
+
+    def signature(self, name: str) -> Dict[str, Any]:
+        """The block's ``get_signature()``; imports it only if not declared literally."""
+        spec = self.get(name)
+        if spec.static:
+            return dict(spec.signature)
+        return self.load(name).get_signature()
+
+    def search_space(self, kind: str, names: List[str] | None = None) -> Dict[str, Dict[str, Any]]:
+        """Hyper-parameter declarations of the blocks of one *kind*."""
+        selected = self.names(kind) if names is None else [n for n in names if self.get(n).kind == kind]
+        return {name: dict(self.signature(name).get("hyperparameters", {})) for name in selected}
+
+    # ------------------------------------------------------------------
+    # Lazy loading
+    # ------------------------------------------------------------------
+    def load(self, name: str) -> type:
+        """Import and return the block class (once per registry)."""
+        if name not in self._classes:
+            spec = self.get(name)
+            module = importlib.import_module(spec.module)
+            self._classes[name] = getattr(module, spec.class_name)
+        return self._classes[name]
+
+    def create(self, name: str, **params: Any) -> Any:
+        """Instantiate the block *name* with *params*."""
+        return self.load(name)(**params)
+
+    # ------------------------------------------------------------------
+    def _module_files(self) -> Dict[str, tuple[str, Path]]:
+        files: Dict[str, tuple[str, Path]] = {}
+        for kind, sub_dir in KIND_DIRS.items():
+            for path in sorted((self.root / sub_dir).rglob("*.py")):
+                if path.stem != "__init__":
+                    files[str(path.relative_to(self.root))] = (kind, path)
+        return files
+
+    def _build_index(self) -> Dict[str, ComponentSpec]:
+        cached = self._read_cache()
+        entries: Dict[str, Any] = {}
+        changed = False
+        for key, (kind, path) in self._module_files().items():
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            hit = cached.get(key)
+            if hit is not None and hit["stamp"] == stamp:
+                entries[key] = hit
+                continue
+            spec = parse_module(path, kind=kind, root=self.root)
+            entries[key] = {"stamp": stamp, "spec": None if spec is None else asdict(spec)}
+            changed = True
+        if changed or entries.keys() != cached.keys():
+            self._write_cache(entries)
+
+        specs: Dict[str, ComponentSpec] = {}
+        for key, entry in entries.items():
+            if entry["spec"] is None:
+                continue
+            spec = ComponentSpec(**entry["spec"])
+            if spec.name in specs:
+                logger.warning("Component %r defined twice; keeping %s", spec.name, specs[spec.name].module)
+                continue
+            specs[spec.name] = spec
+        return specs
+
+    def _read_cache(self) -> Mapping[str, Any]:
+        if self.cache_path is None:
+            return {}
+        try:
+            payload = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if payload.get("version") != INDEX_VERSION or payload.get("root") != str(self.root):
+            return {}
+        return payload.get("entries", {})
+
+    def _write_cache(self, entries: Mapping[str, Any]) -> None:
+        if self.cache_path is None:
+            return
+        payload = {"version": INDEX_VERSION, "root": str(self.root), "entries": entries}
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, prefix=".registry-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(payload, f, indent=1, sort_keys=True)
+                os.replace(tmp, self.cache_path)
+            finally:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+        except OSError as exc:  # read-only checkout: keep the in-memory index
+            logger.debug("Could not write component index %s: %s", self.cache_path, exc)
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> ComponentRegistry:
+    """Process-wide registry of the blocks in this package."""
+    return ComponentRegistry()
+
+
+__all__ = ["ComponentRegistry", "ComponentSpec", "get_registry", "parse_module"]
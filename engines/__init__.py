@@ -3,22 +3,152 @@
 This package exposes utilities to discover and import whichever AutoML
 engine wrappers are actually available in the runtime environment.  The
 wrappers themselves live alongside this module (e.g. ``auto_sklearn_wrapper.py``).
+
+Importing a wrapper pulls in scikit-learn and, inside ``fit``, the AutoML
+library itself, so discovery works from a static registry of
+:class:`EngineSpec` metadata instead.  A wrapper module is imported only when
+:func:`load_engine_class` is called for it – in practice inside the worker
+process that runs that engine.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+import hashlib
 import importlib
+import importlib.metadata
+import importlib.util
+from pathlib import Path
+import time
 from types import ModuleType
-from typing import Dict, List
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+
+@dataclass(frozen=True)
+class EngineSpec:
+    """Static description of an engine wrapper; creating one imports nothing."""
+
+    name: str  # wrapper module basename, also the key used for results
+    alias: str  # CLI flag, e.g. ``--tpot``
+    class_name: str
+    library: str  # top-level module of the underlying AutoML library
+    distribution: str  # package name the library is installed under
+    default: bool = True  # part of "every engine" (``--all``, ``engine_specs(None)``)
+
+    @property
+    def module(self) -> str:
+        return f"{__name__}.{self.name}"
+
+    def library_installed(self) -> bool:
+        """Whether the AutoML library can be imported (checked without importing it)."""
+        return importlib.util.find_spec(self.library) is not None
+
+    def version(self) -> str:
+        """``<library version>+<wrapper digest>``, read without importing either.
+
+        The wrapper digest changes whenever the wrapper source does, since the
+        wrapper decides search settings (and fallbacks) as much as the library.
+        """
+        try:
+            library_version = importlib.metadata.version(self.distribution)
+        except importlib.metadata.PackageNotFoundError:
+            library_version = "not-installed"
+        source = Path(__file__).with_name(f"{self.name}.py")
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()[:12] if source.exists() else "unknown"
+        return f"{library_version}+{digest}"
+
 
 # ---------------------------------------------------------------------------
 # The *canonical* order we will attempt to use the engines.  Earlier entries
 # get first dibs at the allocated wall-clock budget.
 # ---------------------------------------------------------------------------
-_ENGINE_ORDER: List[str] = [
-    "auto_sklearn_wrapper",
-    "tpot_wrapper",
-    "autogluon_wrapper",
-]
+ENGINE_REGISTRY: Dict[str, EngineSpec] = {
+    spec.name: spec
+    for spec in (
+        EngineSpec("auto_sklearn_wrapper", "autosklearn", "AutoSklearnEngine", "autosklearn", "auto-sklearn"),
+        EngineSpec("tpot_wrapper", "tpot", "TPOTEngine", "tpot", "tpot"),
+        EngineSpec("autogluon_wrapper", "autogluon", "AutoGluonEngine", "autogluon", "autogluon.tabular"),
+        # Searches the components/ blocks itself; opt-in until it has a track record.
+        EngineSpec("native_wrapper", "native", "NativeEngine", "sklearn", "scikit-learn", default=False),
+    )
+}
+_ENGINE_ORDER: List[str] = list(ENGINE_REGISTRY)
+
+# Seconds spent importing each wrapper module, for ``--profile-startup``.
+IMPORT_SECONDS: Dict[str, float] = {}
+
+
+def get_spec(name: str) -> EngineSpec:
+    """Look up an engine by wrapper name (``tpot_wrapper``) or alias (``tpot``)."""
+    if name in ENGINE_REGISTRY:
+        return ENGINE_REGISTRY[name]
+    for spec in ENGINE_REGISTRY.values():
+        if spec.alias == name:
+            return spec
+    raise ValueError(f"Unknown AutoML engine: {name}")
+
+
+def engine_specs(names: Iterable[str] | None = None) -> Dict[str, EngineSpec]:
+    """Return ``{engine_name: spec}`` in canonical order without importing anything.
+
+    ``names`` (wrapper names or aliases) restricts the result to those engines;
+    without it, only the default engines (``EngineSpec.default``) are returned.
+    """
+    if names is None:
+        return {name: spec for name, spec in ENGINE_REGISTRY.items() if spec.default}
+    wanted = {get_spec(n).name for n in names}
+    return {name: spec for name, spec in ENGINE_REGISTRY.items() if name in wanted}
+
+
+@dataclass(frozen=True)
+class EngineSelection:
+    """The engines a run should use, with optional per-engine overrides.
+
+    ``names`` are wrapper names in canonical order.  ``time_budgets`` (seconds,
+    search plus CV) and ``cpu_weights`` (relative core shares) only need
+    entries for engines that deviate from the run-wide defaults.
+    """
+
+    names: Tuple[str, ...]
+    time_budgets: Dict[str, float] = field(default_factory=dict)
+    cpu_weights: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def resolve(
+        cls,
+        include: Iterable[str] | None = None,
+        *,
+        time_budgets: Mapping[str, float] | None = None,
+        cpu_weights: Mapping[str, float] | None = None,
+    ) -> "EngineSelection":
+        """Build a selection from wrapper names or aliases (``None`` = every default engine).
+
+        Raises ``ValueError`` for unknown engines, for overrides naming an
+        engine that is not selected and for non-positive values.
+        """
+        names = tuple(engine_specs(include))
+
+        def _by_name(values: Mapping[str, float] | None, what: str) -> Dict[str, float]:
+            out: Dict[str, float] = {}
+            for key, value in (values or {}).items():
+                name = get_spec(key).name
+                if name not in names:
+                    raise ValueError(f"{what} given for {key!r}, which is not a selected engine.")
+                if float(value) <= 0:
+                    raise ValueError(f"{what} for {key!r} must be positive, got {value}.")
+                out[name] = float(value)
+            return out
+
+        return cls(
+            names=names,
+            time_budgets=_by_name(time_budgets, "Time budget"),
+            cpu_weights=_by_name(cpu_weights, "CPU weight"),
+        )
+
+    def specs(self) -> Dict[str, EngineSpec]:
+        return engine_specs(self.names)
+
+    def time_budget(self, name: str, default: float) -> float:
+        return self.time_budgets.get(name, default)
 
 
 def _import_wrapper(module_basename: str) -> ModuleType:
@@ -27,17 +157,38 @@ def _import_wrapper(module_basename: str) -> ModuleType:
     This routine now fails fast if the wrapper cannot be imported so that
     missing dependencies are surfaced immediately.
     """
-    return importlib.import_module(f"{__name__}.{module_basename}")
+    start = time.perf_counter()
+    module = importlib.import_module(f"{__name__}.{module_basename}")
+    IMPORT_SECONDS.setdefault(module_basename, time.perf_counter() - start)
+    return module
 
 
-def discover_available() -> Dict[str, ModuleType]:
+def load_engine_class(name: str) -> type:
+    """Import the wrapper for *name* on first use and return its engine class."""
+    spec = get_spec(name)
+    return getattr(_import_wrapper(spec.name), spec.class_name)
+
+
+def discover_available(names: Iterable[str] | None = None) -> Dict[str, ModuleType]:
     """Return a mapping of ``{engine_name: wrapper_module}`` for those wrappers
     that can be successfully imported on *this* machine.
+
+    This imports every requested wrapper; prefer :func:`engine_specs` plus
+    :func:`load_engine_class` when only metadata is needed up front.
     """
     available: Dict[str, ModuleType] = {}
-    for mod in _ENGINE_ORDER:
+    for mod in engine_specs(names):
         wrapper = _import_wrapper(mod)
         available[mod] = wrapper
     return available
 
-__all__ = ["discover_available"] 
+__all__ = [
+    "ENGINE_REGISTRY",
+    "EngineSelection",
+    "EngineSpec",
+    "IMPORT_SECONDS",
+    "discover_available",
+    "engine_specs",
+    "get_spec",
+    "load_engine_class",
+]
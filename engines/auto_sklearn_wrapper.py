@@ -10,35 +10,17 @@ from rich.tree import Tree
 from sklearn.base import BaseEstimator
 
 from components.base import BaseEngine
+from components.registry import get_registry
 
 console = Console(highlight=False)
 logger = logging.getLogger(__name__)
 
 # --- Configuration for AutoSklearnEngine ---
-_MODEL_SPACE = {
-    "Ridge": {}, # Default hyperparameters, will be overridden by Auto-Sklearn's search
-    "Lasso": {},
-    "ElasticNet": {},
-    "SVR": {},
-    "DecisionTree": {},
-    "RandomForest": {},
-    "ExtraTrees": {},
-    "GradientBoosting": {},
-    "AdaBoost": {},
-    "MLP": {},
-    "XGBoost": {},
-    "LightGBM": {},
-}
+# Component names come from the registry (components/registry.py); each entry
+# starts from the engine's own default hyper-parameters.
+_MODEL_SPACE = {name: {} for name in get_registry().names("model")}
 
-_PREPROCESSOR_SPACE = {
-    "PCA": {},
-    "RobustScaler": {},
-    "StandardScaler": {},
-    "QuantileTransform": {},
-    "KMeansOutlier": {},
-    "IsolationForest": {},
-    "LocalOutlierFactor": {},
-}
+_PREPROCESSOR_SPACE = {name: {} for name in get_registry().names("preprocessor")}
 
 DEFAULT_METRIC = "r2"
 
@@ -147,7 +129,7 @@ class AutoSklearnEngine(BaseEngine):
 
             self._automl = AutoSklearnRegressor(
                 time_left_for_this_task=self.timeout_sec,
-                per_run_time_limit=max(30, self.timeout_sec // 16),
+                per_run_time_limit=min(self.timeout_sec, max(30, self.timeout_sec // 16)),
                 include_estimators=include_estimators,
                 include_preprocessors=include_preprocessors,
                 resampling_strategy="holdout",
@@ -12,6 +12,7 @@ from rich.tree import Tree
 from sklearn.base import BaseEstimator, RegressorMixin
 
 from components.base import BaseEngine
+from components.registry import get_registry
 
 console = Console(highlight=False)
 logger = logging.getLogger(__name__)
@@ -56,21 +57,8 @@ logger = logging.getLogger(__name__)
 class AutoGluonEngine(BaseEngine):
     """AutoGluon adapter conforming to the orchestrator's API."""
 
-    _MODEL_SPACE = {
-        "Ridge": {}, # Default hyperparameters, will be overridden by AutoGluon's search
-        "RPOP": {},
-        "Lasso": {},
-        "ElasticNet": {},
-        "SVR": {},
-        "DecisionTree": {},
-        "RandomForest": {},
-        "ExtraTrees": {},
-        "GradientBoosting": {},
-        "AdaBoost": {},
-        "MLP": {},
-        "XGBoost": {},
-        "LightGBM": {},
-    }
+    # Model names from the component registry (components/registry.py).
+    _MODEL_SPACE = {name: {} for name in get_registry().names("model")}
 
     _AUTOGLUON_MODEL_MAP = {
         "Ridge": "LR",
@@ -0,0 +1,522 @@
+"""native_wrapper – in-process search over the ``components/`` blocks.
+
+Unlike the other wrappers this engine does not delegate to an AutoML
+library: it samples pipelines directly from the component registry
+(``[scaler] -> [outlier filter] -> [dimensionality] -> model``) and ranks them
+with successive halving.  Every bracket starts many candidates on a small,
+random subsample of the training rows, scores them on a fixed holdout, and
+promotes the best ``1/eta`` to a subsample ``eta`` times larger, until the
+survivors are trained on every row.  Brackets repeat with fresh candidates
+until the time budget is spent, less a reserve for refitting the champion on
+every row.  The reserve is extrapolated from the measured fit times (see
+:meth:`NativeEngine.refit_reserve`), and evaluations still running when the
+search stops are abandoned rather than waited for.
+
+With more than one CPU the candidates of a rung are evaluated in a spawn
+process pool.  The training data is copied once into shared memory
+(:class:`scripts.shared_data.SharedDataset`); the workers attach to it
+read-only instead of unpickling their own copy for every task.
+
+The champion is a :class:`components.pipeline.SampleMaskPipeline` refitted
+on all rows, so the orchestrator can clone and cross-validate it like any
+other scikit-learn estimator.
+"""
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import logging
+import math
+import multiprocessing as mp
+from pathlib import Path
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator
+
+from components.base import BaseEngine
+from components.registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRIC = "r2"
+# Margin on the extrapolated refit time reserved at the end of the budget.
+REFIT_SAFETY = 1.5
+# Cap on the reserve (share of the budget) until a full-pool fit is measured.
+EARLY_RESERVE_FRACTION = 0.15
+# Training pools too small for several rungs of ``min_rows`` still get up to
+# this many rungs, as long as the first one keeps ``MIN_RUNG_ROWS`` rows.
+MIN_RUNGS = 3
+MIN_RUNG_ROWS = 32
+
+# Optional pipeline stages, in the order they are applied; each stage draws
+# one block of that preprocessor category (or none).
+STAGES = ("scalers", "outliers", "dimensionality")
+
+# Sampling priors keyed by (hyper-parameter name, declared type) from the block
+# signatures.  Hyper-parameters without a prior keep the block's default.
+#   ("log", low, high)    log-uniform float
+#   ("float", low, high)  uniform float
+#   ("int", low, high)    uniform integer, inclusive
+#   ("choice", options)   one of the options
+_PRIORS: Dict[Tuple[str, str], tuple] = {
+    ("alpha", "float"): ("log", 1e-4, 10.0),
+    ("l1_ratio", "float"): ("float", 0.05, 0.95),
+    ("learning_rate", "float"): ("log", 0.01, 0.3),
+    ("n_estimators", "int"): ("choice", (50, 100, 200)),
+    ("max_depth", "int"): ("int", 2, 10),
+    ("max_depth", "int_or_none"): ("choice", (None, 4, 8, 16)),
+    ("min_samples_split", "int"): ("int", 2, 20),
+    ("max_features", "str"): ("choice", ("sqrt", "log2", 1.0)),
+    ("num_leaves", "int"): ("int", 15, 127),
+    ("subsample", "float"): ("float", 0.6, 1.0),
+    ("n_neighbors", "int"): ("int", 3, 30),
+    ("weights", "str"): ("choice", ("uniform", "distance")),
+    ("C", "float"): ("log", 0.1, 100.0),
+    ("kernel", "str"): ("choice", ("rbf", "linear")),
+    ("gamma", "str"): ("choice", ("scale", "auto")),
+    ("hidden_layer_sizes", "tuple"): ("choice", ((64,), (128,), (64, 32))),
+    ("activation", "str"): ("choice", ("relu", "tanh")),
+    ("contamination", "float"): ("float", 0.01, 0.1),
+}
+
+# A candidate is a JSON-able list of ``(block name, params)`` steps, the model last.
+Candidate = List[Tuple[str, Dict[str, Any]]]
+
+
+def _draw(prior: tuple, rng: np.random.Generator) -> Any:
+    kind = prior[0]
+    if kind == "log":
+        return float(math.exp(rng.uniform(math.log(prior[1]), math.log(prior[2]))))
+    if kind == "float":
+        return float(rng.uniform(prior[1], prior[2]))
+    if kind == "int":
+        return int(rng.integers(prior[1], prior[2] + 1))
+    options = prior[1]
+    return options[int(rng.integers(len(options)))]
+
+
+def sample_params(hyperparameters: Dict[str, str], rng: np.random.Generator) -> Dict[str, Any]:
+    """Draw a value for every declared hyper-parameter that has a prior."""
+    return {
+        name: _draw(_PRIORS[(name, kind)], rng)
+        for name, kind in sorted(hyperparameters.items())
+        if (name, kind) in _PRIORS
+    }
+
+
+def build_pipeline(candidate: Candidate) -> Any:
+    """Instantiate *candidate* as a ``SampleMaskPipeline`` of registry blocks."""
+    from components.pipeline import SampleMaskPipeline
+
+    registry = get_registry()
+    return SampleMaskPipeline([(name, registry.create(name, **params)) for name, params in candidate])
+
+
+def describe(candidate: Candidate) -> str:
+    return " -> ".join(
+        f"{name}({', '.join(f'{k}={v!r}' for k, v in params.items())})" for name, params in candidate
+    )
+
+
+# ---------------------------------------------------------------------------
+# Candidate evaluation (runs in the pool workers or in-process)
+# ---------------------------------------------------------------------------
+_WORKER_DATA: Dict[str, Any] = {}
+
+
+def _attach_worker(handle: Any) -> None:
+    """Pool initializer: map the parent's shared-memory dataset read-only."""
+    from scripts.shared_data import SharedDataset
+
+    data = SharedDataset.attach(handle)
+    _WORKER_DATA.update(dataset=data, X=data.X, y=data.y)
+
+
+def _evaluate(candidate: Candidate, train_rows: np.ndarray, holdout_rows: np.ndarray, metric: str) -> Dict[str, Any]:
+    """Fit *candidate* on *train_rows* and score it on *holdout_rows* (single-threaded)."""
+    from threadpoolctl import threadpool_limits
+
+    from scripts.cross_validation import limit_estimator_threads
+    from scripts.scoring import regression_metrics
+
+    X, y = _WORKER_DATA["X"], _WORKER_DATA["y"]
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        # Small rungs trip size warnings (e.g. n_quantiles > n_samples) by design.
+        with threadpool_limits(limits=1), warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            model = limit_estimator_threads(build_pipeline(candidate), 1)
+            model.fit(X.iloc[train_rows], y.iloc[train_rows])
+            predictions = model.predict(X.iloc[holdout_rows])
+        score = regression_metrics(y.iloc[holdout_rows], predictions, (metric,))[metric]
+        error = None if np.isfinite(score) else "non-finite score"
+    except Exception as exc:  # noqa: BLE001 – a failing candidate is just discarded
+        score, error = float("nan"), f"{type(exc).__name__}: {exc}"
+    return {"score": float(score), "seconds": time.perf_counter() - start, "started": started, "error": error}
+
+
+def _stop_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut *pool* down without waiting for evaluations that are still running."""
+    # Worker processes cannot be interrupted through the executor API
+    # (``terminate_workers`` arrives in Python 3.14), and ``shutdown`` drops
+    # the executor's reference to them, so collect them first.
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+class NativeEngine(BaseEngine):
+    """Successive-halving search over pipelines built from the component blocks.
+
+    Parameters
+    ----------
+    seed, timeout_sec, run_dir, metric, n_cpus
+        As for the other engine wrappers.
+    eta : int
+        Halving rate: each rung keeps ``1/eta`` of its candidates and gives the
+        survivors ``eta`` times more training rows.
+    min_rows : int
+        Training rows of the first rung (the bracket has as many rungs as
+        fit between ``min_rows`` and the full training set; see
+        :meth:`rung_sizes` for small training sets).
+    max_candidates : int
+        Upper bound on the candidates started per bracket.  A bracket starts
+        ``eta**(rungs - 1)`` candidates, but at least ``n_cpus`` so that the
+        process pool has work for every worker.
+    holdout_fraction : float
+        Share of the rows held out to score every rung.
+    """
+
+    # Component names come from the registry (components/registry.py).
+    _MODEL_SPACE = {name: {} for name in get_registry().names("model")}
+    _PREPROCESSOR_SPACE = {name: {} for name in get_registry().names("preprocessor")}
+
+    def __init__(
+        self,
+        seed: int,
+        timeout_sec: int,
+        run_dir: Path,
+        metric: str = DEFAULT_METRIC,
+        n_cpus: int = 1,
+        *,
+        eta: int = 3,
+        min_rows: int = 256,
+        max_candidates: int = 27,
+        holdout_fraction: float = 0.2,
+    ):
+        from scripts.scoring import METRICS
+
+        if metric not in METRICS:
+            raise ValueError(f"Unsupported metric {metric!r} for NativeEngine. Choose from {sorted(METRICS)}.")
+        if eta < 2:
+            raise ValueError(f"eta must be at least 2, got {eta}.")
+        self.seed = seed
+        self.timeout_sec = timeout_sec
+        self.run_dir = Path(run_dir)
+        self.n_cpus = max(1, int(n_cpus))
+        self.eta = eta
+        self.min_rows = min_rows
+        self.max_candidates = max_candidates
+        self.holdout_fraction = holdout_fraction
+        self._metric = metric
+        self._model: Any = None
+        self._best: Dict[str, Any] | None = None
+        self.history_: List[Dict[str, Any]] = []
+        self.brackets_ = 0
+        self._end = math.inf
+        self._n_rows = self._full_rows = 0
+
+    @property
+    def name(self) -> str:
+        return "NativeEngine"
+
+    @property
+    def best_pipeline_info(self) -> dict:
+        if self._best is None:
+            return {"status": "not_fitted"}
+        return {
+            "score": self._best["score"],
+            "metric": self._metric,
+            "pipeline_description": describe(self._best["candidate"]),
+            "evaluated_pipelines": len({record["candidate_id"] for record in self.history_}),
+            "evaluations": len(self.history_),
+            "brackets": self.brackets_,
+        }
+
+    @property
+    def run_info(self) -> dict:
+        if self._best is None:
+            return {"status": "not_fitted"}
+        return {
+            "best_score": self._best["score"],
+            "run_dir": str(self.run_dir),
+            "log": str(self.run_dir.parent / "logs" / f"{self.name}.log"),
+            "artefact_paths": {
+                "pipeline_pkl": str(self.run_dir / "native_pipeline.pkl"),
+                "evaluation_json": str(self.run_dir / "evaluation.json"),
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # Search space
+    # ------------------------------------------------------------------
+    def _usable(self, names: Sequence[str]) -> List[str]:
+        """Blocks among *names* whose libraries import on this machine."""
+        registry = get_registry()
+        usable = []
+        for name in names:
+            try:
+                # Blocks import their library in ``__init__``, not at module level.
+                registry.create(name)
+            except ImportError as exc:
+                logger.info("[%s] skipping %s: %s", self.name, name, exc)
+                continue
+            usable.append(name)
+        return usable
+
+    def _sample_candidate(self, models: Sequence[str], stages: Dict[str, List[str]], rng: np.random.Generator) -> Candidate:
+        registry = get_registry()
+        candidate: Candidate = []
+        for stage in STAGES:
+            options = stages.get(stage, [])
+            # Each stage is skipped as often as any single block is chosen.
+            pick = int(rng.integers(len(options) + 1))
+            if pick < len(options):
+                name = options[pick]
+                candidate.append((name, sample_params(registry.signature(name).get("hyperparameters", {}), rng)))
+        model = models[int(rng.integers(len(models)))]
+        candidate.append((model, sample_params(registry.signature(model).get("hyperparameters", {}), rng)))
+        return candidate
+
+    def rung_sizes(self, n_train: int) -> List[int]:
+        """Training rows used by each rung of a bracket, smallest first.
+
+        Rungs are added while the first stays at ``min_rows`` or above.  A
+        training set too small for that still gets up to ``MIN_RUNGS``
+        rungs (first rung of at least ``MIN_RUNG_ROWS`` rows), so it is
+        halved rather than searched one full-size candidate at a time.
+        """
+        n_rungs = 1
+        while n_rungs < 1 + math.log(self.max_candidates, self.eta):
+            first = n_train / self.eta ** n_rungs
+            if first < self.min_rows and (n_rungs >= MIN_RUNGS or first < MIN_RUNG_ROWS):
+                break
+            n_rungs += 1
+        return [max(1, int(n_train / self.eta ** (n_rungs - 1 - i))) for i in range(n_rungs)]
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    def fit(self, X: pd.DataFrame, y: pd.Series, **kwargs) -> BaseEstimator:
+        from scripts.shared_data import SharedDataset
+
+        start = time.perf_counter()
+        self._end = start + float(self.timeout_sec)
+        self._metric = kwargs.get("metric", self._metric)
+        models = self._usable(list(kwargs.get("model_families", self._MODEL_SPACE)))
+        if not models:
+            raise RuntimeError(f"[{self.name}] none of the requested model blocks can be imported.")
+        registry = get_registry()
+        prep_steps = self._usable(list(kwargs.get("prep_steps", self._PREPROCESSOR_SPACE)))
+        stages: Dict[str, List[str]] = {}
+        for name in prep_steps:
+            stages.setdefault(registry.get(name).category, []).append(name)
+
+        rng = np.random.default_rng(self.seed)
+        n_rows = self._n_rows = len(X)
+        order = rng.permutation(n_rows)
+        n_holdout = max(1, int(round(self.holdout_fraction * n_rows)))
+        holdout_rows, train_pool = np.sort(order[:n_holdout]), order[n_holdout:]
+        sizes = self.rung_sizes(len(train_pool))
+        self._full_rows = sizes[-1]
+        n_start = min(self.max_candidates, max(self.n_cpus, self.eta ** (len(sizes) - 1)))
+        logger.info(
+            "[%s] search-start: %d model(s), %d preprocessor(s); rungs of %s rows, %d candidates per bracket, %d CPU(s)",
+            self.name, len(models), len(prep_steps), sizes, n_start, self.n_cpus,
+        )
+
+        self.history_ = []
+        self.brackets_ = 0
+        pool, shared = None, None
+        if self.n_cpus > 1:
+            shared = SharedDataset.from_frame(X, y)
+            pool = ProcessPoolExecutor(
+                max_workers=self.n_cpus,
+                mp_context=mp.get_context("spawn"),
+                initializer=_attach_worker,
+                initargs=(shared.handle,),
+            )
+        else:
+            _WORKER_DATA.update(X=X, y=y)
+        try:
+            next_id = 0
+            while time.perf_counter() < self._search_deadline():
+                survivors = []
+                for _ in range(n_start):
+                    survivors.append((next_id, self._sample_candidate(models, stages, rng)))
+                    next_id += 1
+                for rung, size in enumerate(sizes):
+                    # Rungs train on nested prefixes of one shuffled row order.
+                    train_rows = np.sort(train_pool[:size])
+                    scored = self._run_rung(survivors, rung, train_rows, holdout_rows, pool)
+                    if rung == len(sizes) - 1 or time.perf_counter() >= self._search_deadline():
+                        break
+                    keep = max(1, len(survivors) // self.eta)
+                    survivors = [item for item, _ in scored[:keep]]
+                self.brackets_ += 1
+        finally:
+            if pool is not None:
+                _stop_pool(pool)
+            if shared is not None:
+                shared.close()
+            _WORKER_DATA.clear()
+
+        self._best = self._select_best()
+        if self._best is None:
+            raise RuntimeError(f"[{self.name}] no candidate pipeline could be evaluated within {self.timeout_sec}s.")
+        logger.info(
+            "[%s] best %s=%.4f on %d rows after %d evaluations in %d bracket(s): %s",
+            self.name, self._metric, self._best["score"], self._best["rows"], len(self.history_),
+            self.brackets_, describe(self._best["candidate"]),
+        )
+        self._model = build_pipeline(self._best["candidate"]).fit(X, y)
+        logger.info(
+            "[%s] search-end (%.1fs of %ss, %.1fs reserved for the refit)",
+            self.name, time.perf_counter() - start, self.timeout_sec, self.refit_reserve(),
+        )
+        return self._model
+
+    def refit_reserve(self) -> float:
+        """Seconds kept back at the end of the budget to refit the champion on every row.
+
+        Fit times are extrapolated linearly in rows to the full data, with a
+        ``REFIT_SAFETY`` margin.  Once candidates have been scored on the
+        full training pool the estimate comes from the best of them, the
+        pipeline that will be refitted.  Before that it comes from the
+        slowest fit on the largest rung so far, capped at
+        ``EARLY_RESERVE_FRACTION`` of the budget because small-rung times are
+        dominated by fixed overhead.
+        """
+        valid = [record for record in self.history_ if record["error"] is None]
+        if not valid:
+            return 0.0
+        most_rows = max(record["rows"] for record in valid)
+        if most_rows >= self._full_rows:
+            basis = [self._select_best()]
+        else:
+            basis = [record for record in valid if record["rows"] == most_rows]
+        reserve = REFIT_SAFETY * max(record["seconds"] * self._n_rows / record["rows"] for record in basis)
+        if most_rows < self._full_rows:
+            reserve = min(reserve, EARLY_RESERVE_FRACTION * float(self.timeout_sec))
+        return reserve
+
+    def _search_deadline(self) -> float:
+        return self._end - self.refit_reserve()
+
+    def _run_rung(
+        self,
+        candidates: List[Tuple[int, Candidate]],
+        rung: int,
+        train_rows: np.ndarray,
+        holdout_rows: np.ndarray,
+        pool: ProcessPoolExecutor | None,
+    ) -> List[Tuple[Tuple[int, Candidate], float]]:
+        """Evaluate *candidates* on one rung; return ``(candidate, gain)`` pairs, best first.
+
+        No new evaluation starts once the search deadline has passed, and
+        pool evaluations still running then are dropped unscored.
+        """
+        from scripts.scoring import GREATER_IS_BETTER
+
+        results: List[Tuple[Tuple[int, Candidate], Dict[str, Any]]] = []
+        if pool is None:
+            for item in candidates:
+                if time.perf_counter() >= self._search_deadline():
+                    break
+                self._record(results, item, _evaluate(item[1], train_rows, holdout_rows, self._metric), rung, train_rows)
+        else:
+            queue = list(candidates)
+            running: Dict[Any, Tuple[int, Candidate]] = {}
+            while queue or running:
+                while queue and len(running) < self.n_cpus and time.perf_counter() < self._search_deadline():
+                    item = queue.pop(0)
+                    running[pool.submit(_evaluate, item[1], train_rows, holdout_rows, self._metric)] = item
+                remaining = self._search_deadline() - time.perf_counter()
+                if not running or remaining <= 0:
+                    break
+                done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._record(results, running.pop(future), future.result(), rung, train_rows)
+            if running:
+                logger.info("[%s] search deadline: dropping %d running evaluation(s)", self.name, len(running))
+
+        sign = 1.0 if self._metric in GREATER_IS_BETTER else -1.0
+        scored = [(item, sign * outcome["score"]) for item, outcome in results if outcome["error"] is None]
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        return scored
+
+    def _record(
+        self,
+        results: List[Tuple[Tuple[int, Candidate], Dict[str, Any]]],
+        item: Tuple[int, Candidate],
+        outcome: Dict[str, Any],
+        rung: int,
+        train_rows: np.ndarray,
+    ) -> None:
+        """Append an evaluation to *results* and to ``history_`` as soon as it finishes."""
+        candidate_id, candidate = item
+        results.append((item, outcome))
+        self.history_.append(
+            {"candidate_id": candidate_id, "bracket": self.brackets_, "rung": rung, "rows": int(train_rows.size),
+             "candidate": candidate, **outcome}
+        )
+        if outcome["error"] is not None:
+            logger.debug("[%s] candidate %d failed: %s", self.name, candidate_id, outcome["error"])
+
+    def _select_best(self) -> Dict[str, Any] | None:
+        """Best holdout score among the evaluations on the most rows."""
+        from scripts.scoring import GREATER_IS_BETTER
+
+        valid = [record for record in self.history_ if record["error"] is None]
+        if not valid:
+            return None
+        most_rows = max(record["rows"] for record in valid)
+        sign = 1.0 if self._metric in GREATER_IS_BETTER else -1.0
+        return max((r for r in valid if r["rows"] == most_rows), key=lambda r: sign * r["score"])
+
+    # ------------------------------------------------------------------
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        if self._model is None:
+            raise RuntimeError("Model not fitted. Call fit() first.")
+        return self._model.predict(X)
+
+    def export(self, path: Path):
+        if self._model is None:
+            raise RuntimeError("Model not fitted. Call fit() first.")
+        import joblib
+
+        path = Path(path)
+        pipeline_file = path / "native_pipeline.pkl"
+        joblib.dump(self._model, pipeline_file)
+        logger.info("[%s] Saved champion pipeline to %s", self.name, pipeline_file)
+
+        evaluation_data = {
+            **self.best_pipeline_info,
+            "pipeline": self._best["candidate"],
+            "history": [{k: v for k, v in record.items() if k != "candidate"} for record in self.history_],
+        }
+        evaluation_file = path / "evaluation.json"
+        with open(evaluation_file, "w") as f:
+            json.dump(evaluation_data, f, indent=4, default=str)
+        logger.info("[%s] Saved evaluation summary to %s", self.name, evaluation_file)
+
+
+__all__ = ["NativeEngine", "build_pipeline", "sample_params"]
@@ -13,36 +13,17 @@ from rich.tree import Tree
 from sklearn.base import BaseEstimator
 
 from components.base import BaseEngine
+from components.registry import get_registry
 
 console = Console(highlight=False)
 logger = logging.getLogger(__name__)
 
 # --- Configuration for TPOTEngine ---
-_MODEL_SPACE = {
-    "Ridge": {}, # Default hyperparameters, will be overridden by TPOT's search
-    "RPOP": {},
-    "Lasso": {},
-    "ElasticNet": {},
-    "SVR": {},
-    "DecisionTree": {},
-    "RandomForest": {},
-    "ExtraTrees": {},
-    "GradientBoosting": {},
-    "AdaBoost": {},
-    "MLP": {},
-    "XGBoost": {},
-    "LightGBM": {},
-}
+# Component names come from the registry (components/registry.py); each entry
+# starts from the engine's own default hyper-parameters.
+_MODEL_SPACE = {name: {} for name in get_registry().names("model")}
 
-_PREPROCESSOR_SPACE = {
-    "PCA": {},
-    "RobustScaler": {},
-    "StandardScaler": {},
-    "QuantileTransform": {},
-    "KMeansOutlier": {},
-    "IsolationForest": {},
-    "LocalOutlierFactor": {},
-}
+_PREPROCESSOR_SPACE = {name: {} for name in get_registry().names("preprocessor")}
 
 DEFAULT_METRIC = "r2"
 
@@ -158,7 +139,10 @@ class TPOTEngine(BaseEngine):
                 scoring=tpot_metric,
                 n_jobs=self.n_cpus,  # Prevent nested parallelism – orchestrator handles outer level
                 random_state=self.seed,
-                max_time_mins=max(1, self.timeout_sec // 60),
+                # TPOT accepts fractional minutes; rounding up to a whole
+                # minute let short budgets overrun by up to 60 seconds.
+                max_time_mins=self.timeout_sec / 60,
+                max_eval_time_mins=min(5, self.timeout_sec / 60),
                 verbosity=2,
             )
 
@@ -9,8 +9,10 @@ Only the orchestration logic lives here; engine-specific glue code resides in
 """
 from __future__ import annotations
 
-import logging
 import time
+_IMPORT_START = time.perf_counter()  # for --profile-startup
+
+import logging
 import os # Import os for environment variable checking
 import sys # Import sys for sys.exit
 from pathlib import Path
@@ -27,26 +29,14 @@ from rich.console import Console
 from rich.tree import Tree
 import subprocess # Added subprocess
 
-from scripts.data_loader import load_data  # Data loader helper
-from scripts.feature_engineering import engineer_features
-from engines import discover_available
-from engines.auto_sklearn_wrapper import AutoSklearnEngine
-from engines.tpot_wrapper import TPOTEngine
-from engines.autogluon_wrapper import AutoGluonEngine
-
+# Engine wrappers, scikit-learn and the data/feature helpers are imported
+# lazily where they are used: the CLI and every spawned engine worker import
+# this module, and neither should pay for libraries it does not need.
 import numpy as np
-from sklearn.pipeline import Pipeline
 import multiprocessing as _mp
 from multiprocessing.queues import Queue as _MPQueue
 
-# Scoring & CV utilities
-from sklearn.model_selection import RepeatedKFold, cross_validate
-from sklearn.metrics import (
-    make_scorer,
-    mean_absolute_error,
-    r2_score,
-    mean_squared_error,
-)
+from components.registry import get_registry
 
 # Define the project version
 __version__ = "0.1.0" # Added version attribute
@@ -57,23 +47,19 @@ __version__ = "0.1.0" # Added version attribute
 RANDOM_STATE = 42
 N_SPLITS_CROSS_VALIDATION = 5
 N_REPEATS_CROSS_VALIDATION = 3
+# joblib backend used to evaluate CV folds in parallel ("loky" or "threading").
+CV_BACKEND = "loky"
 
 # ---------------------------------------------------------------------------
 # Component Discovery
 # ---------------------------------------------------------------------------
-# Build lists of available model families and preprocessing steps by inspecting
-# the modules under ``components/models`` and ``components/preprocessors``.
-_MODELS_DIR = Path(__file__).parent / "components" / "models"
-_PREPROCESSORS_DIR = Path(__file__).parent / "components" / "preprocessors"
-
-# Names correspond to the module file stems without the ``.py`` extension.
-MODEL_FAMILIES = sorted(
-    p.stem for p in _MODELS_DIR.glob("*.py") if p.stem != "__init__"
-)
+# Model families and preprocessing steps come from the component registry,
+# which indexes the block modules under ``components/models`` and
+# ``components/preprocessors`` with ``ast`` (no heavy imports) and caches the
+# index on disk.  Names are the module file stems.
+MODEL_FAMILIES = get_registry().names("model")
 
-PREP_STEPS = sorted(
-    p.stem for p in _PREPROCESSORS_DIR.rglob("*.py") if p.stem != "__init__"
-)
+PREP_STEPS = get_registry().names("preprocessor")
 
 # Wallclock limit for each engine, in seconds. This is a default and can be overridden by CLI.
 WALLCLOCK_LIMIT_SEC = 3600  # 1 hour
@@ -91,30 +77,41 @@ if "AUTOML_VERBOSE" in os.environ:
 
 # Log to both stdout and a persistent log file
 log_file = Path(__file__).with_name("main.log")
-logging.basicConfig(
-    level=logging_level,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, mode="a"),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
 logger = logging.getLogger(__name__)
 
-# Optional Logstash integration for centralized logging
-if os.getenv("LOGSTASH_HOST"):
-    try:
-        from logstash_async.handler import AsynchronousLogstashHandler
-        from logstash_async.formatter import LogstashFormatter
-
-        ls_host = os.environ.get("LOGSTASH_HOST")
-        ls_port = int(os.environ.get("LOGSTASH_PORT", "5959"))
-        ls_handler = AsynchronousLogstashHandler(ls_host, ls_port, database_path=None)
-        ls_handler.setFormatter(LogstashFormatter())
-        logging.getLogger().addHandler(ls_handler)
-        logger.info("Logging to Logstash at %s:%s", ls_host, ls_port)
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("Could not configure Logstash handler: %s", exc)
+
+def _configure_logging() -> None:
+    """Attach the stdout/``main.log`` handlers and the optional Logstash handler.
+
+    Called from :func:`_cli` rather than at import time, so that spawned
+    engine workers (which import this module) neither re-open ``main.log``
+    nor start a Logstash connection of their own.  Scripts that import this
+    module and call its search helpers directly (e.g.
+    ``scripts/ensemble_experiment.py``) call it from their own entry point.
+    """
+    logging.basicConfig(
+        level=logging_level,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(log_file, mode="a"),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
+
+    # Optional Logstash integration for centralized logging
+    if os.getenv("LOGSTASH_HOST"):
+        try:
+            from logstash_async.handler import AsynchronousLogstashHandler
+            from logstash_async.formatter import LogstashFormatter
+
+            ls_host = os.environ.get("LOGSTASH_HOST")
+            ls_port = int(os.environ.get("LOGSTASH_PORT", "5959"))
+            ls_handler = AsynchronousLogstashHandler(ls_host, ls_port, database_path=None)
+            ls_handler.setFormatter(LogstashFormatter())
+            logging.getLogger().addHandler(ls_handler)
+            logger.info("Logging to Logstash at %s:%s", ls_host, ls_port)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not configure Logstash handler: %s", exc)
 
 # ---------------------------------------------------------------------------
 # Reproducibility – set global seeds immediately at import-time
@@ -135,6 +132,8 @@ def _extract_pipeline_info(model: Any) -> list[dict]:
     Extracts pipeline steps and hyperparameters from a fitted model object,
     handling different AutoML engine outputs.
     """
+    from sklearn.pipeline import Pipeline
+
     pipeline_info = []
     if hasattr(model, "show_models") and callable(model.show_models):
         # This path is for Auto-Sklearn
@@ -271,8 +270,108 @@ def _write_runtime_manifest(
 
 def _rmse(y_true, y_pred):
     """Root Mean Squared Error helper – always returns positive value."""
+    from sklearn.metrics import mean_squared_error
+
     return np.sqrt(mean_squared_error(y_true, y_pred))
 
+def _cross_validate_model(
+    model: Any,
+    X: pd.DataFrame,
+    y: pd.Series,
+    *,
+    name: str,
+    n_cpus: int,
+    log: logging.Logger,
+    metric: str = DEFAULT_METRIC,
+    run_dir: Path | str | None = None,
+) -> Dict[str, Any]:
+    """Score *model* with 5x3 repeated K-fold CV, running folds in parallel.
+
+    The folds share the engine's CPU budget: ``min(n_cpus, n_folds)`` run at a
+    time and each is limited to the remaining threads per fold (see
+    ``scripts.cross_validation``).  Each fold predicts once and derives R²,
+    RMSE, MAE and the requested *metric* from the same predictions.  With
+    *run_dir*, the out-of-fold predictions are cached under ``run_dir/oof/``
+    for ensemble selection.  Returns the mean/std metrics plus per-fold wall
+    times.
+    """
+    from sklearn.model_selection import RepeatedKFold
+    from scripts.cross_validation import parallel_cross_validate
+    from scripts.scoring import DEFAULT_METRICS, FusedScorer
+
+    rkf = RepeatedKFold(n_splits=N_SPLITS_CROSS_VALIDATION, n_repeats=N_REPEATS_CROSS_VALIDATION, random_state=RANDOM_STATE)
+    scoring = FusedScorer((*DEFAULT_METRICS, metric))
+    log.info(f"[Orchestrator|{name}] Starting {N_REPEATS_CROSS_VALIDATION}x{N_SPLITS_CROSS_VALIDATION} Repeated K-Fold Cross-Validation for {name}...")
+    cv_results = parallel_cross_validate(
+        model, X, y, cv=rkf, scoring=scoring, n_cpus=n_cpus, backend=CV_BACKEND,
+        return_predictions=run_dir is not None,
+    )
+    log.info(
+        f"[Orchestrator|{name}] Cross-Validation complete for {name} in {cv_results['wall_time']:.1f}s "
+        f"({cv_results['n_jobs']} parallel folds × {cv_results['threads_per_fold']} threads)."
+    )
+
+    # Process CV results (error metrics are already positive)
+    engine_metrics: Dict[str, Any] = {}
+    for metric_name in scoring.metrics:
+        scores = cv_results[f"test_{metric_name}"]
+        engine_metrics[f"{metric_name}_mean"] = np.mean(scores)
+        engine_metrics[f"{metric_name}_std"] = np.std(scores)
+
+    engine_metrics.update(
+        cv_wall_seconds=cv_results["wall_time"],
+        cv_parallel_folds=cv_results["n_jobs"],
+        cv_threads_per_fold=cv_results["threads_per_fold"],
+        fold_times=cv_results["fold_time"].tolist(),
+    )
+    if run_dir is not None:
+        engine_metrics["oof_path"] = str(_cache_oof_predictions(run_dir, name, cv_results["oof_predictions"]))
+    return engine_metrics
+
+def _cache_oof_predictions(run_dir: Path | str, name: str, predictions: np.ndarray) -> Path:
+    """Persist an engine's out-of-fold CV predictions under ``run_dir/oof/``."""
+    from scripts.oof_store import OOFStore
+
+    return OOFStore.for_run(run_dir).save(name, predictions)
+
+def _engine_cache_key(data_fingerprint: str, spec: Any, budget: Any, metric: str, cache_config: Dict[str, Any] | None) -> str:
+    """Run-cache key of one engine on the current training data."""
+    from scripts.run_cache import cache_key
+
+    config = {
+        **(cache_config or {}),
+        "metric": metric,
+        "seed": RANDOM_STATE,
+        "budget_seconds": budget.total_seconds,
+        "cv": [N_SPLITS_CROSS_VALIDATION, N_REPEATS_CROSS_VALIDATION],
+    }
+    return cache_key(data=data_fingerprint, engine=spec.name, engine_version=spec.version(), config=config)
+
+
+def _load_cached_engine(run_cache: Any, key: str, name: str, run_dir: Path) -> Tuple[Any, Dict[str, Any]] | None:
+    """Cached ``(model, metrics)`` of engine *name*, with its OOF predictions copied into *run_dir*."""
+    hit = run_cache.get(key)
+    if hit is None:
+        return None
+    metrics = {**hit.metrics, "status": "ok", "cached": True, "cache_key": key}
+    if hit.oof_predictions is not None:
+        metrics["oof_path"] = str(_cache_oof_predictions(run_dir, name, hit.oof_predictions))
+    logger.info("[Orchestrator|%s] Run cache hit (%s); skipping search and CV.", name, key)
+    return hit.model, metrics
+
+
+def _store_engine_result(run_cache: Any, key: str, name: str, model: Any, metrics: Dict[str, Any], run_dir: Path) -> None:
+    """Add a finished engine (model, metrics, OOF predictions) to the run cache."""
+    from scripts.oof_store import OOFStore
+
+    store = OOFStore.for_run(run_dir)
+    oof = store.load(name) if store.path(name).exists() else None
+    try:
+        run_cache.put(key, model, metrics, oof)
+    except Exception as exc:  # noqa: BLE001 – caching must never fail a run
+        logger.warning("[Orchestrator|%s] Could not write run cache entry: %s", name, exc)
+
+
 def _meta_search_sequential(
     X: pd.DataFrame,
     y: pd.Series,
@@ -282,8 +381,13 @@ def _meta_search_sequential(
     metric: str = DEFAULT_METRIC,
     enable_ensemble: bool = False,
     n_cpus: int,
+    global_timeout: float | None = None,
+    engine_names: Sequence[str] | None = None,
+    engine_budgets: Dict[str, float] | None = None,
+    run_cache: Any = None,
+    cache_config: Dict[str, Any] | None = None,
 ) -> Tuple[Any, Dict[str, Any], Dict[str, Dict[str, float]]]:
-    """Run each available AutoML engine sequentially and return the best model.
+    """Run each selected AutoML engine sequentially and return the best model.
 
     Parameters
     ----------
@@ -292,8 +396,8 @@ def _meta_search_sequential(
     run_dir
         Directory where all artifacts (models, logs, metrics) will be saved.
     timeout_per_engine
-        Time limit in seconds for each AutoML engine. If None, uses
-        WALLCLOCK_LIMIT_SEC.
+        Time limit in seconds for each AutoML engine, search plus CV. If
+        None, uses WALLCLOCK_LIMIT_SEC.
     metric
         The primary metric to optimize for (e.g., 'r2', 'neg_mean_squared_error').
     enable_ensemble
@@ -302,6 +406,22 @@ def _meta_search_sequential(
     n_cpus
         Number of CPU threads available inside the container. Passed to each
         AutoML engine and used to limit BLAS threading.
+    global_timeout
+        Optional budget in seconds for the whole meta-search.  Engines run in
+        this process cannot be interrupted, so once it passes the remaining
+        engines are skipped and recorded as cancelled.
+    engine_names
+        Engine names or CLI aliases to run (default: all registered engines).
+        Wrappers of engines that are not selected are never imported.
+    engine_budgets
+        Optional per-engine overrides of ``timeout_per_engine``.
+    run_cache
+        Optional :class:`scripts.run_cache.RunCache`.  Engines with a cached
+        result for the same data, configuration and engine version are not
+        run; fresh results are added to the cache.
+    cache_config
+        Extra settings that shaped ``X``/``y`` (e.g. feature-engineering
+        flags), folded into the cache key.
 
     Returns
     -------
@@ -311,35 +431,58 @@ def _meta_search_sequential(
         - A dictionary of performance metrics per engine, keyed by engine name.
           Each value is a dictionary containing mean and std dev for r2, rmse, mae.
     """
+    from scripts.scheduler import STATUS_CANCELLED, STATUS_ERROR, STATUS_OK, Deadline, split_budget
+
     run_dir = Path(run_dir)
     run_dir.mkdir(parents=True, exist_ok=True)
 
-    timeout_sec = timeout_per_engine or WALLCLOCK_LIMIT_SEC
+    global_deadline = Deadline(global_timeout)
 
-    engines = {}
     fitted_models: Dict[str, Any] = {}
     per_engine_metrics: Dict[str, Dict[str, float]] = {}
 
-    # Discover available engines
-    discovered_engines = discover_available()
+    # Resolve the selected engines (metadata only; wrappers are imported on use)
+    from engines import EngineSelection, load_engine_class
+
+    selection = EngineSelection.resolve(engine_names, time_budgets=engine_budgets)
+    discovered_engines = selection.specs()
     if not discovered_engines:
         logger.error("No AutoML engines found. Please ensure engine wrappers are in the 'engines/' directory.")
         raise RuntimeError("No AutoML engines found.")
 
+    if run_cache is not None:
+        from scripts.run_cache import fingerprint_data
+
+        data_fingerprint = fingerprint_data(X, y)
+
     root = Tree("[bold cyan]AutoML Meta-Search (Sequential)[/bold cyan]")
 
-    for name, wrapper_module in discovered_engines.items():
+    for name in discovered_engines:
         engine_node = root.add(f"[bold blue]Processing Engine: {name}[/bold blue]")
+        if global_deadline.expired():
+            logger.warning("[Orchestrator|%s] Global deadline reached; skipping engine.", name)
+            engine_node.add("[yellow]Skipped: global deadline reached[/yellow]")
+            per_engine_metrics[name] = {"status": STATUS_CANCELLED, "phase": "starting"}
+            continue
         engine_start_time = time.perf_counter()
-        logger.info("[Orchestrator] Starting %s engine training...", name)
+        # Part of each engine's budget is kept back for cross-validation.
+        budget = split_budget(selection.time_budget(name, timeout_per_engine or WALLCLOCK_LIMIT_SEC))
+        cache_key = None
+        if run_cache is not None:
+            cache_key = _engine_cache_key(data_fingerprint, discovered_engines[name], budget, metric, cache_config)
+            cached = _load_cached_engine(run_cache, cache_key, name, run_dir)
+            if cached is not None:
+                fitted_models[name], per_engine_metrics[name] = cached
+                engine_node.add("[green]Loaded from run cache[/green]")
+                continue
+        logger.info("[Orchestrator] Starting %s engine training (%ss search)...", name, budget.search_seconds)
 
         try:
-            engine_class_name = wrapper_module.__all__[0] # Assuming the class name is the first in __all__
-            engine_class = getattr(wrapper_module, engine_class_name)
+            engine_class = load_engine_class(name)
             # Instantiate the engine wrapper
             engine = engine_class(
                 seed=RANDOM_STATE,
-                timeout_sec=timeout_sec,
+                timeout_sec=budget.search_seconds,
                 run_dir=run_dir,
                 metric=metric,
                 n_cpus=n_cpus,
@@ -353,40 +496,11 @@ def _meta_search_sequential(
 
             # Perform 5x3 Repeated Cross-Validation
             cv_node = engine_node.add("5×3 Repeated K-Fold evaluation…")
-            rkf = RepeatedKFold(n_splits=N_SPLITS_CROSS_VALIDATION, n_repeats=N_REPEATS_CROSS_VALIDATION, random_state=RANDOM_STATE)
-            scoring = {
-                "r2": make_scorer(r2_score),
-                "rmse": make_scorer(_rmse, greater_is_better=False),
-                "mae": make_scorer(mean_absolute_error, greater_is_better=False),
-            }
-            logger.info(f"[Orchestrator|{name}] Starting {N_REPEATS_CROSS_VALIDATION}x{N_SPLITS_CROSS_VALIDATION} Repeated K-Fold Cross-Validation for {name}...")
-            cv_results = cross_validate(
-                fitted_model,
-                X,
-                y,
-                cv=rkf,
-                scoring=scoring,
-                return_train_score=False,
-                n_jobs=1,
-            )
-            logger.info(f"[Orchestrator|{name}] Cross-Validation complete for {name}.")
-
-            # Process CV results
-            r2_scores = cv_results["test_r2"]
-            rmse_scores = np.abs(cv_results["test_rmse"]) # RMSE is typically positive
-            mae_scores = np.abs(cv_results["test_mae"])   # MAE is typically positive
-
-            engine_duration = time.perf_counter() - engine_start_time
-
-            per_engine_metrics[name] = {
-                "r2_mean": np.mean(r2_scores),
-                "r2_std": np.std(r2_scores),
-                "rmse_mean": np.mean(rmse_scores),
-                "rmse_std": np.std(rmse_scores),
-                "mae_mean": np.mean(mae_scores),
-                "mae_std": np.std(mae_scores),
-                "duration_seconds": engine_duration,
-            }
+            per_engine_metrics[name] = _cross_validate_model(fitted_model, X, y, name=name, n_cpus=n_cpus, log=logger, metric=metric, run_dir=run_dir)
+            per_engine_metrics[name]["duration_seconds"] = time.perf_counter() - engine_start_time
+            per_engine_metrics[name]["status"] = STATUS_OK
+            if cache_key is not None:
+                _store_engine_result(run_cache, cache_key, name, fitted_model, per_engine_metrics[name], run_dir)
             logger.info(f"[Orchestrator|{name}] Metrics: R²={per_engine_metrics[name]['r2_mean']:.4f} (±{per_engine_metrics[name]['r2_std']:.4f}), RMSE={per_engine_metrics[name]['rmse_mean']:.4f} (±{per_engine_metrics[name]['rmse_std']:.4f}), MAE={per_engine_metrics[name]['mae_mean']:.4f} (±{per_engine_metrics[name]['mae_std']:.4f})")
             cv_node.add(f"R²: {per_engine_metrics[name]['r2_mean']:.4f} (±{per_engine_metrics[name]['r2_std']:.4f})")
             cv_node.add(f"RMSE: {per_engine_metrics[name]['rmse_mean']:.4f} (±{per_engine_metrics[name]['rmse_std']:.4f})")
@@ -395,6 +509,11 @@ def _meta_search_sequential(
         except Exception as e:
             logger.error(f"[Orchestrator|{name}] Error running engine {name}: {e}", exc_info=True)
             engine_node.add(f"[bold red]Error: {e}[/bold red]")
+            per_engine_metrics[name] = {
+                "status": STATUS_ERROR,
+                "error": str(e),
+                "duration_seconds": time.perf_counter() - engine_start_time,
+            }
             # Do not re-raise, allow other engines to run
 
     console.print(root)
@@ -448,29 +567,75 @@ def meta_search(
     return champion_model, {}
 
 class _MeanEnsembleRegressor:  # noqa: D401 – simple averaging ensemble
-    """A simple ensemble that averages predictions from multiple models."""
+    """An ensemble that averages predictions from multiple models.
+
+    ``weights`` (normalised to sum to one) turn the plain mean into a
+    weighted average; models with zero weight are never asked to predict.
+    With ``n_jobs > 1`` the members predict concurrently on a ``"thread"`` or
+    ``"process"`` pool, and inputs longer than ``batch_size`` rows are scored
+    batch by batch into one preallocated output (see
+    ``scripts.ensemble_predict``).
+    """
 
-    def __init__(self, models: list[Any]):
+    def __init__(
+        self,
+        models: list[Any],
+        weights: list[float] | None = None,
+        *,
+        n_jobs: int = 1,
+        executor: str = "thread",
+        batch_size: int | None = None,
+    ):
         self.models = models
+        self.weights = weights
+        self.n_jobs = n_jobs
+        self.executor = executor
+        self.batch_size = batch_size
 
     def fit(self, *_args, **_kwargs):  # noqa: D401 – no-op fit
         return self
 
     def predict(self, X):
-        predictions = np.array([model.predict(X) for model in self.models])
-        return np.mean(predictions, axis=0)
+        from scripts.ensemble_predict import DEFAULT_BATCH_SIZE, weighted_predict
+
+        # getattr keeps ensembles pickled before these options existed loadable.
+        return weighted_predict(
+            self.models,
+            X,
+            weights=self.weights,
+            n_jobs=getattr(self, "n_jobs", 1),
+            executor=getattr(self, "executor", "thread"),
+            batch_size=getattr(self, "batch_size", None) or DEFAULT_BATCH_SIZE,
+        )
 
-def _blend(champions: list[Any]):
-    """Create a simple averaging ensemble from a list of champion models."""
+def _blend(champions: list[Any], weights: list[float] | None = None, n_jobs: int = 1):
+    """Create an (optionally weighted) averaging ensemble from champion models."""
     if not champions:
         return None
-    return _MeanEnsembleRegressor(models=champions)
+    return _MeanEnsembleRegressor(models=champions, weights=weights, n_jobs=min(n_jobs, len(champions)))
+
+def _select_ensemble_weights(run_dir: Path | str, names: list[str], y: pd.Series, metric: str = DEFAULT_METRIC):
+    """Pick blend weights for *names* by greedy selection over their cached OOF predictions.
 
-def _runner(name: str, X_obj, y_obj, t_sec, r_dir, met, n_cpus, q_child: _mp.Queue):
+    Returns ``None`` when any engine has no cached predictions, in which case
+    callers fall back to the equal-weight blend.
+    """
+    from scripts.ensemble_selection import greedy_ensemble_selection
+    from scripts.oof_store import OOFStore
+
+    store = OOFStore.for_run(run_dir)
+    if not names or any(not store.path(name).is_file() for name in names):
+        return None
+    selection = greedy_ensemble_selection(store.matrix(names), y, names=names, metric=metric)
+    logger.info("[Orchestrator] Greedy ensemble selection (%s=%.4f on OOF): %s", metric, selection.score, selection.as_dict())
+    return selection
+
+def _runner(name: str, data_handle, t_sec, r_dir, met, n_cpus, q_child: _mp.Queue, cpu_share=None, cores=None):
     # Dynamically import the wrapper class within the child process
-    from orchestrator import _get_automl_engine, RANDOM_STATE, N_SPLITS_CROSS_VALIDATION, N_REPEATS_CROSS_VALIDATION, _rmse, logging_level, DEFAULT_METRIC
-    from sklearn.metrics import make_scorer, r2_score, mean_absolute_error
-    from sklearn.model_selection import RepeatedKFold, cross_validate
+    from scripts.cpu_allocator import pin_process
+    from scripts.scheduler import phase_message, result_message
+    from scripts.shared_data import SharedDataset
+    from orchestrator import _get_automl_engine, _cross_validate_model, RANDOM_STATE, logging_level
     import time
     import random
     import numpy as np
@@ -495,6 +660,10 @@ def _runner(name: str, X_obj, y_obj, t_sec, r_dir, met, n_cpus, q_child: _mp.Que
     child_logger.setLevel(logging_level)
 
     child_logger.info("[Orchestrator|%s] Child process started.", name)
+    if cores:
+        # Threads created from here on inherit the pinned core set.
+        pin_process(os.getpid(), cores, include_children=False)
+        child_logger.info("[Orchestrator|%s] Pinned to cores %s.", name, cores)
     # Set seeds for child process to ensure reproducibility
     random.seed(RANDOM_STATE)
     np.random.seed(RANDOM_STATE)
@@ -503,7 +672,13 @@ def _runner(name: str, X_obj, y_obj, t_sec, r_dir, met, n_cpus, q_child: _mp.Que
     fitted_model = None
     engine_metrics = {}
 
+    # Attach read-only to the parent's shared-memory copy of the training data;
+    # X_obj / y_obj are views over the shared buffers, not private copies.
+    shared_data = SharedDataset.attach(data_handle)
+    X_obj, y_obj = shared_data.X, shared_data.y
+
     try:
+        q_child.put(phase_message(name, "search", search_budget_seconds=t_sec))
         # Instantiate the engine wrapper within the child process
         wrapper_instance = wrapper_class(
             seed=RANDOM_STATE,
@@ -514,42 +689,29 @@ def _runner(name: str, X_obj, y_obj, t_sec, r_dir, met, n_cpus, q_child: _mp.Que
         )
         fitted_model = wrapper_instance.fit(X_obj, y_obj)
         child_logger.info(f"[Orchestrator|{name}] Model fitting complete for {name}.")
+        q_child.put(phase_message(name, "cv", search_seconds=time.perf_counter() - engine_start_time))
 
-        # Perform 5x3 Repeated Cross-Validation
-        rkf = RepeatedKFold(n_splits=N_SPLITS_CROSS_VALIDATION, n_repeats=N_REPEATS_CROSS_VALIDATION, random_state=RANDOM_STATE)
-        scoring = {
-            "r2": make_scorer(r2_score),
-            "rmse": make_scorer(_rmse, greater_is_better=False),
-            "mae": make_scorer(mean_absolute_error, greater_is_better=False),
-        }
-        child_logger.info(f"[Orchestrator|{name}] Starting {N_REPEATS_CROSS_VALIDATION}x{N_SPLITS_CROSS_VALIDATION} Repeated K-Fold Cross-Validation for {name}...")
-        cv_results = cross_validate(
-            fitted_model, X_obj, y_obj, cv=rkf, scoring=scoring, return_train_score=False, n_jobs=1 # n_jobs=1 to avoid nesting multiprocessing
-        )
-        child_logger.info(f"[Orchestrator|{name}] Cross-Validation complete for {name}.")
-
-        # Process CV results
-        r2_scores = cv_results["test_r2"]
-        rmse_scores = np.abs(cv_results["test_rmse"])
-        mae_scores = np.abs(cv_results["test_mae"])
-
-        engine_duration = time.perf_counter() - engine_start_time
-
-        engine_metrics = {
-            "r2_mean": np.mean(r2_scores),
-            "r2_std": np.std(r2_scores),
-            "rmse_mean": np.mean(rmse_scores),
-            "rmse_std": np.std(rmse_scores),
-            "mae_mean": np.mean(mae_scores),
-            "mae_std": np.std(mae_scores),
-            "duration_seconds": engine_duration,
-        }
+        # Perform 5x3 Repeated Cross-Validation, using any cores handed over
+        # by engines that finished first.
+        cv_cpus = cpu_share.value if cpu_share is not None else n_cpus
+        engine_metrics = _cross_validate_model(fitted_model, X_obj, y_obj, name=name, n_cpus=cv_cpus, log=child_logger, metric=met, run_dir=r_dir)
+        engine_metrics["duration_seconds"] = time.perf_counter() - engine_start_time
         child_logger.info(f"[Orchestrator|{name}] Metrics: R²={engine_metrics['r2_mean']:.4f} (±{engine_metrics['r2_std']:.4f}), RMSE={engine_metrics['rmse_mean']:.4f} (±{engine_metrics['rmse_std']:.4f}), MAE={engine_metrics['mae_mean']:.4f} (±{engine_metrics['mae_std']:.4f})")
-        q_child.put((name, fitted_model, engine_metrics)) # Put fitted model AND metrics
+        q_child.put(result_message(name, fitted_model, engine_metrics)) # Put fitted model AND metrics
     except Exception as e: # Catch any error in the child process
         error_traceback = traceback.format_exc()
         child_logger.error("[Orchestrator|%s] Engine crashed: %s\n%s", name, e, error_traceback)
-        q_child.put((name, None, {"error": str(e), "traceback": error_traceback})) # Indicate error, pass traceback
+        q_child.put(result_message(name, None, {"error": str(e), "traceback": error_traceback})) # Indicate error, pass traceback
+    finally:
+        # The fold pool's worker processes would otherwise keep this child
+        # alive after it has reported back, blocking the parent's join().
+        from scripts.cross_validation import shutdown_fold_workers
+        shutdown_fold_workers()
+        # Drop this frame's views first so the mapping can actually be
+        # released; views still held elsewhere (e.g. by the fitted model
+        # while the queue pickles it) keep it alive until they are freed.
+        X_obj = y_obj = None
+        shared_data.close()
 
 def _meta_search_concurrent(
     *,
@@ -560,8 +722,14 @@ def _meta_search_concurrent(
     run_dir: Path | str = "05_outputs",
     enable_ensemble: bool,
     n_cpus: int,
+    global_timeout: float | None = None,
+    cpu_weights: Dict[str, float] | None = None,
+    engine_names: Sequence[str] | None = None,
+    engine_budgets: Dict[str, float] | None = None,
+    run_cache: Any = None,
+    cache_config: Dict[str, Any] | None = None,
 ) -> Tuple[Any, Dict[str, Any], Dict[str, Dict[str, float]]]:
-    """Run each available AutoML engine in parallel and return the best model.
+    """Run each selected AutoML engine in parallel and return the best model.
 
     Parameters
     ----------
@@ -570,7 +738,31 @@ def _meta_search_concurrent(
     run_dir
         Directory where all artifacts (models, logs, metrics) will be saved.
     timeout_per_engine
-        Time limit in seconds for each AutoML engine.
+        Wall-clock budget in seconds for each AutoML engine, covering both
+        its search and its cross-validation.  Workers that overrun it are
+        terminated and recorded with the phase they reached.
+    global_timeout
+        Optional budget in seconds for the whole meta-search; when it passes,
+        unfinished engines are cancelled and the champion is chosen from the
+        engines that completed.
+    n_cpus
+        Total CPU budget.  It is partitioned between the engines (see
+        ``scripts.cpu_allocator``); each worker is pinned to its cores and
+        gets BLAS/OpenMP limits for its share.
+    cpu_weights
+        Optional relative CPU weights per engine name (default: even split).
+    engine_names
+        Engine names or CLI aliases to run (default: all registered engines).
+        Only these engines get a worker process.
+    engine_budgets
+        Optional per-engine overrides of ``timeout_per_engine``.
+    run_cache
+        Optional :class:`scripts.run_cache.RunCache`.  Engines with a cached
+        result for the same data, configuration and engine version are not
+        run; fresh results are added to the cache.
+    cache_config
+        Extra settings that shaped ``X``/``y`` (e.g. feature-engineering
+        flags), folded into the cache key.
     metric
         The primary metric to optimize for (e.g., 'r2', 'neg_mean_squared_error').
     enable_ensemble
@@ -583,7 +775,8 @@ def _meta_search_concurrent(
         - The champion fitted model (best performing across all engines).
         - A dictionary of fitted models, keyed by engine name.
         - A dictionary of performance metrics per engine, keyed by engine name.
-          Each value is a dictionary containing mean and std dev for r2, rmse, mae.
+          Each value is a dictionary containing mean and std dev for r2, rmse, mae
+          and a ``status``; failed engines carry their status, phase and timings.
     """
 
     run_dir = Path(run_dir)
@@ -591,49 +784,111 @@ def _meta_search_concurrent(
 
     console.print("[bold cyan]AutoML Meta-Search (Concurrent)[/bold cyan]")
 
-    # Discover available engines
-    discovered_engines = discover_available()
+    # Resolve the selected engines. Only metadata is needed here; each worker
+    # imports its own wrapper.
+    from engines import EngineSelection
+
+    selection = EngineSelection.resolve(engine_names, time_budgets=engine_budgets, cpu_weights=cpu_weights)
+    discovered_engines = selection.specs()
     if not discovered_engines:
         logger.error("No AutoML engines found. Please ensure engine wrappers are in the 'engines/' directory.")
         raise RuntimeError("No AutoML engines found.")
 
-    ctx = _mp.get_context("spawn")  # "spawn" is safer for multiprocessing
-    q = ctx.Queue() # type: ignore
-    workers = []
-
-    for name in discovered_engines.keys():  # Iterate over names only
-        worker = ctx.Process(
-            target=_runner,
-            args=(
-                name,
-                X,
-                y,
-                timeout_per_engine,
-                run_dir,
-                metric,
-                n_cpus,
-                q,
-            ),
-        )
-        worker.start()
-        workers.append(worker)
+    from scripts.cpu_allocator import CoreAllocator, available_cores, pin_process, thread_env
+    from scripts.scheduler import STATUS_ERROR, STATUS_OK, Deadline, EngineScheduler, split_budget
+    from scripts.shared_data import SharedDataset
+
+    budgets = {name: split_budget(selection.time_budget(name, timeout_per_engine)) for name in discovered_engines}
 
     per_engine_fitted_models: Dict[str, Any] = {}
     per_engine_metrics: Dict[str, Dict[str, float]] = {}
 
-    for _ in workers: # Iterate as many times as there are workers
-        eng_name, fitted_model, metrics = q.get()
-        if fitted_model is not None: # Only store successful results
-            per_engine_fitted_models[eng_name] = fitted_model
-            per_engine_metrics[eng_name] = metrics
-        else:
-            error_msg = metrics.get('error', 'Unknown error')
-            error_tb = metrics.get('traceback', 'No traceback available')
-            console.print(f"[red]✗ {eng_name} error: {error_msg}[/]")
-            logger.error(f"[Orchestrator] Error from {eng_name} child process:\n%s", error_tb)
+    # Engines whose result for this exact data/config is cached are not started.
+    cache_keys: Dict[str, str] = {}
+    if run_cache is not None:
+        from scripts.run_cache import fingerprint_data
+
+        data_fingerprint = fingerprint_data(X, y)
+        for name, spec in discovered_engines.items():
+            cache_keys[name] = _engine_cache_key(data_fingerprint, spec, budgets[name], metric, cache_config)
+            cached = _load_cached_engine(run_cache, cache_keys[name], name, run_dir)
+            if cached is not None:
+                per_engine_fitted_models[name], per_engine_metrics[name] = cached
+                console.print(f"[green]✓ {name} loaded from run cache[/]")
+    pending_engines = [name for name in discovered_engines if name not in per_engine_fitted_models]
 
-    for worker in workers: # Wait for all processes to finish
-        worker.join()
+    global_deadline = Deadline(global_timeout)
+
+    ctx = _mp.get_context("spawn")  # "spawn" is safer for multiprocessing
+    q = ctx.Queue() # type: ignore
+
+    # Give every engine its own slice of the cores instead of the full count.
+    allocator = CoreAllocator(available_cores(n_cpus), weights=selection.cpu_weights)
+    core_sets = allocator.allocate(pending_engines)
+    cpu_shares = {name: ctx.Value("i", len(cores)) for name, cores in core_sets.items()}
+
+    def _rebalance(finished_run) -> None:
+        for name, cores in allocator.release(finished_run.name).items():
+            engine_run = scheduler.runs.get(name)
+            if engine_run is None or not engine_run.running:
+                continue
+            pin_process(engine_run.process.pid, cores)
+            cpu_shares[name].value = len(cores)
+            logger.info("[Orchestrator] %s finished; %s now has %d cores.", finished_run.name, name, len(cores))
+
+    scheduler = EngineScheduler(q, global_deadline=global_deadline, on_finish=_rebalance)
+    for name in pending_engines:
+        budget = budgets[name]
+        logger.info(
+            "[Orchestrator] %s budget %ss: %ss search + %.0fs reserved for CV.",
+            name, budget.total_seconds, budget.search_seconds, budget.cv_seconds,
+        )
+
+    # Place the training data in shared memory once; each child attaches to it
+    # instead of unpickling its own copy. The segments are unlinked when the
+    # block exits, after every worker has been reaped.
+    if pending_engines:
+        with SharedDataset.from_frame(X, y) as shared_data:
+            logger.info("[Orchestrator] Shared training data with engine workers (%.1f MiB).", shared_data.handle.nbytes / 2**20)
+
+            for name in pending_engines:
+                cores = core_sets[name]
+                worker = ctx.Process(
+                    target=_runner,
+                    args=(
+                        name,
+                        shared_data.handle,
+                        budgets[name].search_seconds,
+                        run_dir,
+                        metric,
+                        len(cores),
+                        q,
+                        cpu_shares[name],
+                        cores,
+                    ),
+                )
+                # The child copies the environment at start, so its native thread
+                # pools are sized for its own share of the cores.
+                with thread_env(len(cores)):
+                    scheduler.start(name, worker, budgets[name].total_seconds)
+                pin_process(worker.pid, cores)
+                logger.info("[Orchestrator] %s assigned %d core(s): %s", name, len(cores), cores)
+
+            # Polls the queue with a timeout and terminates workers that overrun
+            # their deadline or the global one, so a hung child cannot block us.
+            for eng_name, engine_run in scheduler.run().items():
+                per_engine_metrics[eng_name] = engine_run.summary()
+                if engine_run.status == STATUS_OK:
+                    per_engine_fitted_models[eng_name] = engine_run.model
+                    if eng_name in cache_keys:
+                        _store_engine_result(run_cache, cache_keys[eng_name], eng_name, engine_run.model, per_engine_metrics[eng_name], run_dir)
+                elif engine_run.status == STATUS_ERROR:
+                    error_msg = engine_run.metrics.get('error', 'Unknown error')
+                    error_tb = engine_run.metrics.get('traceback', 'No traceback available')
+                    console.print(f"[red]✗ {eng_name} error: {error_msg}[/]")
+                    logger.error(f"[Orchestrator] Error from {eng_name} child process:\n%s", error_tb)
+                else:
+                    console.print(f"[red]✗ {eng_name} {engine_run.status} during {engine_run.phase} after {engine_run.deadline.elapsed():.1f}s[/]")
 
     if not per_engine_fitted_models:
         logger.error("All AutoML engines failed in concurrent run.")
@@ -660,14 +915,9 @@ def _meta_search_concurrent(
 
 def _get_automl_engine(name: str):
     """Dynamically import and return the specified AutoML engine wrapper."""
-    if name == "auto_sklearn_wrapper":
-        return AutoSklearnEngine
-    elif name == "tpot_wrapper":
-        return TPOTEngine
-    elif name == "autogluon_wrapper":
-        return AutoGluonEngine
-    else:
-        raise ValueError(f"Unknown AutoML engine: {name}")
+    from engines import load_engine_class
+
+    return load_engine_class(name)
 
 
 def _score(
@@ -677,28 +927,22 @@ def _score(
     metric: str = DEFAULT_METRIC,
 ):
     """Score a trained model using the specified metric."""
-    if metric == "r2":
-        return r2_score(y_valid, model.predict(X_valid))
-    elif metric == "neg_mean_squared_error":
-        return -mean_squared_error(y_valid, model.predict(X_valid))
-    elif metric == "neg_mean_absolute_error":
-        return -mean_absolute_error(y_valid, model.predict(X_valid))
-    else:
+    from scripts.scoring import METRICS, regression_metrics
+
+    if metric not in METRICS:
         raise ValueError(f"Unsupported metric: {metric}")
+    return regression_metrics(y_valid, model.predict(X_valid), (metric,))[metric]
 
 
 def _validate_components_availability() -> None:
-    """Ensure that all component names correspond to actual module files."""
+    """Ensure that all component names correspond to indexed block modules."""
+    registry = get_registry()
     missing: list[str] = []
 
-    for name in MODEL_FAMILIES:
-        if not (_MODELS_DIR / f"{name}.py").is_file():
-            missing.append(f"model '{name}'")
-
-    for name in PREP_STEPS:
-        pattern = list(_PREPROCESSORS_DIR.rglob(f"{name}.py"))
-        if not pattern:
-            missing.append(f"preprocessor '{name}'")
+    for kind, names in (("model", MODEL_FAMILIES), ("preprocessor", PREP_STEPS)):
+        for name in names:
+            if name not in registry or registry.get(name).kind != kind:
+                missing.append(f"{kind} '{name}'")
 
     if missing:
         raise FileNotFoundError(
@@ -725,8 +969,54 @@ def _print_directory_tree(path: Path) -> None:
     """Print the artifact directory structure using ``rich.tree``."""
     console.print(_directory_to_tree(path))
 
+def _split_memmapped(X: pd.DataFrame, y: pd.Series, run_dir: Path):
+    """Train/hold-out split that keeps a memory-mapped ``X`` on disk.
+
+    Uses the same shuffled split as ``train_test_split`` but gathers the rows
+    chunk-wise into ``train.npy``/``holdout.npy`` under *run_dir*, so neither
+    half is ever held in RAM as a whole.
+    """
+    from sklearn.model_selection import train_test_split
+    from scripts.array_store import backing_file, memmap_frame, take_rows
+
+    if backing_file(X) is None:
+        # Engineering produced non-numeric columns, so X is in memory anyway.
+        return train_test_split(X, y, test_size=0.2, random_state=RANDOM_STATE, shuffle=True)
+
+    train_rows, holdout_rows = train_test_split(
+        np.arange(len(X)), test_size=0.2, random_state=RANDOM_STATE, shuffle=True
+    )
+    values = X.to_numpy()
+    X_train = memmap_frame(take_rows(values, train_rows, run_dir / "train.npy"), X.columns, index=X.index[train_rows])
+    X_holdout = memmap_frame(take_rows(values, holdout_rows, run_dir / "holdout.npy"), X.columns, index=X.index[holdout_rows])
+    return X_train, X_holdout, y.iloc[train_rows], y.iloc[holdout_rows]
+
+
+def _remaining_global_time(global_time: int | None, start_time: float) -> float | None:
+    """Seconds left of ``--global-time`` (measured from CLI start), or None if unset."""
+    if global_time is None:
+        return None
+    return max(0.0, global_time - (time.perf_counter() - start_time))
+
+
+def _engine_value(text: str) -> Tuple[str, float]:
+    """argparse type for ``ENGINE=VALUE`` pairs such as ``tpot=600``."""
+    name, sep, value = text.partition("=")
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if not sep or not name or number is None or number <= 0:
+        raise argparse.ArgumentTypeError(f"expected ENGINE=POSITIVE_NUMBER, got {text!r}")
+    return name, number
+
+
 def _cli() -> None:
     """Parses command-line arguments and orchestrates the AutoML pipeline."""
+    imported_at = time.perf_counter()
+    _configure_logging()
+    logging_ready = time.perf_counter()
+
     parser = argparse.ArgumentParser(
         description="\nAutoML Orchestrator – Meta-Search Controller",
         formatter_class=argparse.RawTextHelpFormatter,
@@ -735,19 +1025,25 @@ def _cli() -> None:
         "--data",
         type=str,
         required=True,
-        help="Path to the predictors CSV file (e.g., DataSets/3/predictors.csv)",
+        help="Path to the predictors file – CSV, Parquet or Feather/Arrow IPC (e.g., DataSets/3/predictors.csv)",
     )
     parser.add_argument(
         "--target",
         type=str,
         required=True,
-        help="Path to the target CSV file (e.g., DataSets/3/targets.csv)",
+        help="Path to the target file – CSV, Parquet or Feather/Arrow IPC (e.g., DataSets/3/targets.csv)",
     )
     parser.add_argument(
         "--time",
         type=int,
         default=WALLCLOCK_LIMIT_SEC,
-        help=f"Wall-clock time limit per engine in seconds (default: {WALLCLOCK_LIMIT_SEC})",
+        help=f"Wall-clock time limit per engine in seconds, including its cross-validation (default: {WALLCLOCK_LIMIT_SEC})",
+    )
+    parser.add_argument(
+        "--global-time",
+        type=int,
+        default=None,
+        help="Wall-clock limit for the whole run in seconds; unfinished engines are stopped and the champion is chosen from those that completed",
     )
     parser.add_argument(
         "--metric",
@@ -775,6 +1071,27 @@ def _cli() -> None:
         action="store_true",
         help="Run only the TPOT engine",
     )
+    parser.add_argument(
+        "--native",
+        action="store_true",
+        help="Run the built-in engine that searches the components/ blocks (not part of --all)",
+    )
+    parser.add_argument(
+        "--engine-time",
+        type=_engine_value,
+        nargs="+",
+        default=[],
+        metavar="ENGINE=SECONDS",
+        help="Per-engine override of --time, e.g. --engine-time tpot=600 autogluon=300",
+    )
+    parser.add_argument(
+        "--cpu-weights",
+        type=_engine_value,
+        nargs="+",
+        default=[],
+        metavar="ENGINE=WEIGHT",
+        help="Relative CPU shares when engines run concurrently, e.g. --cpu-weights autogluon=2 tpot=1",
+    )
     parser.add_argument(
         "--no-ensemble",
         action="store_true",
@@ -786,11 +1103,84 @@ def _cli() -> None:
         default=os.cpu_count() or 1,
         help="Number of CPU threads to use inside the container",
     )
+    parser.add_argument(
+        "--mmap",
+        choices=["float32", "float64"],
+        default=None,
+        help="Load predictors as a read-only memory-mapped matrix of this dtype (cached as .npy\n"
+             "next to the data) and keep the engineered features and train/hold-out split on disk",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["float64", "float32"],
+        default="float64",
+        help="Floating-point precision for training data. float32 downcasts predictors at load time,\n"
+             "turns low-cardinality text columns into categories and keeps float32 through feature\n"
+             "engineering (default: float64)",
+    )
+    parser.add_argument(
+        "--stream-chunk-rows",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Stream the data files in chunks of N rows instead of loading them: feature engineering\n"
+             "is fitted in passes over the chunks and its output written to an on-disk column-major\n"
+             "store (features.npy) that the engines memory-map. For data larger than RAM",
+    )
+    parser.add_argument(
+        "--pca-backend",
+        choices=["auto", "full", "randomized", "incremental"],
+        default="auto",
+        help="SVD strategy of the feature-engineering PCA: full SVD, randomized SVD that stops once\n"
+             "95%% of the variance is explained, or IncrementalPCA over row chunks. auto picks from\n"
+             "the matrix shape and available memory (default: auto)",
+    )
+    parser.add_argument(
+        "--interaction-columns",
+        type=int,
+        default=3,
+        help="Candidate columns of the interaction-feature stage (default: 3)",
+    )
+    parser.add_argument(
+        "--interaction-degree",
+        type=int,
+        default=2,
+        help="Highest order of the interaction products; 3 adds triples (default: 2)",
+    )
+    parser.add_argument(
+        "--max-interactions",
+        type=int,
+        default=None,
+        help="Cap on the number of interaction features (default: no cap)",
+    )
+    parser.add_argument(
+        "--interaction-screen",
+        choices=["correlation", "mutual_info"],
+        default=None,
+        help="Pick the interaction candidates and the products kept under --max-interactions by\n"
+             "their correlation or mutual information with the target (default: column order)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the run cache in 05_outputs/.cache and re-run every engine (results are not cached either)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=2048,
+        help="Size limit of the run cache; least recently used entries are evicted beyond it (default: 2048)",
+    )
     parser.add_argument(
         "--tree",
         action="store_true",
         help="Print artifact directory tree after run",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report CLI start-up and engine worker spawn times (also saved as startup_profile.json)",
+    )
 
     args = parser.parse_args()
 
@@ -800,8 +1190,18 @@ def _cli() -> None:
         logger.error(str(exc))
         sys.exit(1)
 
-    if not (args.all or args.autogluon or args.autosklearn or args.tpot):
-        parser.error("At least one engine must be selected: --all, --autogluon, --autosklearn, or --tpot")
+    startup_profile = None
+    if args.profile_startup:
+        from scripts.startup_profile import StartupProfile
+
+        startup_profile = StartupProfile(_IMPORT_START)
+        startup_profile.mark("import orchestrator", at=imported_at)
+        startup_profile.mark("configure logging", at=logging_ready)
+        startup_profile.mark("parse & validate arguments")
+        startup_profile.ready()
+
+    if not (args.all or args.autogluon or args.autosklearn or args.tpot or args.native):
+        parser.error("At least one engine must be selected: --all, --autogluon, --autosklearn, --tpot, or --native")
 
     selected_engines = []
     if args.all:
@@ -813,9 +1213,23 @@ def _cli() -> None:
             selected_engines.append("autosklearn")
         if args.tpot:
             selected_engines.append("tpot")
+    if args.native:
+        selected_engines.append("native")
+
+    if args.stream_chunk_rows is not None and args.stream_chunk_rows < 1:
+        parser.error("--stream-chunk-rows must be a positive number of rows")
+    if args.interaction_degree < 2:
+        parser.error("--interaction-degree must be at least 2")
 
     if not selected_engines:
-        parser.error("No engines selected. Please use --all or specify at least one engine with --autogluon, --autosklearn, or --tpot.")
+        parser.error("No engines selected. Please use --all or specify at least one engine with --autogluon, --autosklearn, --tpot, or --native.")
+
+    engine_budgets = dict(args.engine_time)
+    cpu_weights = dict(args.cpu_weights)
+    for flag, overrides in (("--engine-time", engine_budgets), ("--cpu-weights", cpu_weights)):
+        unknown = sorted(set(overrides) - set(selected_engines))
+        if unknown:
+            parser.error(f"{flag} names engines that are not selected: {', '.join(unknown)}")
 
     # Define unique run directory for artifacts
     timestamp_str = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -845,24 +1259,92 @@ def _cli() -> None:
     console.log(f"  Dataset: {args.data}")
     console.log(f"  Target: {args.target}")
     console.log(f"  Time Limit per Engine: {args.time} seconds")
+    if engine_budgets:
+        console.log(f"  Engine Time Overrides: {engine_budgets}")
+    if cpu_weights:
+        console.log(f"  CPU Weights: {cpu_weights}")
     console.log(f"  Evaluation Metric: {args.metric}")
     console.log(f"  Selected Engines: {', '.join(selected_engines)}")
     console.log(f"  Artifacts Directory: {run_dir}")
 
-    # Load data
-    try:
-        # data_loader handles resolving the exact file paths
-        X, y = load_data(args.data, args.target)
-        logger.info(f"Data loaded successfully. X shape: {X.shape}, y shape: {y.shape}")
-    except Exception as e:
-        logger.error(f"Failed to load data: {e}", exc_info=True)
-        sys.exit(1)  # Terminate pipeline immediately
+    # Load data (streaming mode reads the files chunk-wise during feature engineering)
+    dtype_report = None
+    if args.stream_chunk_rows is None:
+        try:
+            # data_loader handles resolving the exact file paths
+            from scripts.data_loader import load_data
+
+            load_kwargs = {"mmap_dtype": args.mmap} if args.mmap else {}
+            X, y = load_data(args.data, args.target, **load_kwargs)
+            logger.info(f"Data loaded successfully. X shape: {X.shape}, y shape: {y.shape}")
+            if args.precision != "float64":
+                from scripts.data_loader import downcast_dtypes
+
+                X, dtype_report = downcast_dtypes(X, args.precision)
+                logger.info(
+                    "Downcast predictors to %s: %.1f MiB -> %.1f MiB",
+                    args.precision,
+                    dtype_report["bytes_before"] / 2**20,
+                    dtype_report["bytes_after"] / 2**20,
+                )
+        except Exception as e:
+            logger.error(f"Failed to load data: {e}", exc_info=True)
+            sys.exit(1)  # Terminate pipeline immediately
 
     # ------------------------------------------------------------------
     # Feature Engineering
     # ------------------------------------------------------------------
+    # Engine results are cached per (data, flags, engine version); the
+    # fingerprint is taken on the engineered training split inside the search;
+    # fitted feature engineering is cached per dataset hash next to it.
+    run_cache = None
+    if not args.no_cache:
+        from scripts.run_cache import CACHE_DIRNAME, RunCache
+
+        run_cache = RunCache(Path("05_outputs") / CACHE_DIRNAME, max_bytes=args.cache_max_mb * 2**20)
+    cache_config = {
+        "precision": args.precision,
+        "mmap": args.mmap,
+        "pca_backend": args.pca_backend,
+        "streaming": args.stream_chunk_rows is not None,
+        "interactions": [args.interaction_columns, args.interaction_degree, args.max_interactions, args.interaction_screen],
+    }
+
+    fe_kwargs: Dict[str, Any] = {}
+    if run_cache is not None:
+        fe_kwargs["cache_dir"] = run_cache.features_dir
+    if args.precision != "float64":
+        fe_kwargs["dtype"] = args.precision
+    if args.pca_backend != "auto":
+        fe_kwargs["pca_backend"] = args.pca_backend
+    fe_kwargs.update(
+        n_interaction_columns=args.interaction_columns,
+        interaction_degree=args.interaction_degree,
+        max_interactions=args.max_interactions,
+        interaction_screen=args.interaction_screen,
+    )
+    if args.mmap and args.stream_chunk_rows is None:
+        # Write the engineered matrix back to disk so it stays memory-mapped.
+        fe_kwargs["out_dir"] = run_dir
     try:
-        X, fe_pipeline = engineer_features(X, y)
+        if args.stream_chunk_rows is not None:
+            from scripts.feature_engineering import engineer_features_streaming
+
+            X, y, fe_pipeline = engineer_features_streaming(
+                args.data,
+                args.target,
+                out_path=run_dir / "features.npy",
+                chunk_rows=args.stream_chunk_rows,
+                **fe_kwargs,
+            )
+            logger.info(f"Streamed data in chunks of {args.stream_chunk_rows} rows. X shape: {X.shape}, y shape: {y.shape}")
+        else:
+            from scripts.feature_engineering import engineer_features
+
+            X, fe_pipeline = engineer_features(X, y, **fe_kwargs)
+        if run_cache is not None:
+            # A newly stored fit counts against --cache-max-mb as well.
+            run_cache.evict()
         logger.info(
             "Feature engineering applied with %d components",
             fe_pipeline.named_steps["pca"].n_components_,
@@ -873,12 +1355,18 @@ def _cli() -> None:
 
     # Partition data for final hold-out set
     from sklearn.model_selection import train_test_split
-    X_train_cv, X_holdout, y_train_cv, y_holdout = train_test_split(
-        X, y, test_size=0.2, random_state=RANDOM_STATE, shuffle=True
-    )
+    if args.mmap or args.stream_chunk_rows is not None:
+        X_train_cv, X_holdout, y_train_cv, y_holdout = _split_memmapped(X, y, run_dir)
+    else:
+        X_train_cv, X_holdout, y_train_cv, y_holdout = train_test_split(
+            X, y, test_size=0.2, random_state=RANDOM_STATE, shuffle=True
+        )
     logger.info(f"Data split into training/CV ({X_train_cv.shape[0]} rows) and hold-out ({X_holdout.shape[0]} rows) sets.")
 
+    ensemble_weights = None
     try:
+        from sklearn.metrics import mean_absolute_error, r2_score
+
         if len(selected_engines) > 1 and not args.no_ensemble:
             # Run engines concurrently if multiple are selected and ensembling is enabled
             champion_model, fitted_engines, per_engine_metrics = _meta_search_concurrent(
@@ -889,11 +1377,24 @@ def _cli() -> None:
                 metric=args.metric,
                 enable_ensemble=not args.no_ensemble,
                 n_cpus=args.cpus,
+                global_timeout=_remaining_global_time(args.global_time, start_time),
+                engine_names=selected_engines,
+                engine_budgets=engine_budgets,
+                cpu_weights=cpu_weights,
+                run_cache=run_cache,
+                cache_config=cache_config,
             )
             # Blend champions if ensembling is enabled
             if fitted_engines and not args.no_ensemble:
                 logger.info("Blending champion models...")
-                ensemble_model = _blend(list(fitted_engines.values()))
+                selection = _select_ensemble_weights(run_dir, list(fitted_engines), y_train_cv, args.metric)
+                ensemble_model = _blend(
+                    list(fitted_engines.values()),
+                    weights=None if selection is None else selection.weights.tolist(),
+                    n_jobs=args.cpus,
+                )
+                if selection is not None:
+                    ensemble_weights = selection.as_dict()
                 if ensemble_model:
                     # Re-evaluate the ensemble model on the hold-out set to see if it's better
                     y_pred_ensemble = ensemble_model.predict(X_holdout)
@@ -911,6 +1412,11 @@ def _cli() -> None:
                 metric=args.metric,
                 enable_ensemble=False,  # Ensemble is handled outside sequential for single engine runs
                 n_cpus=args.cpus,
+                global_timeout=_remaining_global_time(args.global_time, start_time),
+                engine_names=selected_engines,
+                engine_budgets=engine_budgets,
+                run_cache=run_cache,
+                cache_config=cache_config,
             )
 
         # Evaluate champion model on the hold-out set
@@ -928,15 +1434,22 @@ def _cli() -> None:
         with open(overall_champion_path, "wb") as f:
             pickle.dump(champion_model, f)
         logger.info(f"Overall champion model saved to {overall_champion_path}")
+        # The fitted transform, so new rows can be prepared for the champion.
+        with open(run_dir / "feature_engineer.pkl", "wb") as f:
+            pickle.dump(fe_pipeline, f)
 
         # Create and save metrics.json
         metrics_data = {
             "run_meta": {
                 "timestamp_utc": datetime.utcnow().isoformat(timespec='seconds') + 'Z',
                 "budget_seconds": args.time,
+                "global_budget_seconds": args.global_time,
+                "engine_time_budgets": engine_budgets,
+                "cpu_weights": cpu_weights,
                 "metric": args.metric,
                 "engines_invoked": selected_engines,
                 "ensemble_enabled": not args.no_ensemble and len(selected_engines) > 1,
+                "ensemble_weights": ensemble_weights,
                 "total_duration_seconds": time.perf_counter() - start_time, # Approximate total duration
                 "data_path": str(Path(args.data).resolve()),
                 "target_path": str(Path(args.target).resolve()),
@@ -947,6 +1460,8 @@ def _cli() -> None:
                 "n_rows": X.shape[0],
                 "n_features": X.shape[1],
                 "target_name": Path(args.target).name.split('.')[0],
+                "precision": args.precision,
+                "memory": dtype_report,
             },
             "holdout_metrics": {
                 "r2": r2_holdout,
@@ -973,6 +1488,15 @@ def _cli() -> None:
         logger.error(f"An error occurred during meta-search or evaluation: {e}", exc_info=True)
         sys.exit(1) # Terminate pipeline immediately
 
+    if startup_profile is not None:
+        from engines import IMPORT_SECONDS
+
+        startup_profile.engine_imports = dict(IMPORT_SECONDS)
+        startup_profile.record_workers(per_engine_metrics)
+        console.print(startup_profile.render())
+        with open(run_dir / "startup_profile.json", "w") as f:
+            json.dump(startup_profile.as_dict(), f, indent=2)
+
     console.log("[bold green]AutoML Orchestrator Run Completed[/bold green]")
     if args.tree:
         _print_directory_tree(run_dir)
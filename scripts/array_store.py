@@ -0,0 +1,107 @@
+"""On-disk ``.npy`` arrays opened as read-only memory maps.
+
+Large predictor matrices are kept in ``.npy`` files and opened with
+``np.load(..., mmap_mode="r")``.  The operating system then keeps the pages in
+its cache once and every process that maps the same file – the orchestrator
+and each engine worker – shares them instead of holding a private copy.
+
+The helpers here write arrays in row chunks so that producing a derived matrix
+(e.g. the train/hold-out split) never needs a second full copy in RAM.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Rows copied per step when gathering from one memory map into another.
+DEFAULT_CHUNK_ROWS = 65_536
+
+
+def open_npy(path: str | Path) -> np.memmap:
+    """Open an ``.npy`` file as a read-only memory map."""
+    return np.load(Path(path), mmap_mode="r")
+
+
+def write_npy(
+    path: str | Path,
+    array: np.ndarray | None = None,
+    *,
+    shape: Sequence[int] | None = None,
+    dtype: Any = None,
+    chunks: Iterable[np.ndarray] | None = None,
+    fortran_order: bool = False,
+) -> np.memmap:
+    """Write an ``.npy`` file and return it re-opened as a read-only memmap.
+
+    Pass either a complete ``array`` or ``shape``/``dtype`` plus an iterable of
+    row ``chunks`` that together fill the first axis.  The file is written
+    under a temporary name and renamed into place, so readers never observe a
+    half-written matrix.  ``fortran_order=True`` stores the matrix column by
+    column, so each column is one contiguous range of the file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if array is not None:
+        shape, dtype = array.shape, array.dtype
+        chunks = (array[start:start + DEFAULT_CHUNK_ROWS] for start in range(0, max(len(array), 1), DEFAULT_CHUNK_ROWS))
+    if shape is None or dtype is None or chunks is None:
+        raise ValueError("write_npy needs either an array or shape, dtype and chunks.")
+
+    tmp = path.with_name(path.name + ".tmp")
+    out = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=tuple(shape), fortran_order=fortran_order)
+    try:
+        start = 0
+        for chunk in chunks:
+            stop = start + len(chunk)
+            out[start:stop] = chunk
+            start = stop
+        if start != out.shape[0] and out.shape[0]:
+            raise ValueError(f"Chunks filled {start} of {out.shape[0]} rows.")
+        out.flush()
+    except Exception:
+        del out
+        tmp.unlink(missing_ok=True)
+        raise
+    del out
+    os.replace(tmp, path)
+    return open_npy(path)
+
+
+def take_rows(array: np.ndarray, rows: np.ndarray, path: str | Path, *, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> np.memmap:
+    """Gather ``array[rows]`` into a new ``.npy`` memmap, ``chunk_rows`` at a time."""
+    rows = np.asarray(rows)
+    chunks = (array[rows[start:start + chunk_rows]] for start in range(0, len(rows), chunk_rows))
+    return write_npy(path, shape=(len(rows), *array.shape[1:]), dtype=array.dtype, chunks=chunks)
+
+
+def backing_file(array: Any) -> Path | None:
+    """Return the ``.npy`` file that *array* maps in full, if any.
+
+    Only a view covering the whole memory map with its original layout
+    qualifies – anything else cannot be re-opened from the file alone.
+    """
+    if isinstance(array, (pd.DataFrame, pd.Series)):
+        array = array.to_numpy()
+    root = array
+    while isinstance(getattr(root, "base", None), np.ndarray):
+        root = root.base
+    if not isinstance(root, np.memmap) or root.filename is None:
+        return None
+    same_layout = (
+        array.shape == root.shape
+        and array.strides == root.strides
+        and array.__array_interface__["data"][0] == root.__array_interface__["data"][0]
+    )
+    return Path(root.filename) if same_layout else None
+
+
+def memmap_frame(array: np.ndarray, columns: Sequence[Any], index: pd.Index | None = None) -> pd.DataFrame:
+    """Wrap a 2-D (memory-mapped) array in a DataFrame without copying it."""
+    return pd.DataFrame(array, columns=list(columns), index=index, copy=False)
+
+
+__all__ = ["backing_file", "memmap_frame", "open_npy", "take_rows", "write_npy"]
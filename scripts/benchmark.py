@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+"""Micro-benchmarks for the feature-engineering and preprocessing backends.
+
+Each sub-command times the competing implementations of one building block on
+synthetic data and reports wall-clock time and peak memory.  Peak memory is
+measured with :mod:`tracemalloc`, which sees NumPy (and therefore LAPACK
+workspace allocated through NumPy) but not memory allocated directly by native
+libraries, so treat it as a lower bound that is comparable between backends.
+
+Usage::
+
+    python -m scripts.benchmark pca --rows 20000 --cols 1000
+    python -m scripts.benchmark kmeans-outlier --rows 10000 100000
+    python -m scripts.benchmark lof --rows 5000 20000 --cols 32
+
+Results for the reference machine are collected in ``docs/benchmarks.md``.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence
+
+import numpy as np
+
+
+def measure(fn: Callable[[], Any], *, repeat: int = 1) -> Dict[str, Any]:
+    """Best wall-clock time and peak traced memory of ``fn()`` over *repeat* runs."""
+    best, peak, result = float("inf"), 0, None
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        best = min(best, elapsed)
+    return {"seconds": best, "peak_mib": peak / 2**20, "result": result}
+
+
+def low_rank_matrix(rows: int, cols: int, rank: int, *, noise: float = 0.1, seed: int = 0) -> np.ndarray:
+    """Standardised ``rows x cols`` matrix of approximate rank *rank*."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((rows, rank)) @ rng.standard_normal((rank, cols))
+    X += noise * rng.standard_normal((rows, cols))
+    X -= X.mean(axis=0)
+    X /= X.std(axis=0)
+    return X
+
+
+def _print_table(rows: List[Dict[str, Any]], columns: Sequence[str]) -> None:
+    widths = {c: max(len(c), *(len(_fmt(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(_fmt(row[c]).ljust(widths[c]) for c in columns))
+
+
+def _fmt(value: Any) -> str:
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+
+# ---------------------------------------------------------------------------
+# PCA backends
+# ---------------------------------------------------------------------------
+def bench_pca(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from scripts.pca_backends import VariancePCA
+
+    X = low_rank_matrix(args.rows, args.cols, args.rank).astype(args.dtype)
+    rows = []
+    for backend in args.backends:
+        stats = measure(
+            lambda: VariancePCA(args.variance, backend=backend, batch_size=args.batch_size).fit(X),
+            repeat=args.repeat,
+        )
+        model = stats.pop("result")
+        rows.append({
+            "backend": backend,
+            "used": model.backend_,
+            "components": model.n_components_,
+            "seconds": stats["seconds"],
+            "peak_mib": stats["peak_mib"],
+        })
+    _print_table(rows, ["backend", "used", "components", "seconds", "peak_mib"])
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# KMeans outlier filter
+# ---------------------------------------------------------------------------
+def outlier_matrix(rows: int, cols: int, *, outlier_fraction: float = 0.02, seed: int = 0) -> np.ndarray:
+    """Gaussian rows with a small, far-away cluster in the first rows."""
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((rows, cols))
+    X[: int(rows * outlier_fraction)] += 10.0
+    return X
+
+
+def bench_kmeans_outlier(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from components.preprocessors.outliers.KMeansOutlier import KMeansOutlierBlock
+
+    rows = []
+    for n_rows in args.rows:
+        X = outlier_matrix(n_rows, args.cols)
+        reference = None
+        for mode in args.modes:
+            block = KMeansOutlierBlock(
+                n_clusters=args.clusters,
+                random_state=0,
+                mode=mode,
+                sample_size=args.sample_size,
+                n_init=args.n_init,
+            )
+            stats = measure(lambda: block.fit(X).get_support_mask(), repeat=args.repeat)
+            mask = stats.pop("result")
+            if reference is None:
+                reference = mask
+            rows.append({
+                "rows": n_rows,
+                "mode": block.mode_,
+                "seconds": stats["seconds"],
+                "peak_mib": stats["peak_mib"],
+                "dropped": int((~mask).sum()),
+                "agreement": float((mask == reference).mean()),
+            })
+    _print_table(rows, ["rows", "mode", "seconds", "peak_mib", "dropped", "agreement"])
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# LocalOutlierFactor neighbour backends
+# ---------------------------------------------------------------------------
+def bench_lof(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from components.preprocessors.outliers.LocalOutlierFactor import LOFBlock
+
+    rows = []
+    for n_rows in args.rows:
+        # Low-rank rows (local neighbourhoods exist) with scattered outliers.
+        X = low_rank_matrix(n_rows, args.cols, args.rank)
+        outliers = int(n_rows * 0.02)
+        X[:outliers] *= 4.0
+        reference = None
+        for algorithm in args.algorithms:
+            block = LOFBlock(
+                contamination=0.02,
+                algorithm=algorithm,
+                n_jobs=args.n_jobs,
+                projection_dim=args.projection_dim,
+                random_state=0,
+            )
+            stats = measure(lambda: block.fit(X).get_support_mask(), repeat=args.repeat)
+            mask = stats.pop("result")
+            if reference is None:
+                reference = mask
+            rows.append({
+                "rows": n_rows,
+                "algorithm": algorithm,
+                "seconds": stats["seconds"],
+                "peak_mib": stats["peak_mib"],
+                "outliers_found": float((~mask[:outliers]).mean()),
+                "agreement": float((mask == reference).mean()),
+            })
+    _print_table(rows, ["rows", "algorithm", "seconds", "peak_mib", "outliers_found", "agreement"])
+    return rows
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pca = sub.add_parser("pca", help="VariancePCA backends (scripts.pca_backends)")
+    pca.add_argument("--rows", type=int, default=20_000)
+    pca.add_argument("--cols", type=int, default=1_000)
+    pca.add_argument("--rank", type=int, default=50, help="Approximate rank of the synthetic matrix")
+    pca.add_argument("--variance", type=float, default=0.95)
+    pca.add_argument("--dtype", choices=["float32", "float64"], default="float64")
+    pca.add_argument("--batch-size", type=int, default=5_000)
+    pca.add_argument("--backends", nargs="+", default=["full", "randomized", "incremental"])
+    pca.add_argument("--repeat", type=int, default=1)
+    pca.set_defaults(run=bench_pca)
+
+    km = sub.add_parser("kmeans-outlier", help="KMeansOutlierBlock fitting modes (components.preprocessors.outliers)")
+    km.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    km.add_argument("--cols", type=int, default=20)
+    km.add_argument("--clusters", type=int, default=2)
+    km.add_argument("--sample-size", type=int, default=20_000)
+    km.add_argument("--n-init", type=int, default=10)
+    km.add_argument("--modes", nargs="+", default=["full", "minibatch", "subsample"], help="The first mode is the reference for 'agreement'")
+    km.add_argument("--repeat", type=int, default=1)
+    km.set_defaults(run=bench_kmeans_outlier)
+
+    lof = sub.add_parser("lof", help="LOFBlock neighbour backends (components.preprocessors.outliers)")
+    lof.add_argument("--rows", type=int, nargs="+", default=[5_000, 20_000])
+    lof.add_argument("--cols", type=int, default=32)
+    lof.add_argument("--rank", type=int, default=6, help="Approximate rank of the synthetic matrix")
+    lof.add_argument("--algorithms", nargs="+", default=["brute", "ball_tree", "kd_tree", "random_projection"], help="The first algorithm is the reference for 'agreement'")
+    lof.add_argument("--projection-dim", type=int, default=6)
+    lof.add_argument("--n-jobs", type=int, default=None)
+    lof.add_argument("--repeat", type=int, default=1)
+    lof.set_defaults(run=bench_lof)
+
+    args = parser.parse_args(argv)
+    results = args.run(args)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"command": args.command, "args": {k: v for k, v in vars(args).items() if k != "run"}, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
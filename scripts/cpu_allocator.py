@@ -0,0 +1,181 @@
+"""Split the CPU budget between concurrently running engine processes.
+
+Every engine used to receive ``n_cpus=args.cpus`` and inherit BLAS/OpenMP
+thread variables set to the full count, so three engines on a 16-core box
+asked for 48+ threads and spent their time context switching.
+
+:class:`CoreAllocator` partitions the allowed cores between the engines,
+evenly or in proportion to per-engine weights.  Each worker is started with
+thread variables sized to its share (:func:`thread_env`) and pinned to its
+cores with ``sched_setaffinity`` where the platform supports it.  When an
+engine finishes, :meth:`CoreAllocator.release` hands its cores to the engines
+that are still running; the parent re-pins them (:func:`pin_process`) and
+publishes the new count through a shared value that the workers read before
+cross-validation, which is the phase that can still use extra cores.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Sequence
+
+BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "OMP_THREAD_LIMIT",
+)
+
+
+def available_cores(limit: int | None = None) -> List[int]:
+    """Core ids this process may run on, truncated to the first *limit*."""
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+    else:  # macOS / Windows: no affinity API, assume ids 0..n-1
+        cores = list(range(os.cpu_count() or 1))
+    return cores[:limit] if limit else cores
+
+
+def thread_env_vars(n_threads: int) -> Dict[str, str]:
+    """BLAS/OpenMP variables that cap native thread pools at *n_threads*."""
+    return {var: str(max(1, int(n_threads))) for var in BLAS_ENV_VARS}
+
+
+@contextmanager
+def thread_env(n_threads: int) -> Iterator[None]:
+    """Temporarily set the BLAS/OpenMP thread variables in ``os.environ``.
+
+    ``spawn`` children copy the parent's environment when they start, so
+    wrapping ``Process.start()`` in this context gives each worker its own
+    limits without touching the parent's settings.
+    """
+    previous = {var: os.environ.get(var) for var in BLAS_ENV_VARS}
+    os.environ.update(thread_env_vars(n_threads))
+    try:
+        yield
+    finally:
+        for var, value in previous.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+
+def _thread_ids(pid: int) -> List[int]:
+    task_dir = Path(f"/proc/{pid}/task")
+    try:
+        return [int(tid.name) for tid in task_dir.iterdir()]
+    except OSError:
+        return [pid]
+
+
+def _descendants(pid: int) -> List[int]:
+    try:
+        import psutil
+    except ImportError:
+        return []
+    try:
+        return [child.pid for child in psutil.Process(pid).children(recursive=True)]
+    except psutil.Error:
+        return []
+
+
+def pin_process(pid: int, cores: Sequence[int], *, include_children: bool = True) -> bool:
+    """Restrict every thread of *pid* (and its child processes) to *cores*.
+
+    ``sched_setaffinity`` acts on a single thread, so each thread of the
+    process is pinned individually.  Returns ``False`` where affinity is not
+    supported or the process has already exited.
+    """
+    if not hasattr(os, "sched_setaffinity") or not cores:
+        return False
+    pids = [pid, *(_descendants(pid) if include_children else [])]
+    pinned = False
+    for proc in pids:
+        for tid in _thread_ids(proc):
+            try:
+                os.sched_setaffinity(tid, cores)
+                pinned = True
+            except OSError:
+                # Thread exited meanwhile, or the core set is not allowed.
+                continue
+    return pinned
+
+
+def _proportional(total: int, weights: Sequence[float]) -> List[int]:
+    """Split *total* into integer shares proportional to *weights* (largest remainder)."""
+    wsum = float(sum(weights))
+    raw = [total * w / wsum for w in weights]
+    shares = [int(r) for r in raw]
+    by_remainder = sorted(range(len(weights)), key=lambda i: raw[i] - shares[i], reverse=True)
+    for i in by_remainder[: total - sum(shares)]:
+        shares[i] += 1
+    return shares
+
+
+class CoreAllocator:
+    """Assign disjoint core sets to engines and rebalance them as engines finish."""
+
+    def __init__(self, cores: Sequence[int], weights: Mapping[str, float] | None = None):
+        if not cores:
+            raise ValueError("CoreAllocator needs at least one core.")
+        self.cores = list(cores)
+        self.weights = dict(weights or {})
+        self.assignments: Dict[str, List[int]] = {}
+
+    def _weight(self, name: str) -> float:
+        weight = float(self.weights.get(name, 1.0))
+        if weight <= 0:
+            raise ValueError(f"CPU weight for {name!r} must be positive, got {weight}.")
+        return weight
+
+    def _partition(self, names: Sequence[str]) -> Dict[str, List[int]]:
+        if len(names) >= len(self.cores):
+            # No more cores than engines: one core each, shared round-robin.
+            return {name: [self.cores[i % len(self.cores)]] for i, name in enumerate(names)}
+        # Everyone gets one core; the rest are split by weight.
+        extra = _proportional(len(self.cores) - len(names), [self._weight(n) for n in names])
+        shares = [1 + e for e in extra]
+        out, start = {}, 0
+        for name, share in zip(names, shares):
+            out[name] = self.cores[start:start + share]
+            start += share
+        return out
+
+    def allocate(self, names: Sequence[str]) -> Dict[str, List[int]]:
+        """Partition all cores between *names* (evenly unless weighted)."""
+        self.assignments = self._partition(list(names))
+        return dict(self.assignments)
+
+    def release(self, name: str) -> Dict[str, List[int]]:
+        """Hand the cores of finished engine *name* to the engines still running.
+
+        Running engines keep their current cores (and warm caches); the freed
+        ones are split between them by weight.  Returns the new core sets of
+        the engines whose assignment grew.
+        """
+        in_use = {c for other, cores in self.assignments.items() if other != name for c in cores}
+        freed = [c for c in self.assignments.pop(name, []) if c not in in_use]
+        remaining = list(self.assignments)
+        if not freed or not remaining:
+            return {}
+        changed, start = {}, 0
+        for other, share in zip(remaining, _proportional(len(freed), [self._weight(n) for n in remaining])):
+            if share:
+                self.assignments[other] = self.assignments[other] + freed[start:start + share]
+                changed[other] = list(self.assignments[other])
+                start += share
+        return changed
+
+
+__all__ = [
+    "BLAS_ENV_VARS",
+    "CoreAllocator",
+    "available_cores",
+    "pin_process",
+    "thread_env",
+    "thread_env_vars",
+]
@@ -0,0 +1,194 @@
+"""Fold-parallel cross-validation for fitted engine champions.
+
+``sklearn.model_selection.cross_validate`` was called with ``n_jobs=1`` because
+the engines already use every core while they search.  Once the search is
+over those cores are idle, so :func:`parallel_cross_validate` spreads the
+folds of the repeated K-fold over a worker pool sized from the CPU budget and
+caps the threads *inside* each fold (estimator ``n_jobs``-style parameters
+plus BLAS/OpenMP pools) so that ``folds x threads`` never exceeds the budget.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Mapping, Tuple, Union
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from threadpoolctl import threadpool_limits
+
+# Estimator parameters that control intra-model parallelism across the
+# libraries the engines produce (sklearn, XGBoost, LightGBM, CatBoost).
+_THREAD_PARAMS = ("n_jobs", "nthread", "num_threads", "thread_count")
+
+# Either one scorer per metric, or a single callable returning every metric
+# at once (e.g. ``scripts.scoring.FusedScorer``, which predicts only once).
+Scoring = Union[Mapping[str, Callable[[Any, Any, Any], float]], Callable[[Any, Any, Any], Dict[str, float]]]
+
+
+def fold_parallelism(n_cpus: int, n_folds: int) -> Tuple[int, int]:
+    """Split ``n_cpus`` into ``(concurrent_folds, threads_per_fold)``."""
+    n_cpus = max(1, int(n_cpus))
+    n_jobs = max(1, min(n_cpus, n_folds))
+    return n_jobs, max(1, n_cpus // n_jobs)
+
+
+def limit_estimator_threads(estimator: Any, n_threads: int) -> Any:
+    """Set every thread-count parameter of *estimator* (and nested steps) to ``n_threads``."""
+    get_params = getattr(estimator, "get_params", None)
+    if get_params is None:
+        return estimator
+    try:
+        params = get_params(deep=True)
+    except Exception:  # noqa: BLE001 – foreign wrappers may not support deep params
+        return estimator
+    updates = {
+        key: n_threads
+        for key, value in params.items()
+        if key.rsplit("__", 1)[-1] in _THREAD_PARAMS and (value is None or isinstance(value, int))
+    }
+    if updates:
+        try:
+            estimator.set_params(**updates)
+        except Exception:  # noqa: BLE001 – leave estimators that reject the update alone
+            pass
+    return estimator
+
+
+def _take(data: Any, rows: np.ndarray) -> Any:
+    return data.iloc[rows] if hasattr(data, "iloc") else data[rows]
+
+
+def _fit_and_score(
+    estimator: Any,
+    X: Any,
+    y: Any,
+    train: np.ndarray,
+    test: np.ndarray,
+    scoring: Scoring,
+    n_threads: int,
+    return_predictions: bool = False,
+) -> Dict[str, Any]:
+    """Fit a clone of *estimator* on one fold and score it on the held-out rows."""
+    fold_start = time.perf_counter()
+    with threadpool_limits(limits=n_threads):
+        model = limit_estimator_threads(clone(estimator), n_threads)
+        model.fit(_take(X, train), _take(y, train))
+        fit_time = time.perf_counter() - fold_start
+
+        X_test, y_test = _take(X, test), _take(y, test)
+        score_start = time.perf_counter()
+        y_pred = None
+        if return_predictions:
+            y_pred = np.asarray(model.predict(X_test)).ravel()
+        if y_pred is not None and hasattr(scoring, "score_predictions"):
+            # Reuse the predictions instead of letting the scorer predict again.
+            scores = dict(scoring.score_predictions(y_test, y_pred))
+        elif callable(scoring):
+            scores = dict(scoring(model, X_test, y_test))
+        else:
+            scores = {name: scorer(model, X_test, y_test) for name, scorer in scoring.items()}
+        score_time = time.perf_counter() - score_start
+    return {
+        "scores": scores,
+        "fit_time": fit_time,
+        "score_time": score_time,
+        "fold_time": time.perf_counter() - fold_start,
+        "predictions": y_pred,
+    }
+
+
+def _out_of_fold(splits, folds, n_samples: int) -> np.ndarray:
+    """Average each row's held-out predictions over the repeats (NaN if never held out)."""
+    test_rows = np.concatenate([test for _, test in splits])
+    predictions = np.concatenate([fold["predictions"] for fold in folds]).astype(np.float64, copy=False)
+    totals = np.bincount(test_rows, weights=predictions, minlength=n_samples)
+    counts = np.bincount(test_rows, minlength=n_samples)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return totals / counts
+
+
+def parallel_cross_validate(
+    estimator: Any,
+    X: Any,
+    y: Any,
+    *,
+    cv: Any,
+    scoring: Scoring,
+    n_cpus: int = 1,
+    backend: str = "loky",
+    return_predictions: bool = False,
+) -> Dict[str, Any]:
+    """Evaluate *estimator* over the folds of *cv* in parallel.
+
+    Parameters
+    ----------
+    estimator
+        Fitted or unfitted estimator; every fold fits a fresh clone.
+    X, y
+        Training data (DataFrame/Series or arrays).
+    cv
+        A scikit-learn splitter such as ``RepeatedKFold``.
+    scoring
+        Mapping of metric name to ``scorer(estimator, X, y)``, or one callable
+        ``scorer(estimator, X, y) -> {metric: value}`` such as
+        :class:`scripts.scoring.FusedScorer`.
+    n_cpus
+        Total CPU budget.  Folds run ``min(n_cpus, n_folds)`` at a time and
+        each fold is limited to ``n_cpus // concurrent_folds`` threads.
+    backend
+        joblib backend: ``"loky"`` (processes) or ``"threading"``.
+    return_predictions
+        Also return ``oof_predictions``: every row's held-out prediction,
+        averaged over the repeats of *cv*.  Scorers with a
+        ``score_predictions`` method reuse these instead of predicting again.
+
+    Returns
+    -------
+    Dict[str, Any]
+        ``test_<metric>``, ``fit_time``, ``score_time`` and ``fold_time`` arrays
+        (one entry per fold, like ``cross_validate``) plus ``n_jobs``,
+        ``threads_per_fold`` and the overall ``wall_time``; ``oof_predictions``
+        when requested.
+    """
+    splits = list(cv.split(X, y))
+    n_jobs, n_threads = fold_parallelism(n_cpus, len(splits))
+
+    wall_start = time.perf_counter()
+    if n_jobs == 1:
+        folds = [
+            _fit_and_score(estimator, X, y, train, test, scoring, n_threads, return_predictions)
+            for train, test in splits
+        ]
+    else:
+        folds = Parallel(n_jobs=n_jobs, backend=backend)(
+            delayed(_fit_and_score)(estimator, X, y, train, test, scoring, n_threads, return_predictions)
+            for train, test in splits
+        )
+    wall_time = time.perf_counter() - wall_start
+
+    results: Dict[str, Any] = {
+        f"test_{name}": np.array([fold["scores"][name] for fold in folds]) for name in folds[0]["scores"]
+    }
+    for key in ("fit_time", "score_time", "fold_time"):
+        results[key] = np.array([fold[key] for fold in folds])
+    results.update(n_jobs=n_jobs, threads_per_fold=n_threads, wall_time=wall_time)
+    if return_predictions:
+        results["oof_predictions"] = _out_of_fold(splits, folds, len(y))
+    return results
+
+
+def shutdown_fold_workers() -> None:
+    """Stop the reusable ``loky`` worker pool started by :func:`parallel_cross_validate`.
+
+    Call this before a worker process exits: live pool workers keep it from
+    terminating, so the parent would block in ``join()``.
+    """
+    from joblib.externals.loky import reusable_executor
+
+    executor = getattr(reusable_executor, "_executor", None)
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+__all__ = ["fold_parallelism", "limit_estimator_threads", "parallel_cross_validate", "shutdown_fold_workers"]
@@ -1,26 +1,330 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+_CSV_SUFFIXES = {".csv"}
+_PARQUET_SUFFIXES = {".parquet", ".pq"}
+_ARROW_SUFFIXES = {".feather", ".arrow", ".ipc"}
+_SUPPORTED_SUFFIXES = _CSV_SUFFIXES | _PARQUET_SUFFIXES | _ARROW_SUFFIXES
+
+# Binary copy written next to a CSV the first time it is parsed, e.g.
+# ``predictors.csv`` -> ``predictors.csv.feather``.  Feather v2 is the Arrow
+# IPC file format: it supports column projection and can be memory-mapped.
+SIDECAR_SUFFIX = ".feather"
+_SIDECAR_META_KEY = b"automl:source"
+# Memory-mapped predictor caches: ``predictors.csv`` -> ``predictors.csv.float32.npy``
+# plus a JSON file holding the source fingerprint and the column names.
+MMAP_DTYPES = ("float32", "float64")
+
+# Rows per chunk yielded by :func:`iter_data_chunks`.
+DEFAULT_CHUNK_ROWS = 100_000
+
+# Precision modes accepted by :func:`downcast_dtypes`.
+PRECISIONS = ("float64", "float32")
+# Object columns whose distinct-value ratio is at most this become ``category``.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Bytes hashed from the head and the tail of the source file.  Combined with
+# size and mtime this catches in-place edits without re-reading multi-GB files.
+_FINGERPRINT_BLOCK = 1 << 20
+
+
+def _fingerprint(path: Path) -> Dict[str, Any]:
+    """Return a cheap identity of *path*: size, mtime and a sampled digest."""
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        digest.update(f.read(_FINGERPRINT_BLOCK))
+        if stat.st_size > 2 * _FINGERPRINT_BLOCK:
+            f.seek(-_FINGERPRINT_BLOCK, os.SEEK_END)
+            digest.update(f.read(_FINGERPRINT_BLOCK))
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest.hexdigest()}
+
+
+def sidecar_path(path: str | Path) -> Path:
+    """Location of the binary sidecar cached for the CSV at *path*."""
+    path = Path(path)
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def _read_sidecar(csv_path: Path, columns: Sequence[str] | None) -> pd.DataFrame | None:
+    """Return the sidecar contents if it exists and still matches *csv_path*."""
+    side = sidecar_path(csv_path)
+    if not side.exists():
+        return None
+    try:
+        import pyarrow.feather as feather
+        import pyarrow.ipc as ipc
+
+        with ipc.open_file(str(side)) as reader:
+            meta = (reader.schema.metadata or {}).get(_SIDECAR_META_KEY)
+        if meta is None or json.loads(meta) != _fingerprint(csv_path):
+            logger.info("Binary sidecar %s is stale; re-parsing %s", side, csv_path)
+            return None
+        table = feather.read_table(str(side), columns=list(columns) if columns else None, memory_map=True)
+    except ImportError:
+        return None
+    except Exception as exc:  # noqa: BLE001 – a broken cache must never break loading
+        logger.warning("Ignoring unreadable sidecar %s: %s", side, exc)
+        return None
+    return table.to_pandas()
+
+
+def _write_sidecar(csv_path: Path, df: pd.DataFrame) -> None:
+    """Persist *df* as a Feather sidecar tagged with the CSV fingerprint."""
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError:
+        logger.debug("pyarrow not installed; skipping binary sidecar for %s", csv_path)
+        return
+
+    side = sidecar_path(csv_path)
+    tmp = side.with_name(side.name + ".tmp")
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_SIDECAR_META_KEY] = json.dumps(_fingerprint(csv_path)).encode()
+        table = table.replace_schema_metadata(metadata)
+        # Uncompressed so that later reads can memory-map the columns.
+        feather.write_feather(table, str(tmp), compression="uncompressed")
+        os.replace(tmp, side)
+        logger.info("Wrote binary sidecar %s", side)
+    except Exception as exc:  # noqa: BLE001 – caching is best effort (e.g. read-only dirs)
+        logger.warning("Could not write binary sidecar for %s: %s", csv_path, exc)
+        tmp.unlink(missing_ok=True)
+
+
+def downcast_dtypes(
+    df: pd.DataFrame,
+    precision: str = "float32",
+    *,
+    category_max_unique_ratio: float = CATEGORY_MAX_UNIQUE_RATIO,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Shrink the dtypes of *df* and report the memory saved.
+
+    With ``precision="float32"`` float columns become ``float32``, integer
+    columns the narrowest integer type holding their range, and object
+    columns with few distinct values ``category``.  ``"float64"`` leaves the
+    frame untouched.  Unchanged columns are not copied.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, Dict[str, Any]]
+        The downcast frame and ``{"precision", "bytes_before", "bytes_after",
+        "bytes_saved", "converted_columns"}``.
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unsupported precision: {precision}. Choose one of {PRECISIONS}.")
+
+    bytes_before = int(df.memory_usage(deep=True).sum())
+    converted: Dict[str, str] = {}
+    if precision == "float32":
+        out = df.copy(deep=False)
+        for col in df.columns:
+            series = df[col]
+            if pd.api.types.is_float_dtype(series.dtype):
+                new = series.astype("float32", copy=False)
+            elif pd.api.types.is_integer_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                new = pd.to_numeric(series, downcast="integer")
+            elif pd.api.types.is_object_dtype(series.dtype) and len(series):
+                if series.nunique(dropna=True) > category_max_unique_ratio * len(series):
+                    continue
+                new = series.astype("category")
+            else:
+                continue
+            if new.dtype != series.dtype:
+                out[col] = new
+                converted[str(col)] = str(new.dtype)
+        df = out
+
+    bytes_after = int(df.memory_usage(deep=True).sum())
+    report = {
+        "precision": precision,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "converted_columns": converted,
+    }
+    return df, report
+
+
+def mmap_cache_path(path: str | Path, dtype: str) -> Path:
+    """Location of the ``.npy`` cache that backs a memory-mapped load of *path*."""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{dtype}.npy")
+
+
+def _load_memmap(
+    path: Path,
+    dtype: str,
+    columns: Sequence[str] | None,
+    *,
+    binary_cache: bool,
+    **kwargs,
+) -> pd.DataFrame:
+    """Return the predictors as a DataFrame over a read-only ``np.memmap``.
+
+    The matrix is converted to *dtype* once and stored as ``.npy`` next to the
+    source file; later loads only map that file.
+    """
+    from scripts.array_store import memmap_frame, open_npy, write_npy
+
+    if dtype not in MMAP_DTYPES:
+        raise ValueError(f"Unsupported memory-map dtype: {dtype}. Choose one of {MMAP_DTYPES}.")
+
+    cache = mmap_cache_path(path, dtype)
+    meta_path = cache.with_name(cache.name + ".json")
+    source = {"fingerprint": _fingerprint(path), "columns": list(columns) if columns else None, "read_kwargs": repr(sorted(kwargs.items()))}
+
+    if cache.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if meta.get("source") == source:
+            return memmap_frame(open_npy(cache), meta["columns"])
+        logger.info("Memory-map cache %s is stale; rebuilding", cache)
+
+    df = _read_table(path, columns, binary_cache=binary_cache, **kwargs)
+    non_numeric = df.columns.difference(df.select_dtypes(include=["number", "bool"]).columns)
+    if len(non_numeric):
+        raise ValueError(
+            "Memory-mapped loading needs all-numeric predictors; non-numeric columns: "
+            + ", ".join(map(str, non_numeric))
+        )
+    # Columns are converted one at a time straight into the memmap, so the
+    # text-parsed frame is the only full copy ever held in memory.
+    n_rows = len(df)
+    chunk = 65_536
+    matrix = write_npy(
+        cache,
+        shape=(n_rows, df.shape[1]),
+        dtype=dtype,
+        chunks=(df.iloc[start:start + chunk].to_numpy(dtype=dtype) for start in range(0, max(n_rows, 1), chunk)),
+    )
+    names = [str(c) for c in df.columns]
+    meta_path.write_text(json.dumps({"source": source, "columns": names}))
+    return memmap_frame(matrix, names)
+
+
+def _read_arrow(path: Path, columns: Sequence[str] | None) -> pd.DataFrame:
+    """Read an Arrow IPC file (Feather v2) or, failing that, an IPC stream."""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+
+    try:
+        table = feather.read_table(str(path), columns=list(columns) if columns else None, memory_map=True)
+    except pa.ArrowInvalid:
+        with ipc.open_stream(pa.memory_map(str(path))) as reader:
+            table = reader.read_all()
+        if columns:
+            table = table.select(list(columns))
+    return table.to_pandas()
+
+
+def _read_table(
+    path: Path,
+    columns: Sequence[str] | None = None,
+    *,
+    binary_cache: bool = False,
+    **kwargs,
+) -> pd.DataFrame:
+    """Read a single tabular file, dispatching on its suffix."""
+    suffix = path.suffix.lower()
+    if suffix in _CSV_SUFFIXES:
+        # Extra read_csv options change what the parse produces, so the
+        # sidecar is only trusted for the plain default parse.
+        use_sidecar = binary_cache and not kwargs
+        if use_sidecar:
+            df = _read_sidecar(path, columns)
+            if df is not None:
+                return df
+            df = pd.read_csv(path)
+            _write_sidecar(path, df)
+            return df[list(columns)] if columns else df
+        return pd.read_csv(path, usecols=list(columns) if columns else None, **kwargs)
+    if suffix in _PARQUET_SUFFIXES:
+        return pd.read_parquet(path, columns=list(columns) if columns else None, **kwargs)
+    if suffix in _ARROW_SUFFIXES:
+        return _read_arrow(path, columns)
+    raise ValueError(f"Unsupported file format: {path.suffix}")
+
+
+def _resolve_paths(predictors_path: str | Path, target_path: str | Path) -> Tuple[Path, Path]:
+    """Resolve dataset directories to their files and validate both paths."""
+    predictors_path = Path(predictors_path)
+    target_path = Path(target_path)
+
+    if predictors_path.is_dir():
+        predictor_files = list(predictors_path.glob("[Pp]redictors*Full_*.csv"))
+        if len(predictor_files) != 1:
+            raise FileNotFoundError(f"Expected exactly one predictors file in {predictors_path}, found {len(predictor_files)}. Please specify the exact file path or ensure a unique predictor file.")
+        predictors_path = predictor_files[0]
+
+    if target_path.is_dir():
+        target_files = list(target_path.glob("targets_Hold 1 Full_*.csv"))
+        if len(target_files) != 1:
+            raise FileNotFoundError(f"Expected exactly one targets file in {target_path}, found {len(target_files)}. Please specify the exact file path or ensure a unique target file.")
+        target_path = target_files[0]
+
+    if not predictors_path.exists():
+        raise FileNotFoundError(f"Predictors file not found: {predictors_path}")
+    if not target_path.exists():
+        raise FileNotFoundError(f"Target file not found: {target_path}")
+
+    for role, path in (("predictors", predictors_path), ("target", target_path)):
+        if path.suffix.lower() not in _SUPPORTED_SUFFIXES:
+            raise ValueError(f"Unsupported {role} file format: {path.suffix}")
+
+    return predictors_path, target_path
+
+
 def load_data(
     predictors_path: str | Path,
     target_path: str | Path,
+    *,
+    columns: Sequence[str] | None = None,
+    binary_cache: bool = True,
+    mmap_dtype: str | None = None,
+    precision: str | None = None,
     **kwargs
 ) -> Tuple[pd.DataFrame, pd.Series]:
     """Load predictor and target data from specified paths.
 
-    Supports CSV and conceptually, Parquet files. For Parquet, it's a placeholder
-    and would require `pyarrow` or `fastparquet`.
+    Supports CSV, Parquet (``.parquet``/``.pq``) and Arrow IPC / Feather
+    (``.feather``/``.arrow``/``.ipc``) files.  The binary formats require
+    ``pyarrow``.  The first time a CSV is parsed a Feather copy is written
+    next to it (see :func:`sidecar_path`); later calls read that copy as long
+    as the CSV's size, modification time and sampled hash are unchanged.
 
     Parameters
     ----------
     predictors_path : str | Path
-        Path to the predictors data file (CSV or Parquet).
+        Path to the predictors data file.
     target_path : str | Path
-        Path to the target data file (CSV or Parquet).
+        Path to the target data file.
+    columns : Sequence[str] | None, optional
+        Load only these predictor columns.  Binary formats read just the
+        requested columns from disk.
+    binary_cache : bool, default True
+        Read and maintain the binary sidecar for CSV inputs.  The sidecar is
+        bypassed when extra ``read_csv`` keyword arguments are given.
+    mmap_dtype : {"float32", "float64"} | None, optional
+        Return the predictors as a DataFrame over a read-only ``np.memmap`` of
+        this dtype.  The converted matrix is cached as ``.npy`` next to the
+        predictors file (see :func:`mmap_cache_path`) so that every process
+        mapping it shares one copy in the page cache.  All predictor columns
+        must be numeric.
+    precision : {"float64", "float32"} | None, optional
+        Downcast the predictors with :func:`downcast_dtypes` after loading.
     **kwargs
         Additional keyword arguments to pass to the underlying data loading function.
 
@@ -36,43 +340,15 @@ def load_data(
     FileNotFoundError
         If the specified paths do not exist.
     """
-    predictors_path = Path(predictors_path)
-    target_path = Path(target_path)
-
-    if predictors_path.is_dir():
-        predictor_files = list(predictors_path.glob("[Pp]redictors*Full_*.csv"))
-        if len(predictor_files) != 1:
-            raise FileNotFoundError(f"Expected exactly one predictors file in {predictors_path}, found {len(predictor_files)}. Please specify the exact file path or ensure a unique predictor file.")
-        predictors_path = predictor_files[0]
-
-    if target_path.is_dir():
-        target_files = list(target_path.glob("targets_Hold 1 Full_*.csv"))
-        if len(target_files) != 1:
-            raise FileNotFoundError(f"Expected exactly one targets file in {target_path}, found {len(target_files)}. Please specify the exact file path or ensure a unique target file.")
-        target_path = target_files[0]
+    predictors_path, target_path = _resolve_paths(predictors_path, target_path)
 
-    if not predictors_path.exists():
-        raise FileNotFoundError(f"Predictors file not found: {predictors_path}")
-    if not target_path.exists():
-        raise FileNotFoundError(f"Target file not found: {target_path}")
-
-    if predictors_path.suffix == ".csv":
-        X = pd.read_csv(predictors_path, **kwargs)
-    # elif predictors_path.suffix == ".parquet":
-    #     # Placeholder for Parquet support
-    #     # X = pd.read_parquet(predictors_path, **kwargs)
-    #     raise ValueError("Parquet support is not yet implemented.")
-    else:
-        raise ValueError(f"Unsupported predictors file format: {predictors_path.suffix}")
-
-    if target_path.suffix == ".csv":
-        y = pd.read_csv(target_path, **kwargs).squeeze()
-    # elif target_path.suffix == ".parquet":
-    #     # Placeholder for Parquet support
-    #     # y = pd.read_parquet(target_path, **kwargs).squeeze()
-    #     raise ValueError("Parquet support is not yet implemented.")
+    if mmap_dtype is not None:
+        X = _load_memmap(predictors_path, mmap_dtype, columns, binary_cache=binary_cache, **kwargs)
     else:
-        raise ValueError(f"Unsupported target file format: {target_path.suffix}")
+        X = _read_table(predictors_path, columns, binary_cache=binary_cache, **kwargs)
+    if precision is not None:
+        X, _ = downcast_dtypes(X, precision)
+    y = _read_table(target_path, binary_cache=binary_cache, **kwargs).squeeze()
 
     if y.ndim > 1:
         raise ValueError("Target file must contain a single target column.")
@@ -80,4 +356,106 @@ def load_data(
     return X, y
 
 
-__all__ = ["load_data"] 
+def _iter_table(path: Path, chunk_rows: int, columns: Sequence[str] | None = None) -> Iterator[pd.DataFrame]:
+    """Yield *path* as DataFrames of at most *chunk_rows* rows."""
+    suffix = path.suffix.lower()
+    if suffix in _CSV_SUFFIXES:
+        with pd.read_csv(path, usecols=list(columns) if columns else None, chunksize=chunk_rows) as reader:
+            yield from reader
+    elif suffix in _PARQUET_SUFFIXES:
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=list(columns) if columns else None):
+            yield batch.to_pandas()
+    elif suffix in _ARROW_SUFFIXES:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+
+        source = pa.memory_map(str(path))
+        try:
+            reader = ipc.open_file(source)
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        except pa.ArrowInvalid:
+            source.seek(0)
+            batches = iter(ipc.open_stream(source))
+        # Record batches have whatever size the writer chose; regroup them
+        # into chunk_rows-row chunks like the CSV and Parquet readers.
+        pending: List[Any] = []
+        n_pending = 0
+        for batch in batches:
+            if columns:
+                batch = batch.select(list(columns))
+            start = 0
+            while start < batch.num_rows:
+                piece = batch.slice(start, chunk_rows - n_pending)
+                pending.append(piece)
+                n_pending += piece.num_rows
+                start += piece.num_rows
+                if n_pending == chunk_rows:
+                    yield pa.Table.from_batches(pending).to_pandas()
+                    pending, n_pending = [], 0
+        if n_pending:
+            yield pa.Table.from_batches(pending).to_pandas()
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}")
+
+
+def dataset_fingerprint(predictors_path: str | Path, target_path: str | Path) -> str:
+    """Cheap identity of a predictors/target file pair (size, mtime, sampled bytes).
+
+    Lets callers that only stream the data key caches without hashing every
+    row the way ``run_cache.fingerprint_data`` does for in-memory frames.
+    """
+    paths = _resolve_paths(predictors_path, target_path)
+    payload = json.dumps([_fingerprint(path) for path in paths], sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def iter_data_chunks(
+    predictors_path: str | Path,
+    target_path: str | Path,
+    *,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    columns: Sequence[str] | None = None,
+) -> Iterator[Tuple[pd.DataFrame, pd.Series]]:
+    """Stream aligned ``(X, y)`` row chunks without loading either file whole.
+
+    Accepts the same paths and formats as :func:`load_data` (binary formats
+    need ``pyarrow``).  Chunks carry the running row position as their index
+    whatever the format, and each target chunk shares its predictor chunk's
+    index, so the pairs can be used together directly.  Every call starts a
+    fresh pass over the files.
+
+    Raises
+    ------
+    ValueError
+        If the two files have different row counts or the target file has
+        more than one column.
+    """
+    predictors_path, target_path = _resolve_paths(predictors_path, target_path)
+    targets = _iter_table(target_path, chunk_rows)
+    start = 0
+    for X_chunk in _iter_table(predictors_path, chunk_rows, columns):
+        y_chunk = next(targets, None)
+        if y_chunk is None or len(y_chunk) != len(X_chunk):
+            raise ValueError(f"Predictors {predictors_path} and target {target_path} have different row counts.")
+        if y_chunk.shape[1] != 1:
+            raise ValueError("Target file must contain a single target column.")
+        X_chunk.index = pd.RangeIndex(start, start + len(X_chunk))
+        start += len(X_chunk)
+        yield X_chunk, pd.Series(y_chunk.iloc[:, 0].to_numpy(), index=X_chunk.index, name=y_chunk.columns[0])
+    if next(targets, None) is not None:
+        raise ValueError(f"Predictors {predictors_path} and target {target_path} have different row counts.")
+
+
+__all__ = [
+    "DEFAULT_CHUNK_ROWS",
+    "MMAP_DTYPES",
+    "PRECISIONS",
+    "dataset_fingerprint",
+    "downcast_dtypes",
+    "iter_data_chunks",
+    "load_data",
+    "mmap_cache_path",
+    "sidecar_path",
+]
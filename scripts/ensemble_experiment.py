@@ -3,9 +3,11 @@
 
 This script demonstrates how to combine the champion models from all
 three AutoML engines with a linear-weighted ensemble. It runs the
-orchestrator on the provided dataset, collects predictions from each
-engine on a hold-out set, fits a linear regression as the meta-model,
-and reports the resulting R² score.
+orchestrator on the provided dataset, fits a linear regression meta-model
+on the engines' cached out-of-fold CV predictions (so the meta-model never
+sees predictions on rows a champion was trained on), compares it with
+greedy (Caruana) ensemble selection over the same predictions, and reports
+the hold-out R² of each.
 """
 from __future__ import annotations
 
@@ -19,6 +21,8 @@ from sklearn.metrics import r2_score
 from sklearn.model_selection import train_test_split
 
 from scripts.data_loader import load_data
+from scripts.ensemble_selection import greedy_ensemble_selection
+from scripts.oof_store import OOFStore
 import orchestrator
 
 
@@ -30,6 +34,9 @@ def main() -> None:
         "--time", type=int, default=60, help="Time limit per engine (s)"
     )
     args = parser.parse_args()
+    # Importing orchestrator does not set up logging; without this its
+    # search and CV progress messages would not be shown.
+    orchestrator._configure_logging()
 
     X, y = load_data(args.data, args.target)
     X_train, X_test, y_train, y_test = train_test_split(
@@ -37,26 +44,26 @@ def main() -> None:
     )
 
     # Run all engines without ensembling to get individual champions
+    run_dir = Path("05_outputs") / "ensemble_experiment"
     champion, engines, metrics = orchestrator._meta_search_concurrent(
         X=X_train,
         y=y_train,
-        run_dir=Path("05_outputs") / "ensemble_experiment",
+        run_dir=run_dir,
         timeout_per_engine=args.time,
         metric="r2",
         enable_ensemble=False,
         n_cpus=os.cpu_count() or 1,
     )
 
-    # Gather predictions from each engine
-    train_preds = []
+    # Out-of-fold predictions cached during cross-validation train the
+    # meta-model; only the hold-out set needs fresh predictions.
+    names = list(engines)
+    stack_X_train = OOFStore.for_run(run_dir).matrix(names)
     test_preds = []
-    for name, model in engines.items():
-        train_preds.append(model.predict(X_train))
-        test_preds.append(model.predict(X_test))
+    for name in names:
+        test_preds.append(engines[name].predict(X_test))
         r2_ind = r2_score(y_test, test_preds[-1])
         print(f"{name} hold-out R²: {r2_ind:.4f}")
-
-    stack_X_train = np.column_stack(train_preds)
     stack_X_test = np.column_stack(test_preds)
 
     meta_model = LinearRegression()
@@ -65,6 +72,11 @@ def main() -> None:
     ensemble_r2 = r2_score(y_test, ensemble_preds)
     print(f"Weighted ensemble hold-out R²: {ensemble_r2:.4f}")
 
+    selection = greedy_ensemble_selection(stack_X_train, y_train, names=names)
+    greedy_r2 = r2_score(y_test, stack_X_test @ selection.weights)
+    print(f"Greedy selection weights: {selection.as_dict()}")
+    print(f"Greedy ensemble hold-out R²: {greedy_r2:.4f}")
+
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
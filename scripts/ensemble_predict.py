@@ -0,0 +1,159 @@
+"""Concurrent, batched prediction for averaging ensembles.
+
+``_MeanEnsembleRegressor`` used to call every member's ``predict`` one after
+another and stack the results with ``np.array([...])`` – a second full-size
+copy of all member predictions just to take their mean.  :func:`weighted_predict`
+instead
+
+* splits large inputs into row batches, so member predictions never exist for
+  the whole input at once,
+* runs the ``(batch, model)`` tasks on a thread or process pool, and
+* accumulates ``weight * prediction`` into a single preallocated output array
+  as the tasks finish.
+
+Threads suit models whose ``predict`` releases the GIL (NumPy/BLAS heavy
+estimators, tree ensembles in C); processes suit pure-Python pipelines.  With
+the process executor the models are pickled to each worker once, via the pool
+initializer, rather than with every task.
+"""
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import multiprocessing as mp
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+EXECUTORS = ("thread", "process")
+# Rows per batch when the caller does not choose; bounds the memory used by
+# in-flight member predictions.
+DEFAULT_BATCH_SIZE = 100_000
+
+# Models held by each worker process of the "process" executor.
+_WORKER_MODELS: List[Any] = []
+
+
+def _init_worker(models: Sequence[Any]) -> None:
+    global _WORKER_MODELS
+    _WORKER_MODELS = list(models)
+
+
+def _predict_in_worker(model_index: int, X: Any) -> np.ndarray:
+    return np.asarray(_WORKER_MODELS[model_index].predict(X))
+
+
+def _predict_local(model: Any, X: Any) -> np.ndarray:
+    return np.asarray(model.predict(X))
+
+
+def _slice_rows(X: Any, start: int, stop: int) -> Any:
+    return X.iloc[start:stop] if hasattr(X, "iloc") else X[start:stop]
+
+
+def _batches(n_rows: int, batch_size: int | None) -> List[Tuple[int, int]]:
+    size = n_rows if not batch_size or batch_size <= 0 else batch_size
+    return [(start, min(start + size, n_rows)) for start in range(0, n_rows, max(size, 1))]
+
+
+def _normalised(weights: Sequence[float] | None, n_models: int) -> np.ndarray:
+    if weights is None:
+        return np.full(n_models, 1.0 / n_models)
+    w = np.asarray(weights, dtype=np.float64)
+    if w.shape != (n_models,):
+        raise ValueError(f"Expected {n_models} weights, got {w.shape[0] if w.ndim else 0}.")
+    if (w < 0).any() or w.sum() <= 0:
+        raise ValueError("Ensemble weights must be non-negative with a positive sum.")
+    return w / w.sum()
+
+
+def _make_executor(kind: str, n_jobs: int, models: Sequence[Any]) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=n_jobs)
+    if kind == "process":
+        return ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(list(models),),
+        )
+    raise ValueError(f"Unknown executor {kind!r}; choose from {EXECUTORS}.")
+
+
+def weighted_predict(
+    models: Sequence[Any],
+    X: Any,
+    *,
+    weights: Sequence[float] | None = None,
+    n_jobs: int = 1,
+    executor: str = "thread",
+    batch_size: int | None = DEFAULT_BATCH_SIZE,
+) -> np.ndarray:
+    """Weighted average of ``model.predict(X)`` over *models*.
+
+    Parameters
+    ----------
+    models
+        Fitted regressors.
+    X
+        Input rows (DataFrame or array).
+    weights
+        One non-negative weight per model; normalised to sum to one.  Models
+        with zero weight are skipped.  ``None`` means a plain mean.
+    n_jobs
+        Number of concurrent ``predict`` calls.  ``1`` runs serially without
+        a pool.
+    executor
+        ``"thread"`` or ``"process"``.
+    batch_size
+        Rows per ``predict`` call; ``None`` or ``0`` predicts all rows at once.
+
+    Returns
+    -------
+    np.ndarray
+        ``float64`` predictions of shape ``(n_rows,)``.
+    """
+    if not models:
+        raise ValueError("Cannot predict with an empty ensemble.")
+    w = _normalised(weights, len(models))
+    active = [j for j in range(len(models)) if w[j] > 0]
+    n_rows = len(X)
+    out = np.zeros(n_rows, dtype=np.float64)
+    scratch = np.empty(min(n_rows, batch_size or n_rows) or 1, dtype=np.float64)
+
+    def _accumulate(start: int, stop: int, j: int, pred: np.ndarray) -> None:
+        pred = pred.reshape(-1)
+        if pred.shape[0] != stop - start:
+            raise ValueError(f"Model {j} returned {pred.shape[0]} predictions for {stop - start} rows.")
+        buf = scratch[: stop - start]
+        np.multiply(pred, w[j], out=buf, casting="unsafe")
+        out[start:stop] += buf
+
+    tasks = [(start, stop, j) for start, stop in _batches(n_rows, batch_size) for j in active]
+    if n_jobs <= 1:
+        for start, stop, j in tasks:
+            _accumulate(start, stop, j, _predict_local(models[j], _slice_rows(X, start, stop)))
+        return out
+
+    with _make_executor(executor, n_jobs, models) as pool:
+        # Keep a bounded window of tasks in flight so that only a few batches
+        # of member predictions are alive at any time.
+        pending: Dict[Future, Tuple[int, int, int]] = {}
+        queue = deque(tasks)
+        while queue or pending:
+            while queue and len(pending) < 2 * n_jobs:
+                start, stop, j = queue.popleft()
+                X_batch = _slice_rows(X, start, stop)
+                if executor == "process":
+                    future = pool.submit(_predict_in_worker, j, X_batch)
+                else:
+                    future = pool.submit(_predict_local, models[j], X_batch)
+                pending[future] = (start, stop, j)
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, stop, j = pending.pop(future)
+                _accumulate(start, stop, j, future.result())
+    return out
+
+
+__all__ = ["DEFAULT_BATCH_SIZE", "EXECUTORS", "weighted_predict"]
@@ -0,0 +1,100 @@
+"""Greedy forward ensemble selection (Caruana et al., 2004).
+
+Starting from an empty ensemble, each step adds – *with replacement* – the
+model whose inclusion gives the best score of the averaged prediction.  The
+number of times a model was picked, divided by the number of steps, is its
+blend weight.  Because the search only needs each model's out-of-fold
+predictions (see ``scripts.oof_store``) it never calls ``predict`` and runs
+in milliseconds even for many candidates.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, List, Sequence
+
+import numpy as np
+
+from scripts.scoring import GREATER_IS_BETTER, regression_metrics
+
+DEFAULT_ITERATIONS = 50
+
+
+@dataclass
+class EnsembleSelection:
+    """Outcome of :func:`greedy_ensemble_selection`."""
+
+    names: List[str]
+    weights: np.ndarray
+    score: float
+    metric: str
+    history: List[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        """Non-zero weights keyed by model name (JSON friendly)."""
+        return {name: float(w) for name, w in zip(self.names, self.weights) if w > 0}
+
+
+def greedy_ensemble_selection(
+    predictions: np.ndarray,
+    y: Any,
+    *,
+    names: Sequence[str] | None = None,
+    metric: str = "r2",
+    n_iterations: int = DEFAULT_ITERATIONS,
+) -> EnsembleSelection:
+    """Choose blend weights from an ``(n_samples, n_models)`` OOF matrix.
+
+    Parameters
+    ----------
+    predictions
+        Out-of-fold predictions, one column per model.  Rows containing NaN
+        (never held out) are ignored.
+    y
+        Target aligned with the rows of *predictions*.
+    names
+        Model names for the columns; defaults to ``model_<j>``.
+    metric
+        Any metric of ``scripts.scoring.METRICS``.
+    n_iterations
+        Number of greedy steps; the weights use the best step seen.
+
+    Returns
+    -------
+    EnsembleSelection
+        Normalised weights, the best score and the per-step score history.
+    """
+    P = np.asarray(predictions, dtype=np.float64)
+    if P.ndim != 2 or P.shape[1] == 0:
+        raise ValueError("predictions must be a 2-D array with at least one column.")
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if len(y) != P.shape[0]:
+        raise ValueError(f"y has {len(y)} rows but predictions have {P.shape[0]}.")
+    n_models = P.shape[1]
+    names = [f"model_{j}" for j in range(n_models)] if names is None else list(names)
+
+    valid = ~np.isnan(P).any(axis=1)
+    P, y = P[valid], y[valid]
+    sign = 1.0 if metric in GREATER_IS_BETTER else -1.0
+
+    counts = np.zeros(n_models, dtype=np.int64)
+    running_sum = np.zeros(len(y), dtype=np.float64)
+    best_counts, best_score = counts.copy(), -np.inf
+    history: List[float] = []
+
+    for step in range(1, max(1, n_iterations) + 1):
+        # Score every candidate addition; ties go to the lowest column index.
+        scores = np.array(
+            [sign * regression_metrics(y, (running_sum + P[:, j]) / step, (metric,))[metric] for j in range(n_models)]
+        )
+        choice = int(np.argmax(scores))
+        counts[choice] += 1
+        running_sum += P[:, choice]
+        history.append(sign * scores[choice])
+        if scores[choice] > best_score:
+            best_score, best_counts = scores[choice], counts.copy()
+
+    weights = best_counts / best_counts.sum()
+    return EnsembleSelection(names=names, weights=weights, score=sign * best_score, metric=metric, history=history)
+
+
+__all__ = ["DEFAULT_ITERATIONS", "EnsembleSelection", "greedy_ensemble_selection"]
@@ -1,12 +1,427 @@
+"""Feature engineering: target encoding, interactions, scaling and PCA.
+
+:class:`FeatureEngineer` learns everything the transform needs in ``fit`` –
+the smoothed per-level target means of categorical columns
+(``scripts.target_encoding``; training rows get out-of-fold encodings so the
+target does not leak into cross-validation), the interaction pairs,
+the scaler and the PCA basis – so ``transform`` can replay it on the hold-out
+split or on new rows at inference time without refitting.  The fitted object
+pickles; :func:`engineer_features` can keep it in a cache directory keyed by
+a hash of the data and the settings, so repeat runs only transform.
+
+For data larger than memory, :meth:`FeatureEngineer.fit_stream` fits the
+same transform from row chunks in two passes (target statistics first, then
+scaler moments and the covariance of the engineered columns), and
+:func:`engineer_features_streaming` writes the transformed chunks to an
+on-disk column-major ``.npy`` store that the engines memory-map.
+"""
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.utils.validation import check_is_fitted
+
+from scripts.interactions import InteractionGenerator
+from scripts.pca_backends import INCREMENTAL_MAX_COMPONENTS, VariancePCA
+from scripts.target_encoding import TargetEncoder
+
+logger = logging.getLogger(__name__)
+
+# Part of the cache key, so fitted objects from older code are not reused.
+_SOURCE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:12]
+
+# Streaming fits accumulate an exact covariance up to this many engineered
+# columns (a p x p float64 matrix: 128 MiB at the limit) and fall back to an
+# extra pass of ``IncrementalPCA`` beyond it.
+STREAM_COVARIANCE_MAX_FEATURES = 4_096
+
+# A zero-argument callable that starts a fresh pass over ``(X, y)`` chunks,
+# e.g. ``functools.partial(data_loader.iter_data_chunks, X_path, y_path)``.
+ChunkSource = Callable[[], Iterable[Tuple[pd.DataFrame, pd.Series]]]
+
+
+class FeatureEngineer(TransformerMixin, BaseEstimator):
+    """Fitted, serialisable feature-engineering transform.
+
+    Parameters
+    ----------
+    dtype : {"float32", "float64"} | None
+        Floating-point type used for encodings, interactions, scaling and
+        PCA.  By default ``float32`` is kept when every float column of ``X``
+        already is ``float32`` (see ``data_loader.downcast_dtypes``), and
+        ``float64`` is used otherwise.
+    n_interaction_columns : int | None
+        Candidate columns of the interaction stage: the first this many
+        numeric columns (after target encoding), or the best-scoring ones
+        with ``interaction_screen``.  ``None`` considers every column.
+    interaction_degree : int
+        Highest order of the products (2 = pairs).
+    max_interactions : int | None
+        Cap on the number of product features.
+    interaction_screen : {None, "correlation", "mutual_info"}
+        Target-based score that picks the candidate columns and the products
+        kept under ``max_interactions`` (see ``scripts.interactions``).
+    pca_variance : float
+        Share of variance the principal components must explain.
+    pca_backend : {"auto", "full", "randomized", "incremental"}
+        SVD strategy of the PCA step (see ``scripts.pca_backends``).
+    encoding_smoothing : float
+        Weight of the global target mean in the smoothed level means.
+    encoding_folds : int
+        Folds of the out-of-fold target encoding of the training rows;
+        ``< 2`` encodes them with the full-data means.
+
+    Attributes
+    ----------
+    encoder_ : TargetEncoder | None
+        Target encoder of the categorical columns (``None`` without ``y``).
+        Unseen levels are encoded as its global mean.
+    interactions_ : InteractionGenerator
+        Fitted interaction stage; ``interactions_.combinations_`` lists the
+        column tuples multiplied into ``<a>_x_<b>`` features.
+    numeric_columns_, passthrough_columns_ : list
+        Columns fed to the scaler/PCA, and non-numeric columns returned as-is.
+    pipeline_ : Pipeline
+        Fitted ``StandardScaler`` + ``PCA``.
+    """
+
+    def __init__(
+        self,
+        *,
+        dtype: str | None = None,
+        n_interaction_columns: int | None = 3,
+        interaction_degree: int = 2,
+        max_interactions: int | None = None,
+        interaction_screen: str | None = None,
+        pca_variance: float = 0.95,
+        pca_backend: str = "auto",
+        encoding_smoothing: float = 10.0,
+        encoding_folds: int = 5,
+    ):
+        self.dtype = dtype
+        self.n_interaction_columns = n_interaction_columns
+        self.interaction_degree = interaction_degree
+        self.max_interactions = max_interactions
+        self.interaction_screen = interaction_screen
+        self.pca_variance = pca_variance
+        self.pca_backend = pca_backend
+        self.encoding_smoothing = encoding_smoothing
+        self.encoding_folds = encoding_folds
+
+    @property
+    def named_steps(self) -> Dict[str, Any]:
+        """Steps of the fitted scaler/PCA pipeline (``named_steps["pca"]``)."""
+        check_is_fitted(self, "pipeline_")
+        return self.pipeline_.named_steps
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+    def fit(self, X: pd.DataFrame, y: pd.Series | None = None) -> "FeatureEngineer":
+        self.fit_transform(X, y)
+        return self
+
+    def fit_transform(self, X: pd.DataFrame, y: pd.Series | None = None, *, out_dir: str | Path | None = None) -> pd.DataFrame:
+        """Fit on ``X``/``y`` and return the transformed ``X`` (see :meth:`transform`).
+
+        Categorical columns of the returned rows carry their out-of-fold
+        encoding, as ``transform(X, out_of_fold=True)`` would give.
+        """
+        self._resolve_dtype(X)
+
+        # Shallow copy: columns are only ever replaced or appended below, never
+        # modified in place, so a (possibly memory-mapped) X is not duplicated.
+        df = X.copy(deep=False)
+
+        self.encoder_ = self._new_encoder() if y is not None else None
+        if self.encoder_ is not None:
+            encoded = self.encoder_.fit_transform(df, y)
+            if self.encoder_.columns_:
+                df[self.encoder_.columns_] = encoded
+
+        df = self._fit_layout(df, y)
+        self.pipeline_ = Pipeline([
+            ("scale", StandardScaler()),
+            ("pca", VariancePCA(n_components=self.pca_variance, backend=self.pca_backend)),
+        ])
+        # Scaler and PCA preserve float32 input, halving memory and BLAS work.
+        X_transformed = self.pipeline_.fit_transform(df[self.numeric_columns_].astype(self.dtype_, copy=False))
+        return self._assemble(df, X_transformed, out_dir)
+
+    # ------------------------------------------------------------------
+    # Transform-only replay
+    # ------------------------------------------------------------------
+    def transform(self, X: pd.DataFrame, *, out_dir: str | Path | None = None, out_of_fold: bool = False) -> pd.DataFrame:
+        """Apply the fitted encodings, interactions and scaler/PCA to ``X``.
+
+        When ``out_dir`` is given and the result is all-numeric, the matrix
+        is written to ``out_dir/features.npy`` and returned as a read-only
+        memory-mapped DataFrame (see ``scripts.array_store``).
+        ``out_of_fold=True`` reproduces the training-time encoding and only
+        makes sense for exactly the rows ``fit`` saw, in the same order.
+        """
+        check_is_fitted(self, "pipeline_")
+        df = X.copy(deep=False)
+        self._encode(df, out_of_fold=out_of_fold)
+        df = self._add_interactions(df)
+        X_transformed = self.pipeline_.transform(df[self.numeric_columns_].astype(self.dtype_, copy=False))
+        return self._assemble(df, X_transformed, out_dir)
+
+    # ------------------------------------------------------------------
+    # Streaming (out-of-core) fit and transform
+    # ------------------------------------------------------------------
+    def fit_stream(self, chunks: ChunkSource) -> "FeatureEngineer":
+        """Fit from row chunks without ever holding the whole data in memory.
+
+        ``chunks()`` is called once per pass and must yield the same
+        ``(X, y)`` chunks in the same order each time (see
+        :data:`ChunkSource`).  The first pass collects the row count and the
+        per-level, per-fold target sums and counts; the second fits the scaler
+        incrementally and accumulates the covariance of the engineered
+        columns, from which the PCA basis is an exact eigendecomposition.
+        Wider than :data:`STREAM_COVARIANCE_MAX_FEATURES` columns, or with
+        ``pca_backend="incremental"``, a third pass fits ``IncrementalPCA``
+        instead.  Interaction columns are chosen from the first chunk.
+
+        Every column must be numeric after target encoding, so a target is
+        required in each chunk.
+        """
+        # Pass 1: target statistics.
+        n_rows = 0
+        self.encoder_ = None
+        for X_chunk, y_chunk in chunks():
+            if self.encoder_ is None:
+                self._resolve_dtype(X_chunk)
+                self.encoder_ = self._new_encoder()
+            self.encoder_.partial_fit(X_chunk, y_chunk)
+            n_rows += len(X_chunk)
+        if n_rows < 2:
+            raise ValueError("fit_stream needs at least two rows.")
+        self.n_samples_seen_ = n_rows
+
+        # Pass 2: scaler moments and the shifted cross-product of the
+        # engineered columns.  Shifting by the first chunk's mean keeps the
+        # accumulation numerically stable for columns far from zero.
+        scaler = StandardScaler()
+        shift = cross = total = None
+        use_covariance = first = True
+        start = 0
+        for X_chunk, y_chunk in chunks():
+            df = X_chunk.copy(deep=False)
+            self._encode(df, out_of_fold=True, start=start)
+            start += len(df)
+            if first:
+                df = self._fit_layout(df, y_chunk)
+                if self.passthrough_columns_:
+                    raise ValueError(f"Columns {self.passthrough_columns_} are not numeric after encoding; streaming needs an all-numeric result.")
+                use_covariance = (
+                    self.pca_backend != "incremental"
+                    and len(self.numeric_columns_) <= STREAM_COVARIANCE_MAX_FEATURES
+                )
+            else:
+                df = self._add_interactions(df)
+            block = df[self.numeric_columns_].astype(self.dtype_, copy=False)
+            scaler.partial_fit(block)
+            if use_covariance:
+                values = block.to_numpy(dtype=np.float64)
+                if first:
+                    shift = values.mean(axis=0)
+                    cross = np.zeros((len(shift), len(shift)))
+                    total = np.zeros(len(shift))
+                values -= shift
+                total += values.sum(axis=0)
+                cross += values.T @ values
+            first = False
+
+        if use_covariance:
+            scale = scaler.scale_
+            covariance = (cross - np.outer(total, total) / n_rows) / np.outer(scale, scale) / (n_rows - 1)
+            pca = VariancePCA.from_covariance(covariance, np.zeros(len(scale)), self.pca_variance)
+        else:
+            pca = self._fit_incremental_pca(chunks, scaler)
+        self.pipeline_ = Pipeline([("scale", scaler), ("pca", pca)])
+        return self
+
+    def _fit_incremental_pca(self, chunks: ChunkSource, scaler: StandardScaler) -> VariancePCA:
+        """Third streaming pass: ``IncrementalPCA`` over the scaled chunks."""
+        from sklearn.decomposition import IncrementalPCA
+
+        n_components = min(len(self.numeric_columns_), INCREMENTAL_MAX_COMPONENTS, self.n_samples_seen_)
+        model = IncrementalPCA(n_components=n_components)
+        # partial_fit needs at least n_components rows per call, so each block
+        # is held back one step and a short block is merged into it.
+        held = None
+        start = 0
+        for X_chunk, _ in chunks():
+            block = scaler.transform(self._engineer(X_chunk, out_of_fold=True, start=start))
+            start += len(X_chunk)
+            if held is None:
+                held = block
+            elif len(held) < n_components or len(block) < n_components:
+                held = np.vstack([held, block])
+            else:
+                model.partial_fit(held)
+                held = block
+        model.partial_fit(held)
+        return VariancePCA.from_fitted(model, self.pca_variance, backend="incremental")
 
+    def transform_to_store(
+        self,
+        chunks: ChunkSource,
+        path: str | Path,
+        *,
+        out_of_fold: bool = False,
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+        """Transform every chunk into a column-major ``.npy`` store at *path*.
 
-def engineer_features(X: pd.DataFrame, y: pd.Series | None = None) -> tuple[pd.DataFrame, Pipeline]:
+        Returns the store as a read-only memory-mapped DataFrame (one
+        contiguous file range per component, see ``scripts.array_store``)
+        together with the concatenated target.  ``out_of_fold`` is as in
+        :meth:`transform`; pass it when *chunks* are the fitted rows.
+        """
+        from scripts.array_store import memmap_frame, write_npy
+
+        check_is_fitted(self, "pipeline_")
+        n_components = self.pipeline_.named_steps["pca"].n_components_
+        targets: List[np.ndarray] = []
+        name = None
+
+        def _blocks():
+            nonlocal name
+            start = 0
+            for X_chunk, y_chunk in chunks():
+                targets.append(y_chunk.to_numpy())
+                name = y_chunk.name
+                yield self.pipeline_.transform(self._engineer(X_chunk, out_of_fold=out_of_fold, start=start))
+                start += len(X_chunk)
+
+        features = write_npy(
+            path,
+            shape=(self.n_samples_seen_, n_components),
+            dtype=self.dtype_,
+            chunks=_blocks(),
+            fortran_order=True,
+        )
+        X_fe = memmap_frame(features, [f"pc{i+1}" for i in range(n_components)])
+        return X_fe, pd.Series(np.concatenate(targets), name=name)
+
+    # ------------------------------------------------------------------
+    # Shared helpers
+    # ------------------------------------------------------------------
+    def _resolve_dtype(self, X: pd.DataFrame) -> None:
+        if self.dtype is None:
+            float_dtypes = {d for d in X.dtypes if pd.api.types.is_float_dtype(d)}
+            self.dtype_ = "float32" if float_dtypes == {np.dtype("float32")} else "float64"
+        else:
+            self.dtype_ = self.dtype
+
+    def _fit_layout(self, df: pd.DataFrame, y: pd.Series | None) -> pd.DataFrame:
+        """Fit the interaction stage, add its columns to *df* and split the columns."""
+        self.interactions_ = InteractionGenerator(
+            n_columns=self.n_interaction_columns,
+            degree=self.interaction_degree,
+            max_features=self.max_interactions,
+            screen=self.interaction_screen,
+            dtype=self.dtype_,
+        ).fit(df, y)
+        df = self._add_interactions(df)
+
+        self.numeric_columns_ = list(df.select_dtypes(include="number").columns)
+        numeric = set(self.numeric_columns_)
+        self.passthrough_columns_ = [c for c in df.columns if c not in numeric]
+        return df
+
+    def _new_encoder(self) -> TargetEncoder:
+        return TargetEncoder(smoothing=self.encoding_smoothing, cv=self.encoding_folds, dtype=self.dtype_)
+
+    def _engineer(self, X: pd.DataFrame, **encode: Any) -> pd.DataFrame:
+        """Encoded and interaction-expanded numeric columns of *X*, ready to scale."""
+        df = X.copy(deep=False)
+        self._encode(df, **encode)
+        df = self._add_interactions(df)
+        return df[self.numeric_columns_].astype(self.dtype_, copy=False)
+
+    def _encode(self, df: pd.DataFrame, *, out_of_fold: bool = False, start: int = 0) -> None:
+        # Replaces the categorical columns of the (shallow-copied) frame.
+        if self.encoder_ is not None and self.encoder_.columns_:
+            df[self.encoder_.columns_] = self.encoder_.transform(df, out_of_fold=out_of_fold, start=start)
+
+    def _add_interactions(self, df: pd.DataFrame) -> pd.DataFrame:
+        # One block appended at once rather than a column insert per product.
+        names = self.interactions_.get_feature_names_out()
+        if not len(names):
+            return df
+        products = pd.DataFrame(self.interactions_.transform(df), index=df.index, columns=names)
+        return pd.concat([df, products], axis=1)
+
+    def _assemble(self, df: pd.DataFrame, X_transformed: np.ndarray, out_dir: str | Path | None) -> pd.DataFrame:
+        X_fe = pd.DataFrame(
+            X_transformed,
+            index=df.index,
+            columns=[f"pc{i+1}" for i in range(X_transformed.shape[1])],
+        )
+        if self.passthrough_columns_:
+            X_non = df[self.passthrough_columns_].reset_index(drop=True)
+            X_fe = pd.concat([X_non, X_fe.reset_index(drop=True)], axis=1)
+        elif out_dir is not None:
+            from scripts.array_store import memmap_frame, write_npy
+
+            features = write_npy(Path(out_dir) / "features.npy", X_transformed)
+            X_fe = memmap_frame(features, X_fe.columns, index=X_fe.index)
+        return X_fe
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: str | Path) -> Path:
+        """Pickle the fitted transformer to *path* (written atomically)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(self, f)
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "FeatureEngineer":
+        with open(path, "rb") as f:
+            engineer = pickle.load(f)
+        if not isinstance(engineer, cls):
+            raise TypeError(f"{path} does not contain a {cls.__name__}.")
+        return engineer
+
+
+def feature_cache_key(X: pd.DataFrame, y: pd.Series | None, engineer: FeatureEngineer) -> str:
+    """Key of a fitted transformer: data fingerprint, parameters and code version."""
+    from scripts.run_cache import fingerprint_data
+
+    data = fingerprint_data(X, y if y is not None else pd.Series(dtype="float64"))
+    payload = json.dumps({"data": data, "params": engineer.get_params(), "code": _SOURCE_DIGEST}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def engineer_features(
+    X: pd.DataFrame,
+    y: pd.Series | None = None,
+    *,
+    out_dir: str | Path | None = None,
+    dtype: str | None = None,
+    pca_backend: str = "auto",
+    cache_dir: str | Path | None = None,
+    **params: Any,
+) -> tuple[pd.DataFrame, FeatureEngineer]:
     """Apply lightweight feature engineering and dimensionality reduction.
 
     Parameters
@@ -15,48 +430,127 @@ def engineer_features(X: pd.DataFrame, y: pd.Series | None = None) -> tuple[pd.D
         Input feature matrix.
     y : pd.Series | None, optional
         Target vector for target encoding of categorical variables.
+    out_dir : str | Path | None, optional
+        When given and the result is all-numeric, the transformed matrix is
+        written to ``out_dir/features.npy`` and returned as a read-only
+        memory-mapped DataFrame (see ``scripts.array_store``).
+    dtype : {"float32", "float64"} | None, optional
+        Floating-point type used for encodings, interactions, scaling and
+        PCA (see :class:`FeatureEngineer`).
+    pca_backend : {"auto", "full", "randomized", "incremental"}, optional
+        SVD strategy of the PCA step; ``"auto"`` chooses from the matrix
+        shape and available memory (see ``scripts.pca_backends``).
+    cache_dir : str | Path | None, optional
+        Directory of fitted transformers keyed by :func:`feature_cache_key`.
+        A cached transformer for the same data and settings is reused and
+        only ``transform`` runs; otherwise the new fit is stored there.
+    **params
+        Further :class:`FeatureEngineer` parameters, e.g. the interaction
+        stage's ``max_interactions`` or ``interaction_screen``.
 
     Returns
     -------
-    Tuple[pd.DataFrame, Pipeline]
-        Transformed features and the fitted pipeline.
+    Tuple[pd.DataFrame, FeatureEngineer]
+        Transformed features and the fitted transformer.
     """
-    df = X.copy()
+    engineer = FeatureEngineer(dtype=dtype, pca_backend=pca_backend, **params)
+    if cache_dir is None:
+        return engineer.fit_transform(X, y, out_dir=out_dir), engineer
 
-    # ------------------------------------------------------------------
-    # Target Encoding for Categorical Columns
-    # ------------------------------------------------------------------
-    if y is not None:
-        cat_cols = df.select_dtypes(include=["object", "category"]).columns
-        global_mean = y.mean()
-        for col in cat_cols:
-            means = y.groupby(df[col]).mean()
-            df[col] = df[col].map(means).fillna(global_mean)
+    path = Path(cache_dir) / f"{feature_cache_key(X, y, engineer)}.pkl"
+    if path.exists():
+        try:
+            cached = FeatureEngineer.load(path)
+        except Exception as exc:  # noqa: BLE001 – fall back to refitting
+            logger.warning("Ignoring unreadable feature-engineering cache %s: %s", path, exc)
+        else:
+            logger.info("Reusing fitted feature engineering from %s", path)
+            os.utime(path)  # last-use stamp for the run cache's LRU eviction
+            return cached.transform(X, out_dir=out_dir, out_of_fold=True), cached
 
-    # ------------------------------------------------------------------
-    # Interaction Terms (first 3 numeric columns)
-    # ------------------------------------------------------------------
-    num_cols = df.select_dtypes(include="number").columns
-    top_numeric = list(num_cols)[:3]
-    for i, col1 in enumerate(top_numeric):
-        for col2 in top_numeric[i + 1 :]:
-            df[f"{col1}_x_{col2}"] = df[col1] * df[col2]
+    X_fe = engineer.fit_transform(X, y, out_dir=out_dir)
+    engineer.save(path)
+    return X_fe, engineer
+
+
+def engineer_features_streaming(
+    predictors_path: str | Path,
+    target_path: str | Path,
+    *,
+    out_path: str | Path,
+    chunk_rows: int | None = None,
+    dtype: str | None = None,
+    pca_backend: str = "auto",
+    cache_dir: str | Path | None = None,
+    **params: Any,
+) -> tuple[pd.DataFrame, pd.Series, FeatureEngineer]:
+    """Feature engineering for files larger than memory.
+
+    Streams the files in ``chunk_rows`` row chunks (see
+    ``data_loader.iter_data_chunks``), fits :class:`FeatureEngineer` with
+    :meth:`~FeatureEngineer.fit_stream` and writes the transformed matrix to
+    ``out_path`` with :meth:`~FeatureEngineer.transform_to_store`.
+
+    Parameters
+    ----------
+    predictors_path, target_path : str | Path
+        Files (or dataset directories) accepted by ``data_loader.load_data``.
+    out_path : str | Path
+        Destination ``.npy`` file of the engineered matrix.
+    chunk_rows : int | None, optional
+        Rows per chunk (default ``data_loader.DEFAULT_CHUNK_ROWS``).
+    dtype, pca_backend, **params
+        As in :func:`engineer_features`.
+    cache_dir : str | Path | None, optional
+        Directory of fitted transformers.  The key uses the files'
+        fingerprints (size, mtime and sampled bytes) instead of hashing the
+        data, so a cached fit skips both statistics passes.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.Series, FeatureEngineer]
+        Memory-mapped features, the target and the fitted transformer.
+    """
+    from functools import partial
+
+    from scripts.data_loader import DEFAULT_CHUNK_ROWS, dataset_fingerprint, iter_data_chunks
+
+    chunks = partial(iter_data_chunks, predictors_path, target_path, chunk_rows=chunk_rows or DEFAULT_CHUNK_ROWS)
+    engineer = FeatureEngineer(dtype=dtype, pca_backend=pca_backend, **params)
+
+    path = None
+    if cache_dir is not None:
+        payload = json.dumps(
+            {
+                "files": dataset_fingerprint(predictors_path, target_path),
+                "params": engineer.get_params(),
+                "code": _SOURCE_DIGEST,
+                "streaming": True,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        path = Path(cache_dir) / f"{hashlib.sha256(payload.encode()).hexdigest()[:32]}.pkl"
+        if path.exists():
+            try:
+                cached = FeatureEngineer.load(path)
+            except Exception as exc:  # noqa: BLE001 – fall back to refitting
+                logger.warning("Ignoring unreadable feature-engineering cache %s: %s", path, exc)
+            else:
+                logger.info("Reusing fitted feature engineering from %s", path)
+                os.utime(path)  # last-use stamp for the run cache's LRU eviction
+                return (*cached.transform_to_store(chunks, out_path, out_of_fold=True), cached)
 
-    numeric_cols = df.select_dtypes(include="number").columns
-    pipeline = Pipeline([
-        ("scale", StandardScaler()),
-        ("pca", PCA(n_components=0.95)),
-    ])
-    X_transformed = pipeline.fit_transform(df[numeric_cols])
-    X_fe = pd.DataFrame(
-        X_transformed,
-        index=df.index,
-        columns=[f"pc{i+1}" for i in range(X_transformed.shape[1])],
-    )
-    if len(numeric_cols) != df.shape[1]:
-        X_non = df.drop(columns=numeric_cols).reset_index(drop=True)
-        X_fe = pd.concat([X_non, X_fe.reset_index(drop=True)], axis=1)
-    return X_fe, pipeline
+    engineer.fit_stream(chunks)
+    if path is not None:
+        engineer.save(path)
+    return (*engineer.transform_to_store(chunks, out_path, out_of_fold=True), engineer)
 
 
-__all__ = ["engineer_features"]
+__all__ = [
+    "STREAM_COVARIANCE_MAX_FEATURES",
+    "FeatureEngineer",
+    "engineer_features",
+    "engineer_features_streaming",
+    "feature_cache_key",
+]
@@ -1,10 +1,28 @@
-"""Hyperparameter tuning utility using RandomizedSearchCV."""
+"""Hyperparameter tuning utility using RandomizedSearchCV.
+
+Besides the exhaustive random search, where every candidate is trained on
+all rows in every fold, the tuner can rank candidates by successive halving
+(``strategy="halving"``) or Hyperband (``strategy="hyperband"``).  Both give
+every candidate a small share of a resource: training rows
+(``resource="n_samples"``) or trees (``resource="n_estimators"``).  Only the
+best ``1/factor`` go on to a ``factor`` times larger share.  Hyperband runs
+several such brackets, from many candidates on a small share down to a few
+on the full resource, so that it does not depend on a single starting size.
+
+:class:`SearchCost` compares the work done with the exhaustive search over
+the same candidates.  Work is counted in trees x training rows, which is
+roughly what a random forest fit costs.
+"""
 from __future__ import annotations
 
 import argparse
+from dataclasses import asdict, dataclass
 import json
+import logging
+import math
 from pathlib import Path
-from typing import Tuple, Dict, Any
+import time
+from typing import Tuple, Dict, Any, List
 
 import pandas as pd
 import numpy as np
@@ -14,38 +32,249 @@ from sklearn.metrics import make_scorer, r2_score
 
 from scripts.data_loader import load_data
 
+logger = logging.getLogger(__name__)
+
 RANDOM_STATE = 42
 CV_SPLITS = 5
 CV_REPEATS = 2
 
+STRATEGIES = ("random", "halving", "hyperband")
+RESOURCES = ("n_samples", "n_estimators")
+# Smallest share of each resource a candidate is trained on.
+MIN_RESOURCES = {"n_samples": 20 * CV_SPLITS, "n_estimators": 10}
 
-def tune_random_forest(
+PARAM_DIST = {
+    "n_estimators": [50, 100, 150, 200, 300],
+    "max_depth": [None, 5, 10, 20],
+    "min_samples_split": [2, 5, 10],
+    "max_features": ["sqrt", "log2", None],
+}
+
+
+@dataclass
+class SearchCost:
+    """Work done by a search, next to the exhaustive search over the same candidates.
+
+    ``cost``/``exhaustive_cost`` are in trees x training rows summed over all
+    CV fits; ``fits`` counts fold fits.
+    """
+
+    strategy: str
+    resource: str
+    candidates: int
+    fits: int
+    exhaustive_fits: int
+    cost: float
+    exhaustive_cost: float
+    wall_time: float
+
+    @property
+    def saved(self) -> float:
+        """Fraction of the exhaustive cost that was not spent."""
+        return 1.0 - self.cost / self.exhaustive_cost if self.exhaustive_cost else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "saved": self.saved}
+
+
+def _cost(cv_results: Dict[str, Any], resource: str, n_rows: int) -> Tuple[float, float, int]:
+    """``(cost, exhaustive cost, candidates)`` of one halving search's ``cv_results_``.
+
+    The exhaustive cost trains every first-iteration candidate on all rows
+    with its full number of trees.
+    """
+    n_folds = CV_SPLITS * CV_REPEATS
+    train_share = 1 - 1 / CV_SPLITS
+    cost = exhaustive = 0.0
+    candidates = 0
+    for iteration, n_resources, params in zip(cv_results["iter"], cv_results["n_resources"], cv_results["params"]):
+        if resource == "n_samples":
+            # The folds are split from a subsample of n_resources rows.
+            trees, rows, full_trees = params["n_estimators"], n_resources, params["n_estimators"]
+        else:
+            trees, rows, full_trees = n_resources, n_rows, max(PARAM_DIST["n_estimators"])
+        cost += n_folds * trees * rows * train_share
+        if iteration == 0:
+            candidates += 1
+            exhaustive += n_folds * full_trees * n_rows * train_share
+    return cost, exhaustive, candidates
+
+
+def _halving_search(
     X: pd.DataFrame,
     y: pd.Series,
     *,
-    n_iter: int = 20,
-) -> Tuple[RandomForestRegressor, Dict[str, Any], float]:
-    """Tune a RandomForestRegressor using RandomizedSearchCV."""
-    param_dist = {
-        "n_estimators": [50, 100, 150, 200, 300],
-        "max_depth": [None, 5, 10, 20],
-        "min_samples_split": [2, 5, 10],
-        "max_features": ["sqrt", "log2", None],
-    }
-
-    cv = RepeatedKFold(n_splits=CV_SPLITS, n_repeats=CV_REPEATS, random_state=RANDOM_STATE)
-    estimator = RandomForestRegressor(random_state=RANDOM_STATE)
-    search = RandomizedSearchCV(
-        estimator,
+    n_candidates: int,
+    resource: str,
+    factor: int,
+    min_resources: int | str,
+    seed: int,
+) -> Any:
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingRandomSearchCV
+
+    param_dist = {k: v for k, v in PARAM_DIST.items() if k != resource}
+    max_resources = len(X) if resource == "n_samples" else max(PARAM_DIST["n_estimators"])
+    search = HalvingRandomSearchCV(
+        RandomForestRegressor(random_state=RANDOM_STATE),
         param_distributions=param_dist,
-        n_iter=n_iter,
-        cv=cv,
+        n_candidates=n_candidates,
+        factor=factor,
+        resource=resource,
+        min_resources=min_resources,
+        max_resources=max_resources,
+        cv=RepeatedKFold(n_splits=CV_SPLITS, n_repeats=CV_REPEATS, random_state=RANDOM_STATE),
         scoring=make_scorer(r2_score),
-        random_state=RANDOM_STATE,
+        random_state=seed,
+        refit=False,
         n_jobs=-1,
     )
-    search.fit(X, y)
-    return search.best_estimator_, search.best_params_, search.best_score_
+    return search.fit(X, y)
+
+
+def hyperband_brackets(max_resources: int, min_resources: int, factor: int, n_iter: int) -> List[Tuple[int, int]]:
+    """``(n_candidates, min_resources)`` of each Hyperband bracket, most aggressive first.
+
+    Bracket ``s`` starts ``ceil((s_max + 1) / (s + 1) * factor**s)``
+    candidates (at most *n_iter*) and halves them until fewer than *factor*
+    are left, ``r <= s`` times.  It starts on ``max_resources // factor**r``,
+    so every bracket ends on the full resource even when *n_iter* caps its
+    candidates (up to rounding ``max_resources`` down to a multiple of
+    ``factor**r``).
+    """
+    min_resources = min(min_resources, max_resources)
+    s_max = _floor_log(max_resources // min_resources, factor)
+    brackets = []
+    for s in range(s_max, -1, -1):
+        n = max(1, min(n_iter, math.ceil((s_max + 1) / (s + 1) * factor ** s)))
+        rounds = min(s, _floor_log(n, factor))
+        brackets.append((n, max(min_resources, max_resources // factor ** rounds)))
+    return brackets
+
+
+def _floor_log(n: int, factor: int) -> int:
+    """``floor(log_factor(n))`` in integers (``0`` for ``n < factor``)."""
+    power = 0
+    while factor ** (power + 1) <= n:
+        power += 1
+    return power
+
+
+def search_random_forest(
+    X: pd.DataFrame,
+    y: pd.Series,
+    *,
+    n_iter: int = 20,
+    strategy: str = "random",
+    resource: str = "n_samples",
+    factor: int = 3,
+) -> Tuple[RandomForestRegressor, Dict[str, Any], float, SearchCost]:
+    """Tune a RandomForestRegressor and report what the search cost.
+
+    Parameters
+    ----------
+    n_iter : int
+        Candidates of the random search and of the halving search; upper
+        bound on the candidates of each Hyperband bracket.
+    strategy : {"random", "halving", "hyperband"}
+        ``"random"`` is the exhaustive RandomizedSearchCV.
+    resource : {"n_samples", "n_estimators"}
+        What the halving strategies ration: training rows or trees.
+    factor : int
+        Halving rate (``eta``): the share of survivors is ``1/factor``.
+
+    Returns
+    -------
+    best_estimator, best_params, best_score, cost
+        The estimator is refitted on all rows.  ``best_score`` is the mean
+        CV R² of the winning candidate on its final (full) resource.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; choose from {', '.join(STRATEGIES)}.")
+    if resource not in RESOURCES:
+        raise ValueError(f"Unknown resource {resource!r}; choose from {', '.join(RESOURCES)}.")
+    n_train = len(X) * (1 - 1 / CV_SPLITS)
+    start = time.perf_counter()
+
+    if strategy == "random":
+        cv = RepeatedKFold(n_splits=CV_SPLITS, n_repeats=CV_REPEATS, random_state=RANDOM_STATE)
+        estimator = RandomForestRegressor(random_state=RANDOM_STATE)
+        search = RandomizedSearchCV(
+            estimator,
+            param_distributions=PARAM_DIST,
+            n_iter=n_iter,
+            cv=cv,
+            scoring=make_scorer(r2_score),
+            random_state=RANDOM_STATE,
+            n_jobs=-1,
+        )
+        search.fit(X, y)
+        n_candidates = len(search.cv_results_["params"])
+        total = n_train * CV_SPLITS * CV_REPEATS * sum(p["n_estimators"] for p in search.cv_results_["params"])
+        fits = n_candidates * CV_SPLITS * CV_REPEATS
+        cost = SearchCost(strategy, resource, n_candidates, fits, fits, total, total, time.perf_counter() - start)
+        return search.best_estimator_, search.best_params_, search.best_score_, cost
+
+    if strategy == "halving":
+        plan = [(n_iter, "exhaust")]
+    else:
+        max_resources = len(X) if resource == "n_samples" else max(PARAM_DIST["n_estimators"])
+        plan = hyperband_brackets(max_resources, MIN_RESOURCES[resource], factor, n_iter)
+
+    best_params: Dict[str, Any] = {}
+    best_score = -np.inf
+    spent = exhaustive = 0.0
+    candidates = fits = 0
+    for bracket, (n_candidates, min_resources) in enumerate(plan):
+        search = _halving_search(
+            X, y, n_candidates=n_candidates, resource=resource, factor=factor,
+            min_resources=min_resources, seed=RANDOM_STATE + bracket,
+        )
+        bracket_cost, bracket_exhaustive, bracket_candidates = _cost(search.cv_results_, resource, len(X))
+        spent += bracket_cost
+        exhaustive += bracket_exhaustive
+        candidates += bracket_candidates
+        fits += len(search.cv_results_["params"]) * CV_SPLITS * CV_REPEATS
+        logger.info(
+            "[tuner] bracket %d: %d candidates from %s %s, best R²=%.4f",
+            bracket, bracket_candidates, search.n_resources_[0], resource, search.best_score_,
+        )
+        if search.best_score_ > best_score:
+            best_score, best_params = float(search.best_score_), dict(search.best_params_)
+
+    if resource == "n_estimators":
+        # The last rung may round the tree count down to a multiple of factor**r.
+        best_params[resource] = max(PARAM_DIST["n_estimators"])
+
+    best_estimator = RandomForestRegressor(random_state=RANDOM_STATE, **best_params).fit(X, y)
+    cost = SearchCost(
+        strategy, resource, candidates, fits, candidates * CV_SPLITS * CV_REPEATS,
+        spent, exhaustive, time.perf_counter() - start,
+    )
+    logger.info(
+        "[tuner] %s over %s: %d fits instead of %d, %.0f%% of the exhaustive trees x rows saved",
+        strategy, resource, cost.fits, cost.exhaustive_fits, 100 * cost.saved,
+    )
+    return best_estimator, best_params, best_score, cost
+
+
+def tune_random_forest(
+    X: pd.DataFrame,
+    y: pd.Series,
+    *,
+    n_iter: int = 20,
+    strategy: str = "random",
+    resource: str = "n_samples",
+    factor: int = 3,
+) -> Tuple[RandomForestRegressor, Dict[str, Any], float]:
+    """Tune a RandomForestRegressor using RandomizedSearchCV, or by successive halving / Hyperband.
+
+    See :func:`search_random_forest`, which also returns the search cost.
+    """
+    estimator, params, score, _ = search_random_forest(
+        X, y, n_iter=n_iter, strategy=strategy, resource=resource, factor=factor
+    )
+    return estimator, params, score
 
 
 def _cli() -> None:
@@ -54,19 +283,29 @@ def _cli() -> None:
     parser.add_argument("--target", required=True, help="Path to target CSV")
     parser.add_argument("--output", required=True, help="File to write best params as JSON")
     parser.add_argument("--n-iter", type=int, default=20, help="Number of search iterations")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="random", help="Search strategy (default: random)")
+    parser.add_argument("--resource", choices=RESOURCES, default="n_samples", help="Resource rationed by halving")
+    parser.add_argument("--factor", type=int, default=3, help="Halving rate for --strategy halving/hyperband")
     args = parser.parse_args()
 
     X, y = load_data(args.data, args.target)
-    _, best_params, best_score = tune_random_forest(X, y, n_iter=args.n_iter)
+    _, best_params, best_score, cost = search_random_forest(
+        X, y, n_iter=args.n_iter, strategy=args.strategy, resource=args.resource, factor=args.factor
+    )
 
-    result = {"best_params": best_params, "best_score": best_score}
+    result = {"best_params": best_params, "best_score": best_score, "cost": cost.to_dict()}
     Path(args.output).parent.mkdir(parents=True, exist_ok=True)
     with open(args.output, "w") as f:
         json.dump(result, f, indent=2)
 
     print(f"Best R^2: {best_score:.4f}")
+    if args.strategy != "random":
+        print(
+            f"{cost.fits} fits instead of {cost.exhaustive_fits}; "
+            f"{100 * cost.saved:.0f}% of the exhaustive compute (trees x rows) saved in {cost.wall_time:.1f}s"
+        )
     print(f"Parameters written to {args.output}")
 
 
 if __name__ == "__main__":
-    _cli() 
\ No newline at end of file
+    _cli()
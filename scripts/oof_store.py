@@ -0,0 +1,64 @@
+"""On-disk cache of out-of-fold (OOF) predictions, one ``.npy`` per model.
+
+During the 5x3 repeated K-fold every training row is predicted by models that
+never saw it.  Keeping those predictions (averaged over the repeats) lets the
+ensemble step choose blend weights from the cached matrix alone instead of
+re-predicting every champion.  Arrays are stored as ``float32`` under
+``<run_dir>/oof/`` and read back as memory maps.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+
+from scripts.array_store import open_npy, write_npy
+
+OOF_DIRNAME = "oof"
+
+
+class OOFStore:
+    """Directory of per-model OOF prediction vectors aligned on the training rows."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    @classmethod
+    def for_run(cls, run_dir: str | Path) -> "OOFStore":
+        """Store located in the ``oof/`` sub-directory of a run directory."""
+        return cls(Path(run_dir) / OOF_DIRNAME)
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.npy"
+
+    def save(self, name: str, predictions: np.ndarray) -> Path:
+        """Write the OOF predictions of model *name*, replacing older ones."""
+        write_npy(self.path(name), np.asarray(predictions, dtype=np.float32).ravel())
+        return self.path(name)
+
+    def load(self, name: str) -> np.ndarray:
+        return open_npy(self.path(name))
+
+    def names(self) -> List[str]:
+        """Models with cached predictions, in sorted order."""
+        if not self.root.is_dir():
+            return []
+        return sorted(p.stem for p in self.root.glob("*.npy"))
+
+    def matrix(self, names: Iterable[str] | None = None) -> np.ndarray:
+        """Stack the cached predictions into an ``(n_samples, n_models)`` array."""
+        names = self.names() if names is None else list(names)
+        if not names:
+            raise ValueError(f"No OOF predictions cached in {self.root}.")
+        columns = [self.load(name) for name in names]
+        lengths = {len(col) for col in columns}
+        if len(lengths) != 1:
+            raise ValueError(f"OOF predictions in {self.root} have different lengths: {sorted(lengths)}.")
+        out = np.empty((lengths.pop(), len(columns)), dtype=np.float64)
+        for j, col in enumerate(columns):
+            out[:, j] = col
+        return out
+
+
+__all__ = ["OOF_DIRNAME", "OOFStore"]
@@ -0,0 +1,262 @@
+"""PCA with a variance target on full, randomized or incremental SVD.
+
+``PCA(n_components=0.95)`` runs a full SVD of the whole scaled matrix – cubic
+in the smaller dimension and with workspace several times the input – only to
+keep the leading components.  :class:`VariancePCA` keeps the same "explain
+this share of the variance" contract with three backends:
+
+``"full"``
+    The previous behaviour: scikit-learn's own solver choice, i.e. an
+    eigendecomposition of the covariance for tall matrices with at most 1000
+    columns and a LAPACK SVD of the whole matrix otherwise.
+``"randomized"``
+    Randomized SVD of a growing number of components.  The total variance is
+    known up front (sum of column variances), so the fit stops as soon as the
+    components found so far explain the target share, doubling the
+    component count otherwise.  Falls back to ``"full"`` when more than half
+    of the components would be needed, where the randomized method no longer
+    pays off.
+``"incremental"``
+    ``IncrementalPCA`` over row chunks, so the SVD workspace is bounded by the
+    chunk rather than the matrix.  It tracks at most
+    ``INCREMENTAL_MAX_COMPONENTS`` components (the variance target cannot be
+    checked before the last chunk) and truncates them to the target share
+    afterwards.
+
+``"auto"`` (:func:`choose_backend`) picks incremental when the matrix and its
+SVD workspace would not fit comfortably in available memory, full where the
+covariance route applies, randomized when both dimensions are large, and full
+otherwise.  ``docs/benchmarks.md`` has the measurements behind these rules.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from typing import Any
+
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.utils.validation import check_is_fitted
+
+BACKENDS = ("auto", "full", "randomized", "incremental")
+# Smaller matrix dimension above which the randomized solver is preferred.
+RANDOMIZED_MIN_DIM = 500
+# scikit-learn solves PCA through the covariance matrix (fast, small
+# workspace) for at most this many columns and 10x as many rows.
+COVARIANCE_MAX_FEATURES = 1_000
+INCREMENTAL_MAX_COMPONENTS = 256
+# Copies of the input a full SVD needs (input, centred copy, U, workspace).
+FULL_SVD_COPIES = 4
+# Share of available memory the full/randomized backends may plan to use.
+MEMORY_FRACTION = 0.5
+# Initial component count tried by the randomized backend.
+RANDOMIZED_START = 32
+DEFAULT_BATCH_ROWS = 10_000
+
+
+def available_memory_bytes() -> int | None:
+    """Bytes of memory available to this process, if it can be determined."""
+    try:
+        import psutil
+
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def choose_backend(n_samples: int, n_features: int, itemsize: int = 8, *, memory_bytes: int | None = None) -> str:
+    """Backend that ``"auto"`` resolves to for a matrix of this shape."""
+    memory_bytes = available_memory_bytes() if memory_bytes is None else memory_bytes
+    needed = FULL_SVD_COPIES * n_samples * n_features * itemsize
+    if memory_bytes is not None and needed > MEMORY_FRACTION * memory_bytes:
+        return "incremental"
+    if n_features <= COVARIANCE_MAX_FEATURES and n_samples >= 10 * n_features:
+        return "full"
+    if min(n_samples, n_features) > RANDOMIZED_MIN_DIM:
+        return "randomized"
+    return "full"
+
+
+@dataclass
+class _FittedComponents:
+    components_: np.ndarray
+    mean_: np.ndarray
+    explained_variance_: np.ndarray
+    explained_variance_ratio_: np.ndarray
+
+
+def _n_for_variance(ratios: np.ndarray, target: float) -> int | None:
+    """Smallest component count whose cumulative ratio reaches *target*."""
+    cumulative = np.cumsum(ratios)
+    reached = np.flatnonzero(cumulative >= target - 1e-12)
+    return int(reached[0]) + 1 if reached.size else None
+
+
+class VariancePCA(TransformerMixin, BaseEstimator):
+    """PCA keeping the fewest components that explain ``n_components`` of the variance.
+
+    Parameters
+    ----------
+    n_components : float or int
+        Share of variance to explain (``0 < n_components < 1``) or a fixed
+        number of components.
+    backend : {"auto", "full", "randomized", "incremental"}
+        SVD strategy, see the module docstring.
+    batch_size : int | None
+        Rows per ``partial_fit`` call of the incremental backend; at least
+        the number of tracked components is used.
+    random_state : int | None
+        Seed of the randomized solver.
+
+    Attributes
+    ----------
+    backend_ : str
+        Backend actually used (``"auto"`` resolved, fallbacks applied).
+    n_components_, components_, mean_, explained_variance_,
+    explained_variance_ratio_
+        As in :class:`sklearn.decomposition.PCA`.
+    """
+
+    def __init__(
+        self,
+        n_components: float | int = 0.95,
+        *,
+        backend: str = "auto",
+        batch_size: int | None = DEFAULT_BATCH_ROWS,
+        random_state: int | None = 0,
+    ):
+        self.n_components = n_components
+        self.backend = backend
+        self.batch_size = batch_size
+        self.random_state = random_state
+
+    def fit(self, X: Any, y: Any = None) -> "VariancePCA":
+        X = np.asarray(X)
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown PCA backend {self.backend!r}; choose from {BACKENDS}.")
+        n_samples, n_features = X.shape
+        backend = self.backend
+        if backend == "auto":
+            backend = choose_backend(n_samples, n_features, X.dtype.itemsize)
+
+        if backend == "incremental":
+            model = self._fit_incremental(X)
+        elif backend == "randomized":
+            model = self._fit_randomized(X)
+            if model is None:
+                backend, model = "full", None
+        if backend == "full":
+            model = PCA(n_components=self.n_components).fit(X)
+
+        self.backend_ = backend
+        self._keep(model, self._target_components(model.explained_variance_ratio_))
+        return self
+
+    @classmethod
+    def from_covariance(
+        cls,
+        covariance: np.ndarray,
+        mean: np.ndarray,
+        n_components: float | int = 0.95,
+    ) -> "VariancePCA":
+        """Exact PCA from an accumulated (``ddof=1``) covariance matrix.
+
+        Used when the data is only ever seen in chunks: the covariance is
+        ``n_features x n_features`` however many rows went into it.
+        """
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        order = np.argsort(eigenvalues)[::-1]
+        variance = np.clip(eigenvalues[order], 0.0, None)
+        components = eigenvectors[:, order].T
+        # Same sign convention as scikit-learn: largest loading positive.
+        signs = np.sign(components[np.arange(len(components)), np.abs(components).argmax(axis=1)])
+        components *= np.where(signs == 0, 1.0, signs)[:, None]
+        total = variance.sum()
+        model = _FittedComponents(
+            components_=components,
+            mean_=np.asarray(mean, dtype=np.float64),
+            explained_variance_=variance,
+            explained_variance_ratio_=variance / total if total > 0 else variance,
+        )
+        return cls.from_fitted(model, n_components, backend="covariance")
+
+    @classmethod
+    def from_fitted(cls, model: Any, n_components: float | int = 0.95, *, backend: str) -> "VariancePCA":
+        """Wrap an already fitted PCA-like *model*, truncated to the variance target."""
+        pca = cls(n_components, backend=backend)
+        pca.backend_ = backend
+        pca._keep(model, pca._target_components(model.explained_variance_ratio_))
+        return pca
+
+    def transform(self, X: Any) -> np.ndarray:
+        check_is_fitted(self, "components_")
+        X = np.asarray(X)
+        out = X @ self.components_.T.astype(X.dtype, copy=False)
+        out -= (self.mean_ @ self.components_.T).astype(out.dtype, copy=False)
+        return out
+
+    # ------------------------------------------------------------------
+    def _target_components(self, ratios: np.ndarray) -> int:
+        if isinstance(self.n_components, float) and 0 < self.n_components < 1:
+            n = _n_for_variance(ratios, self.n_components)
+            return len(ratios) if n is None else n
+        return min(int(self.n_components), len(ratios))
+
+    def _keep(self, model: Any, n: int) -> None:
+        self.n_components_ = n
+        self.components_ = model.components_[:n]
+        self.mean_ = model.mean_
+        self.explained_variance_ = model.explained_variance_[:n]
+        self.explained_variance_ratio_ = model.explained_variance_ratio_[:n]
+        self.n_features_in_ = model.components_.shape[1]
+
+    def _fit_randomized(self, X: np.ndarray) -> PCA | None:
+        """Grow the component count until the variance target is met; ``None`` = use full SVD."""
+        limit = min(X.shape) // 2
+        if not (isinstance(self.n_components, float) and 0 < self.n_components < 1):
+            n = int(self.n_components)
+            if n > limit:
+                return None
+            return PCA(n_components=n, svd_solver="randomized", random_state=self.random_state).fit(X)
+        n = min(RANDOMIZED_START, limit)
+        while 0 < n <= limit:
+            model = PCA(n_components=n, svd_solver="randomized", random_state=self.random_state).fit(X)
+            if _n_for_variance(model.explained_variance_ratio_, self.n_components) is not None:
+                return model
+            if n == limit:
+                break
+            n = min(2 * n, limit)
+        return None
+
+    def _fit_incremental(self, X: np.ndarray) -> IncrementalPCA:
+        n_samples, n_features = X.shape
+        if isinstance(self.n_components, float):
+            n = min(n_features, INCREMENTAL_MAX_COMPONENTS)
+        else:
+            n = min(int(self.n_components), n_features)
+        n = min(n, n_samples)
+        batch = max(self.batch_size or DEFAULT_BATCH_ROWS, n)
+        starts = list(range(0, n_samples, batch))
+        if len(starts) > 1 and n_samples - starts[-1] < n:
+            # partial_fit needs at least n_components rows per call; fold a
+            # short tail into the previous batch.
+            starts.pop()
+        bounds = starts[1:] + [n_samples]
+        model = IncrementalPCA(n_components=n)
+        for start, stop in zip(starts, bounds):
+            model.partial_fit(X[start:stop])
+        return model
+
+
+__all__ = [
+    "BACKENDS",
+    "INCREMENTAL_MAX_COMPONENTS",
+    "VariancePCA",
+    "available_memory_bytes",
+    "choose_backend",
+]
@@ -0,0 +1,217 @@
+"""Content-addressed cache of finished engine runs.
+
+Re-running the orchestrator on an unchanged dataset with the same flags used
+to repeat every engine search and the 5x3 repeated K-fold.  :class:`RunCache`
+stores, per engine, the fitted champion, its CV metrics and its OOF
+predictions under a key derived from
+
+* a fingerprint of the training predictors and target (:func:`fingerprint_data`),
+* the run configuration (feature-engineering flags, metric, seed, budget, CV
+  settings), and
+* the engine name and version (library version plus wrapper source digest).
+
+A hit hands back the stored result without importing or starting the engine.
+Entries live in ``05_outputs/.cache/<key>/``; fitted feature engineering is
+cached as ``05_outputs/.cache/features/<key>.pkl`` (:attr:`RunCache.features_dir`)
+and counts as an entry too.  The modification time doubles as the last-use
+stamp, and :meth:`RunCache.evict` removes the least recently used entries of
+either kind once the cache exceeds ``max_bytes``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import pickle
+import shutil
+import tempfile
+from typing import Any, Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from scripts.array_store import open_npy, write_npy
+
+CACHE_DIRNAME = ".cache"
+FEATURES_DIRNAME = "features"
+DEFAULT_MAX_BYTES = 2 * 2**30
+# Rows hashed per step for array inputs, so memory maps are never fully loaded.
+_HASH_CHUNK_ROWS = 65_536
+
+_MODEL_FILE = "model.pkl"
+_METRICS_FILE = "metrics.json"
+_OOF_FILE = "oof.npy"
+
+logger = logging.getLogger(__name__)
+
+
+def _hash_array(digest: Any, array: np.ndarray) -> None:
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    for start in range(0, len(array), _HASH_CHUNK_ROWS):
+        digest.update(np.ascontiguousarray(array[start:start + _HASH_CHUNK_ROWS]).data)
+
+
+def _hash_pandas(digest: Any, obj: pd.DataFrame | pd.Series) -> None:
+    if isinstance(obj, pd.DataFrame):
+        digest.update(repr([(str(c), str(t)) for c, t in obj.dtypes.items()]).encode())
+    else:
+        digest.update(f"{obj.name}:{obj.dtype}".encode())
+    digest.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().data)
+
+
+def fingerprint_data(X: Any, y: Any) -> str:
+    """Hex digest of the predictors and target (values, dtypes, columns, index)."""
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (X, y):
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            _hash_pandas(digest, part)
+        else:
+            _hash_array(digest, np.asarray(part))
+    return digest.hexdigest()
+
+
+def cache_key(*, data: str, engine: str, engine_version: str, config: Mapping[str, Any]) -> str:
+    """Key of one engine run: data fingerprint + engine identity + run configuration."""
+    payload = json.dumps(
+        {"data": data, "engine": engine, "engine_version": engine_version, "config": dict(config)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+@dataclass
+class CachedRun:
+    """A stored engine result."""
+
+    key: str
+    model: Any
+    metrics: Dict[str, Any]
+    oof_predictions: np.ndarray | None
+
+
+def _tree_bytes(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
+class RunCache:
+    """Directory of cached engine runs with least-recently-used eviction."""
+
+    def __init__(self, root: str | Path, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    @property
+    def features_dir(self) -> Path:
+        """Directory of fitted feature-engineering pickles, evicted with the runs."""
+        return self.root / FEATURES_DIRNAME
+
+    def keys(self) -> List[str]:
+        """Complete entries, least recently used first.
+
+        Engine runs are named by their key, feature-engineering pickles by
+        their path below the cache root (``features/<key>.pkl``).
+        """
+        if not self.root.is_dir():
+            return []
+        entries = [p for p in self.root.iterdir() if p.is_dir() and (p / _METRICS_FILE).exists()]
+        if self.features_dir.is_dir():
+            entries.extend(p for p in self.features_dir.glob("*.pkl") if p.is_file())
+        return [p.relative_to(self.root).as_posix() for p in sorted(entries, key=lambda p: p.stat().st_mtime)]
+
+    def size_bytes(self) -> int:
+        return sum(_tree_bytes(self.path(key)) for key in self.keys())
+
+    def get(self, key: str) -> CachedRun | None:
+        """Load entry *key* and mark it as recently used; ``None`` on a miss."""
+        entry = self.path(key)
+        if not (entry / _METRICS_FILE).exists():
+            return None
+        try:
+            with open(entry / _MODEL_FILE, "rb") as f:
+                model = pickle.load(f)
+            metrics = json.loads((entry / _METRICS_FILE).read_text())
+            oof = open_npy(entry / _OOF_FILE) if (entry / _OOF_FILE).exists() else None
+        except Exception as exc:  # noqa: BLE001 – a broken entry is just a miss
+            logger.warning("[RunCache] Dropping unreadable entry %s: %s", key, exc)
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        os.utime(entry)
+        return CachedRun(key=key, model=model, metrics=metrics, oof_predictions=oof)
+
+    def put(
+        self,
+        key: str,
+        model: Any,
+        metrics: Mapping[str, Any],
+        oof_predictions: np.ndarray | None = None,
+    ) -> Path:
+        """Store an engine result under *key*, then evict down to ``max_bytes``.
+
+        The entry is assembled in a temporary directory and renamed into
+        place, so a concurrent reader never sees a partial entry.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self.root))
+        try:
+            with open(tmp / _MODEL_FILE, "wb") as f:
+                pickle.dump(model, f)
+            if oof_predictions is not None:
+                write_npy(tmp / _OOF_FILE, np.asarray(oof_predictions, dtype=np.float32).ravel())
+            (tmp / _METRICS_FILE).write_text(json.dumps(dict(metrics), indent=2, default=str))
+            entry = self.path(key)
+            if entry.exists():
+                shutil.rmtree(entry)
+            tmp.rename(entry)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self.evict(keep=key)
+        return entry
+
+    def evict(self, *, keep: str | None = None) -> List[str]:
+        """Remove least recently used entries until the cache fits ``max_bytes``.
+
+        ``keep`` (the entry just written) is never evicted, even when it alone
+        exceeds the limit.  Returns the removed keys.
+        """
+        sizes = {key: _tree_bytes(self.path(key)) for key in self.keys()}
+        total = sum(sizes.values())
+        removed = []
+        for key in sizes:  # oldest first
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            _remove(self.path(key))
+            total -= sizes[key]
+            removed.append(key)
+        if removed:
+            logger.info("[RunCache] Evicted %d entr%s to stay under %.0f MiB.", len(removed), "y" if len(removed) == 1 else "ies", self.max_bytes / 2**20)
+        return removed
+
+
+__all__ = [
+    "CACHE_DIRNAME",
+    "CachedRun",
+    "DEFAULT_MAX_BYTES",
+    "FEATURES_DIRNAME",
+    "RunCache",
+    "cache_key",
+    "fingerprint_data",
+]
@@ -0,0 +1,248 @@
+"""Wall-clock budget enforcement for engine worker processes.
+
+``--time`` used to be handed to each engine as ``timeout_sec`` and nothing
+else: engines overran it (TPOT rounded it up to whole minutes), the 5x3 CV
+ran *after* the budget was spent, and the parent blocked on ``queue.get()``
+forever if a child hung or died without reporting back.
+
+:class:`EngineScheduler` owns the engine processes of a concurrent run.  Each
+engine gets a :class:`Deadline` covering both its search and its CV (see
+:func:`split_budget`); the scheduler polls the result queue with a timeout,
+notices workers that exited without a result, terminates (then kills) workers
+that overrun their deadline, and stops everything once the optional global
+deadline passes so that a champion can be chosen from whatever finished.
+Workers report progress with :func:`phase_message` so that a killed engine is
+recorded with the phase it reached.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import queue as _queue
+import time
+from typing import Any, Callable, Dict, Tuple
+
+# Share of an engine's budget kept back for the repeated K-fold evaluation.
+CV_BUDGET_FRACTION = 0.25
+MIN_SEARCH_SECONDS = 1
+# Time a worker gets to exit after ``terminate()`` before it is killed.
+KILL_GRACE_SECONDS = 5.0
+POLL_INTERVAL_SECONDS = 0.5
+
+# Message kinds sent by workers: ``(kind, engine_name, payload)``.
+PHASE = "phase"
+RESULT = "result"
+
+# Final engine states.
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_DIED = "died"
+STATUS_CANCELLED = "cancelled"  # stopped by the global deadline
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """A point in (monotonic) time; ``seconds=None`` never expires."""
+
+    def __init__(self, seconds: float | None, *, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self.start = clock()
+        self.seconds = seconds
+
+    def elapsed(self) -> float:
+        return self._clock() - self.start
+
+    def remaining(self) -> float:
+        if self.seconds is None:
+            return float("inf")
+        return self.seconds - self.elapsed()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+@dataclass(frozen=True)
+class EngineBudget:
+    """How an engine's wall-clock budget is split between search and CV."""
+
+    total_seconds: float
+    search_seconds: int
+    cv_seconds: float
+
+
+def split_budget(total_seconds: float, cv_fraction: float = CV_BUDGET_FRACTION) -> EngineBudget:
+    """Reserve ``cv_fraction`` of *total_seconds* for CV; the rest is search time."""
+    search = max(MIN_SEARCH_SECONDS, int(total_seconds * (1.0 - cv_fraction)))
+    return EngineBudget(total_seconds=total_seconds, search_seconds=search, cv_seconds=max(0.0, total_seconds - search))
+
+
+def phase_message(name: str, phase: str, **details: Any) -> Tuple[str, str, Dict[str, Any]]:
+    """Progress update a worker puts on the queue when it enters *phase*."""
+    return (PHASE, name, {"phase": phase, **details})
+
+
+def result_message(name: str, model: Any, metrics: Dict[str, Any]) -> Tuple[str, str, Tuple[Any, Dict[str, Any]]]:
+    """Final message of a worker; ``model is None`` signals an error."""
+    return (RESULT, name, (model, metrics))
+
+
+@dataclass
+class EngineRun:
+    """Book-keeping for one engine worker."""
+
+    name: str
+    process: Any
+    deadline: Deadline
+    status: str = "running"
+    phase: str = "starting"
+    model: Any = None
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    phase_started: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def running(self) -> bool:
+        return self.status == "running"
+
+    def summary(self) -> Dict[str, Any]:
+        """Metrics of a finished engine, or what is known about an unfinished one."""
+        if self.status == STATUS_OK:
+            summary = {**self.metrics, "status": STATUS_OK}
+            if "search" in self.phase_started:
+                # Spawn + imports until the worker began its search.
+                summary["startup_seconds"] = self.phase_started["search"]
+            return summary
+        summary = {
+            "status": self.status,
+            "phase": self.phase,
+            "elapsed_seconds": self.deadline.elapsed(),
+            "deadline_seconds": self.deadline.seconds,
+            "exitcode": getattr(self.process, "exitcode", None),
+        }
+        summary.update({f"{phase}_started_seconds": t for phase, t in self.phase_started.items()})
+        summary.update(self.metrics)
+        return summary
+
+
+class EngineScheduler:
+    """Start engine workers and collect their results within their deadlines."""
+
+    def __init__(
+        self,
+        result_queue: Any,
+        *,
+        global_deadline: Deadline | None = None,
+        grace_seconds: float = KILL_GRACE_SECONDS,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        on_finish: Callable[[EngineRun], None] | None = None,
+    ):
+        self.queue = result_queue
+        # Called once per engine as soon as it stops running (for whatever
+        # reason), e.g. to hand its CPU cores to the engines still running.
+        self.on_finish = on_finish
+        self.global_deadline = global_deadline or Deadline(None)
+        self.grace_seconds = grace_seconds
+        self.poll_interval = poll_interval
+        self.runs: Dict[str, EngineRun] = {}
+
+    def start(self, name: str, process: Any, budget_seconds: float | None) -> EngineRun:
+        """Start *process* and give it ``budget_seconds`` (plus grace) to report back."""
+        process.start()
+        deadline = Deadline(None if budget_seconds is None else budget_seconds + self.grace_seconds)
+        run = self.runs[name] = EngineRun(name=name, process=process, deadline=deadline)
+        return run
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
+    def run(self) -> Dict[str, EngineRun]:
+        """Block until every worker has reported, died, timed out or been cancelled."""
+        while any(run.running for run in self.runs.values()):
+            wait = min(
+                [self.poll_interval, self.global_deadline.remaining()]
+                + [run.deadline.remaining() for run in self.runs.values() if run.running]
+            )
+            try:
+                self._handle(self.queue.get(timeout=max(0.01, wait)))
+            except _queue.Empty:
+                pass
+            self._check_workers()
+        for run in self.runs.values():
+            self._reap(run)
+        return self.runs
+
+    def _handle(self, message: Tuple[str, str, Any]) -> None:
+        kind, name, payload = message
+        run = self.runs.get(name)
+        if run is None or not run.running:
+            return  # late message from a worker that was already stopped
+        if kind == PHASE:
+            run.phase = payload["phase"]
+            run.phase_started[run.phase] = run.deadline.elapsed()
+        elif kind == RESULT:
+            run.model, run.metrics = payload
+            self._finish(run, STATUS_OK if run.model is not None else STATUS_ERROR)
+
+    def _finish(self, run: EngineRun, status: str) -> None:
+        run.status = status
+        if self.on_finish is not None:
+            self.on_finish(run)
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._handle(self.queue.get_nowait())
+            except _queue.Empty:
+                return
+
+    def _check_workers(self) -> None:
+        if self.global_deadline.expired():
+            for run in self.runs.values():
+                if run.running:
+                    self._stop(run, STATUS_CANCELLED)
+            return
+        for run in self.runs.values():
+            if not run.running:
+                continue
+            if run.deadline.expired():
+                self._stop(run, STATUS_TIMEOUT)
+            elif not run.process.is_alive():
+                # A result put just before exiting may still be in the pipe.
+                self._drain()
+                if run.running:
+                    run.process.join()
+                    self._finish(run, STATUS_DIED)
+                    logger.error("[Scheduler] %s exited (code %s) without reporting a result.", run.name, run.process.exitcode)
+
+    def _stop(self, run: EngineRun, status: str) -> None:
+        logger.warning("[Scheduler] Stopping %s (%s) after %.1fs in phase '%s'.", run.name, status, run.deadline.elapsed(), run.phase)
+        self._terminate(run.process)
+        self._finish(run, status)
+
+    def _terminate(self, process: Any) -> None:
+        if process.is_alive():
+            process.terminate()
+            process.join(self.grace_seconds)
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    def _reap(self, run: EngineRun) -> None:
+        """Wait briefly for a reported worker to exit, killing it if it lingers."""
+        run.process.join(self.grace_seconds)
+        if run.process.is_alive():
+            logger.warning("[Scheduler] %s did not exit after reporting; terminating it.", run.name)
+            self._terminate(run.process)
+
+
+__all__ = [
+    "CV_BUDGET_FRACTION",
+    "Deadline",
+    "EngineBudget",
+    "EngineRun",
+    "EngineScheduler",
+    "phase_message",
+    "result_message",
+    "split_budget",
+]
@@ -0,0 +1,118 @@
+"""Regression metrics computed from a single prediction.
+
+A ``scoring`` dict of ``make_scorer`` objects calls ``estimator.predict`` once
+*per metric*, which triples the cost of every CV fold for models whose
+prediction is expensive (AutoGluon stacks, TPOT pipelines).  The
+:class:`FusedScorer` here predicts once and derives every requested metric
+from the same residual vector.
+
+Error metrics (``rmse``, ``mae`` …) are reported as positive numbers; the
+``neg_*`` names follow the scikit-learn convention so that ``--metric`` values
+are accepted unchanged.
+"""
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Any, Callable, Dict, Sequence
+
+import numpy as np
+
+DEFAULT_METRICS = ("r2", "rmse", "mae")
+
+
+class _Residuals:
+    """Lazily computed statistics of ``y_true - y_pred`` shared by all metrics."""
+
+    def __init__(self, y_true: Any, y_pred: Any):
+        self.y_true = np.asarray(y_true, dtype=np.float64).ravel()
+        self.residual = self.y_true - np.asarray(y_pred, dtype=np.float64).ravel()
+        if self.y_true.shape != self.residual.shape:
+            raise ValueError(f"y_true has {self.y_true.size} values but y_pred has {self.residual.size}.")
+
+    @cached_property
+    def sse(self) -> float:
+        return float(np.dot(self.residual, self.residual))
+
+    @cached_property
+    def mse(self) -> float:
+        return self.sse / self.residual.size
+
+    @cached_property
+    def mae(self) -> float:
+        return float(np.abs(self.residual).mean())
+
+    @cached_property
+    def sst(self) -> float:
+        centred = self.y_true - self.y_true.mean()
+        return float(np.dot(centred, centred))
+
+
+def _r2(r: _Residuals) -> float:
+    # Same convention as sklearn.metrics.r2_score for a constant target.
+    if r.sst == 0.0:
+        return 1.0 if r.sse == 0.0 else 0.0
+    return 1.0 - r.sse / r.sst
+
+
+def _explained_variance(r: _Residuals) -> float:
+    var_true = r.sst / r.residual.size
+    var_res = float(np.var(r.residual))
+    if var_true == 0.0:
+        return 1.0 if var_res == 0.0 else 0.0
+    return 1.0 - var_res / var_true
+
+
+METRICS: Dict[str, Callable[[_Residuals], float]] = {
+    "r2": _r2,
+    "rmse": lambda r: float(np.sqrt(r.mse)),
+    "mse": lambda r: r.mse,
+    "mae": lambda r: r.mae,
+    "max_error": lambda r: float(np.abs(r.residual).max()),
+    "explained_variance": _explained_variance,
+    "neg_mean_squared_error": lambda r: -r.mse,
+    "neg_root_mean_squared_error": lambda r: -float(np.sqrt(r.mse)),
+    "neg_mean_absolute_error": lambda r: -r.mae,
+}
+
+
+# Metrics where a larger value is better; every other metric is an error.
+GREATER_IS_BETTER = frozenset(
+    {"r2", "explained_variance", "neg_mean_squared_error", "neg_root_mean_squared_error", "neg_mean_absolute_error"}
+)
+
+
+def regression_metrics(y_true: Any, y_pred: Any, metrics: Sequence[str] = DEFAULT_METRICS) -> Dict[str, float]:
+    """Compute every metric in *metrics* from one residual array."""
+    unknown = [m for m in metrics if m not in METRICS]
+    if unknown:
+        raise ValueError(f"Unsupported metric(s): {', '.join(unknown)}. Choose from {sorted(METRICS)}.")
+    residuals = _Residuals(y_true, y_pred)
+    return {name: METRICS[name](residuals) for name in metrics}
+
+
+class FusedScorer:
+    """``scorer(estimator, X, y) -> {metric: value}`` with a single ``predict`` call.
+
+    Accepted wherever :func:`scripts.cross_validation.parallel_cross_validate`
+    takes ``scoring``.
+    """
+
+    def __init__(self, metrics: Sequence[str] = DEFAULT_METRICS):
+        # Keep order, drop duplicates (e.g. the CLI metric is already "r2").
+        self.metrics = tuple(dict.fromkeys(metrics))
+        unknown = [m for m in self.metrics if m not in METRICS]
+        if unknown:
+            raise ValueError(f"Unsupported metric(s): {', '.join(unknown)}. Choose from {sorted(METRICS)}.")
+
+    def __call__(self, estimator: Any, X: Any, y: Any) -> Dict[str, float]:
+        return self.score_predictions(y, estimator.predict(X))
+
+    def score_predictions(self, y_true: Any, y_pred: Any) -> Dict[str, float]:
+        """Metrics for predictions that have already been made."""
+        return regression_metrics(y_true, y_pred, self.metrics)
+
+    def __repr__(self) -> str:
+        return f"FusedScorer(metrics={list(self.metrics)!r})"
+
+
+__all__ = ["DEFAULT_METRICS", "GREATER_IS_BETTER", "METRICS", "FusedScorer", "regression_metrics"]
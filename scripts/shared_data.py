@@ -0,0 +1,235 @@
+"""Zero-copy dataset hand-off between the orchestrator and engine workers.
+
+The concurrent meta-search spawns one process per engine.  Passing ``X``/``y``
+as plain ``Process`` arguments pickles the full training matrix once per
+engine, so every child ends up with a private copy.  This module instead
+copies the numeric data *once* into ``multiprocessing.shared_memory`` segments
+and hands the children a small, picklable :class:`SharedDatasetHandle`
+(segment names, dtypes, shapes and column metadata).  Each child attaches to
+the segments read-only and rebuilds the pandas objects as views over the
+shared buffers – no per-process copy of the matrix is made.
+
+Columns are grouped by dtype so that a homogeneous frame (the usual case after
+feature engineering) maps onto a single Fortran-ordered block.  Non-numeric
+columns cannot live in a raw buffer and are carried inside the handle itself.
+A frame that is already a full view of an ``.npy`` memory map (see
+``scripts.array_store``) is not copied at all: the handle records the file and
+each worker maps it read-only, sharing the OS page cache.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scripts.array_store import backing_file, open_npy
+
+
+@dataclass(frozen=True)
+class _BlockSpec:
+    """Location and layout of one dtype-homogeneous block of columns."""
+
+    shm_name: str
+    dtype: str
+    shape: Tuple[int, ...]
+    columns: Tuple[Any, ...] = ()
+    # Set instead of ``shm_name`` when the block already lives in an ``.npy``
+    # file; workers then map that file rather than a shared-memory copy.
+    path: str | None = None
+
+
+@dataclass(frozen=True)
+class SharedDatasetHandle:
+    """Picklable description of a dataset living in shared memory."""
+
+    blocks: Tuple[_BlockSpec, ...]
+    target: _BlockSpec
+    columns: Tuple[Any, ...]
+    index: pd.Index
+    target_name: Any = None
+    # Non-numeric columns are shipped by value; they are rare after feature
+    # engineering and cannot be represented as a flat buffer anyway.
+    object_columns: Dict[Any, pd.Series] = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the shared segments in bytes."""
+        specs = (*self.blocks, self.target)
+        return int(sum(np.dtype(s.dtype).itemsize * int(np.prod(s.shape)) for s in specs if s.path is None))
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without registering it for cleanup.
+
+    Only the creating process owns (and unlinks) a segment.  Python >= 3.13
+    lets us say so explicitly; older interpreters share the parent's resource
+    tracker under the ``spawn`` start method, so the duplicate registration is
+    harmless there.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedDataset:
+    """Owner (or attached view) of a dataset stored in shared memory.
+
+    Create the segments in the parent with :meth:`from_frame` and pass
+    :attr:`handle` to the worker processes, which call :meth:`attach`.  The
+    owner must outlive its workers; use it as a context manager so that the
+    segments are unlinked even when an engine crashes.
+    """
+
+    def __init__(self, handle: SharedDatasetHandle, segments: List[shared_memory.SharedMemory | None], *, owner: bool):
+        self.handle = handle
+        self._segments = segments
+        self._owner = owner
+        self._X: pd.DataFrame | None = None
+        self._y: pd.Series | None = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_frame(cls, X: pd.DataFrame, y: pd.Series) -> "SharedDataset":
+        """Copy ``X`` and ``y`` into freshly created shared-memory segments."""
+        segments: List[shared_memory.SharedMemory | None] = []
+        blocks: List[_BlockSpec] = []
+        object_columns: Dict[Any, pd.Series] = {}
+        columns = tuple(X.columns)
+
+        try:
+            npy_file = backing_file(X) if X.shape[1] else None
+            if npy_file is not None:
+                values = X.to_numpy()
+                blocks.append(_BlockSpec("", values.dtype.str, tuple(values.shape), columns, path=str(npy_file)))
+                segments.append(None)
+                X = X.iloc[:, :0]
+
+            numeric = X.select_dtypes(include=["number", "bool"])
+            for col in X.columns.difference(numeric.columns, sort=False):
+                object_columns[col] = X[col]
+
+            by_dtype: Dict[np.dtype, List[Any]] = {}
+            for col, dtype in numeric.dtypes.items():
+                by_dtype.setdefault(np.dtype(dtype), []).append(col)
+
+            for dtype, cols in by_dtype.items():
+                spec, shm = cls._create_block(numeric[cols].to_numpy(dtype=dtype), columns=tuple(cols))
+                blocks.append(spec)
+                segments.append(shm)
+
+            target_spec, target_shm = cls._create_block(np.asarray(y))
+            segments.append(target_shm)
+        except Exception:
+            for shm in segments:
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+            raise
+
+        handle = SharedDatasetHandle(
+            blocks=tuple(blocks),
+            target=target_spec,
+            columns=columns,
+            index=X.index,
+            target_name=getattr(y, "name", None),
+            object_columns=object_columns,
+        )
+        return cls(handle, segments, owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedDatasetHandle) -> "SharedDataset":
+        """Attach to the segments described by ``handle`` (read-only)."""
+        specs = (*handle.blocks, handle.target)
+        segments = [None if spec.path else _attach_segment(spec.shm_name) for spec in specs]
+        return cls(handle, segments, owner=False)
+
+    @staticmethod
+    def _create_block(array: np.ndarray, columns: Tuple[Any, ...] = ()) -> Tuple[_BlockSpec, shared_memory.SharedMemory]:
+        # Column-major layout keeps every column contiguous, which is what
+        # pandas and most column-wise estimators want to read.
+        order = "F" if array.ndim == 2 else "C"
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, order=order)
+        view[...] = array
+        return _BlockSpec(shm.name, array.dtype.str, tuple(array.shape), columns), shm
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+    def _view(self, spec: _BlockSpec, shm: shared_memory.SharedMemory | None) -> np.ndarray:
+        if spec.path is not None:
+            return open_npy(spec.path)
+        order = "F" if len(spec.shape) == 2 else "C"
+        array = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=shm.buf, order=order)
+        if not self._owner:
+            array.flags.writeable = False
+        return array
+
+    @property
+    def X(self) -> pd.DataFrame:
+        """Predictors as a DataFrame backed directly by the shared buffers."""
+        if self._X is None:
+            handle = self.handle
+            frames = [
+                pd.DataFrame(self._view(spec, shm), columns=list(spec.columns), index=handle.index, copy=False)
+                for spec, shm in zip(handle.blocks, self._segments)
+            ]
+            frames.extend(s.to_frame(name=col) for col, s in handle.object_columns.items())
+            if not frames:
+                X = pd.DataFrame(index=handle.index)
+            elif len(frames) == 1:
+                X = frames[0]
+            else:
+                X = pd.concat(frames, axis=1, copy=False)
+            if tuple(X.columns) != handle.columns:
+                # Column selection with a list returns a copy; only reorder
+                # when the dtype grouping actually changed the order.
+                X = X[list(handle.columns)]
+            self._X = X
+        return self._X
+
+    @property
+    def y(self) -> pd.Series:
+        """Target as a Series backed directly by the shared buffer."""
+        if self._y is None:
+            view = self._view(self.handle.target, self._segments[-1])
+            self._y = pd.Series(view, index=self.handle.index, name=self.handle.target_name, copy=False)
+        return self._y
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Release the views and segments; the owner also unlinks them."""
+        self._X = None
+        self._y = None
+        for shm in self._segments:
+            if shm is None:
+                continue
+            try:
+                shm.close()
+            except BufferError:
+                # A caller still holds a view; the mapping is released when
+                # that view is garbage collected.
+                pass
+            if self._owner:
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+        self._segments = []
+
+    def __enter__(self) -> "SharedDataset":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+__all__ = ["SharedDataset", "SharedDatasetHandle"]
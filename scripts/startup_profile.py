@@ -0,0 +1,89 @@
+"""Timing report for ``orchestrator.py --profile-startup``.
+
+Records how long the CLI takes to become ready (module import, argument
+parsing, logging setup), how long each engine worker takes from ``start()``
+until it reports that its search has begun, and which heavy libraries were
+already imported in the parent process.  Engine wrappers and scikit-learn are
+imported lazily, so a healthy report shows none of them loaded at startup.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Dict, List, Mapping, Tuple
+
+# Libraries whose import cost dominates start-up when loaded eagerly.
+HEAVY_MODULES = (
+    "sklearn",
+    "scipy",
+    "pyarrow",
+    "xgboost",
+    "lightgbm",
+    "torch",
+    "autosklearn",
+    "tpot",
+    "autogluon",
+)
+
+
+class StartupProfile:
+    """Wall-clock phases measured from the moment ``orchestrator`` started importing."""
+
+    def __init__(self, origin: float):
+        self.origin = origin
+        self._last = origin
+        self.phases: List[Tuple[str, float]] = []
+        self.heavy_at_startup: List[str] = []
+        self.workers: Dict[str, float] = {}
+        self.engine_imports: Dict[str, float] = {}
+
+    def mark(self, label: str, at: float | None = None) -> None:
+        """Close the current phase under *label* (at ``perf_counter()`` time *at*, default now)."""
+        now = time.perf_counter() if at is None else at
+        self.phases.append((label, now - self._last))
+        self._last = now
+
+    def ready(self) -> None:
+        """Note which heavy libraries are loaded once the CLI is ready to work."""
+        self.heavy_at_startup = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    @property
+    def startup_seconds(self) -> float:
+        return sum(seconds for _, seconds in self.phases)
+
+    def record_workers(self, per_engine_metrics: Mapping[str, Mapping[str, Any]]) -> None:
+        """Collect the spawn-to-search latency reported for each engine worker."""
+        for name, metrics in per_engine_metrics.items():
+            seconds = metrics.get("startup_seconds", metrics.get("search_started_seconds"))
+            if seconds is not None:
+                self.workers[name] = float(seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "startup_seconds": self.startup_seconds,
+            "phases": {label: seconds for label, seconds in self.phases},
+            "heavy_modules_at_startup": self.heavy_at_startup,
+            "worker_startup_seconds": self.workers,
+            "engine_import_seconds": self.engine_imports,
+        }
+
+    def render(self):
+        """Rich table of the report."""
+        from rich.table import Table
+
+        table = Table(title="Startup profile", show_lines=False)
+        table.add_column("Phase")
+        table.add_column("Seconds", justify="right")
+        for label, seconds in self.phases:
+            table.add_row(label, f"{seconds:.3f}")
+        table.add_row("[bold]CLI ready[/bold]", f"[bold]{self.startup_seconds:.3f}[/bold]")
+        for name, seconds in self.engine_imports.items():
+            table.add_row(f"import {name}", f"{seconds:.3f}")
+        for name, seconds in self.workers.items():
+            table.add_row(f"worker {name}: spawn → search", f"{seconds:.3f}")
+        heavy = ", ".join(self.heavy_at_startup) or "none"
+        table.caption = f"Heavy libraries loaded at startup: {heavy}"
+        return table
+
+
+__all__ = ["HEAVY_MODULES", "StartupProfile"]
@@ -0,0 +1,244 @@
+"""Vectorized multi-column target encoding with out-of-fold smoothing.
+
+:class:`TargetEncoder` factorizes every categorical column once, offsets the
+per-column codes into one shared code space and gets the target sums and
+counts of *all* levels of *all* columns from a single ``np.bincount``.
+Encoding is then one fancy-index lookup into the concatenated table, so a
+column with a million levels costs the same Python overhead as one with
+three.
+
+Means are smoothed towards the global target mean (an m-estimate)::
+
+    encoding = (sum + smoothing * prior) / (count + smoothing)
+
+Encoding the rows the encoder was fitted on with their own targets leaks the
+target into cross-validation.  The statistics are therefore kept per fold
+(row ``i`` belongs to fold ``i % cv``, so the assignment is the same whether
+the data arrives at once or in chunks) and :meth:`TargetEncoder.fit_transform`
+encodes each training row with the statistics of the *other* folds only.
+:meth:`TargetEncoder.transform` encodes new rows with all of them.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
+
+
+class TargetEncoder(TransformerMixin, BaseEstimator):
+    """Smoothed, out-of-fold target encoding of several columns at once.
+
+    Parameters
+    ----------
+    columns : sequence | None
+        Columns to encode.  By default every ``object`` and ``category``
+        column seen by the first ``fit``/``partial_fit``.
+    smoothing : float
+        Weight ``m`` of the global mean in the m-estimate; ``0`` gives the
+        raw per-level means.
+    cv : int
+        Number of interleaved folds for out-of-fold encoding of the training
+        rows; ``cv < 2`` disables it.
+    dtype : str
+        Floating-point type of the encoded columns.
+
+    Attributes
+    ----------
+    columns_ : list
+        Encoded columns.
+    categories_ : list of pd.Index
+        Levels seen per column, in order of first appearance.
+    n_samples_seen_ : int
+        Rows accumulated so far.
+    """
+
+    def __init__(
+        self,
+        *,
+        columns: Sequence[Any] | None = None,
+        smoothing: float = 10.0,
+        cv: int = 5,
+        dtype: str = "float64",
+    ):
+        self.columns = columns
+        self.smoothing = smoothing
+        self.cv = cv
+        self.dtype = dtype
+
+    # ------------------------------------------------------------------
+    # Fitting
+    # ------------------------------------------------------------------
+    def fit(self, X: pd.DataFrame, y: Any) -> "TargetEncoder":
+        for attr in ("columns_", "_tables"):
+            self.__dict__.pop(attr, None)
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X: pd.DataFrame, y: Any) -> "TargetEncoder":
+        """Accumulate the target statistics of another chunk of rows.
+
+        Chunks must arrive in row order: fold membership follows the running
+        row position.
+        """
+        self._accumulate(X, y)
+        return self
+
+    def fit_transform(self, X: pd.DataFrame, y: Any = None, **fit_params: Any) -> np.ndarray:
+        """Fit on ``X``/``y`` and return the out-of-fold encoding of ``X``."""
+        for attr in ("columns_", "_tables"):
+            self.__dict__.pop(attr, None)
+        codes = self._accumulate(X, y)
+        return self._encode_codes(codes, out_of_fold=True, start=0)
+
+    def _accumulate(self, X: pd.DataFrame, y: Any) -> np.ndarray:
+        """Add a chunk's statistics; return its codes in the shared level space."""
+        if not hasattr(self, "columns_"):
+            columns = self.columns
+            if columns is None:
+                columns = X.select_dtypes(include=["object", "category"]).columns
+            self.columns_: List[Any] = list(columns)
+            self.categories_: List[pd.Index] = [pd.Index([], dtype=object) for _ in self.columns_]
+            self._sums: List[np.ndarray] = [np.zeros((self._n_folds, 0)) for _ in self.columns_]
+            self._counts: List[np.ndarray] = [np.zeros((self._n_folds, 0)) for _ in self.columns_]
+            self._fold_sums = np.zeros(self._n_folds)
+            self._fold_counts = np.zeros(self._n_folds)
+            self.n_samples_seen_ = 0
+
+        y = np.asarray(y, dtype=np.float64)
+        folds = self._folds(self.n_samples_seen_, len(y))
+        local = np.empty((len(y), len(self.columns_)), dtype=np.int64)
+        for j, col in enumerate(self.columns_):
+            if not len(self.categories_[j]):
+                codes, levels = pd.factorize(X[col])
+                self.categories_[j] = pd.Index(np.asarray(levels, dtype=object), dtype=object)
+                local[:, j] = codes
+                continue
+            values = X[col].to_numpy(dtype=object)
+            codes = self.categories_[j].get_indexer(values)
+            new = (codes < 0) & pd.notna(values)
+            if new.any():
+                new_codes, new_levels = pd.factorize(values[new])
+                codes[new] = new_codes + len(self.categories_[j])
+                self.categories_[j] = self.categories_[j].append(pd.Index(new_levels, dtype=object))
+            local[:, j] = codes
+
+        # One bincount over (fold, column, level) for every cell of the chunk.
+        sizes = [len(levels) for levels in self.categories_]
+        offsets = np.cumsum([0, *sizes])
+        width = offsets[-1] + 1  # last slot collects missing values
+        codes = np.where(local >= 0, local + offsets[:-1], width - 1)
+        flat = codes + (folds * width)[:, None]
+        sums = np.bincount(flat.ravel(), weights=np.repeat(y, len(self.columns_)), minlength=self._n_folds * width)
+        counts = np.bincount(flat.ravel(), minlength=self._n_folds * width)
+        sums = sums.reshape(self._n_folds, width)
+        counts = counts.reshape(self._n_folds, width)
+        for j in range(len(self.columns_)):
+            span = slice(offsets[j], offsets[j + 1])
+            self._sums[j] = _grow(self._sums[j], sizes[j]) + sums[:, span]
+            self._counts[j] = _grow(self._counts[j], sizes[j]) + counts[:, span]
+
+        self._fold_sums += np.bincount(folds, weights=y, minlength=self._n_folds)
+        self._fold_counts += np.bincount(folds, minlength=self._n_folds)
+        self.n_samples_seen_ += len(y)
+        self._tables = None
+        return codes
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+    def transform(self, X: pd.DataFrame, *, out_of_fold: bool = False, start: int = 0) -> np.ndarray:
+        """Encode ``X[columns_]`` into an ``(n_rows, n_columns)`` array.
+
+        With ``out_of_fold=True`` the rows are taken to be fitted rows at
+        positions ``start, start + 1, ...`` and each is encoded with the
+        statistics of the folds it does not belong to.  Unseen and missing
+        levels get the (fold's) global mean.
+        """
+        check_is_fitted(self, "columns_")
+        return self._encode_codes(self._codes(X), out_of_fold=out_of_fold, start=start)
+
+    def _encode_codes(self, codes: np.ndarray, *, out_of_fold: bool, start: int) -> np.ndarray:
+        full, oof = self._lookup_tables()
+        if out_of_fold and oof is not None:
+            folds = self._folds(start, len(codes))
+            out = oof[folds[:, None], codes]
+        else:
+            out = full[codes]
+        return out.astype(self.dtype, copy=False)
+
+    @property
+    def global_mean_(self) -> float:
+        check_is_fitted(self, "columns_")
+        return float(self._fold_sums.sum() / max(self._fold_counts.sum(), 1))
+
+    @property
+    def encodings_(self) -> Dict[Any, pd.Series]:
+        """Per column, the smoothed full-data encoding of each level."""
+        full, _ = self._lookup_tables()
+        offsets = np.cumsum([0, *(len(levels) for levels in self.categories_)])
+        return {
+            col: pd.Series(full[offsets[j]:offsets[j + 1]], index=self.categories_[j], name=col)
+            for j, col in enumerate(self.columns_)
+        }
+
+    def get_feature_names_out(self, input_features: Any = None) -> np.ndarray:
+        check_is_fitted(self, "columns_")
+        return np.asarray(self.columns_, dtype=object)
+
+    # ------------------------------------------------------------------
+    @property
+    def _n_folds(self) -> int:
+        return self.cv if self.cv >= 2 else 1
+
+    def _folds(self, start: int, n: int) -> np.ndarray:
+        return np.arange(start, start + n) % self._n_folds
+
+    def _codes(self, X: pd.DataFrame) -> np.ndarray:
+        """Codes of ``X`` in the shared level space; unseen/missing -> last slot."""
+        sizes = [len(levels) for levels in self.categories_]
+        offsets = np.cumsum([0, *sizes])
+        codes = np.empty((len(X), len(self.columns_)), dtype=np.int64)
+        for j, col in enumerate(self.columns_):
+            local = self.categories_[j].get_indexer(X[col].to_numpy(dtype=object))
+            codes[:, j] = np.where(local >= 0, local + offsets[j], offsets[-1])
+        return codes
+
+    def _lookup_tables(self) -> tuple[np.ndarray, np.ndarray | None]:
+        """Concatenated encodings: full data, and per fold (``None`` without folds)."""
+        check_is_fitted(self, "columns_")
+        if self._tables is None:
+            empty = np.zeros((self._n_folds, 0))
+            sums = np.concatenate([empty, *self._sums], axis=1)
+            counts = np.concatenate([empty, *self._counts], axis=1)
+            full = self._smooth(sums.sum(axis=0), counts.sum(axis=0), self._fold_sums.sum(), self._fold_counts.sum())
+            oof = None
+            if self._n_folds > 1:
+                oof = self._smooth(
+                    sums.sum(axis=0) - sums,
+                    counts.sum(axis=0) - counts,
+                    self._fold_sums.sum() - self._fold_sums,
+                    self._fold_counts.sum() - self._fold_counts,
+                )
+            self._tables = (full, oof)
+        return self._tables
+
+    def _smooth(self, sums: np.ndarray, counts: np.ndarray, target_sum: Any, n: Any) -> np.ndarray:
+        """m-estimate per level, with a trailing slot holding the prior."""
+        target_sum = np.asarray(target_sum, dtype=np.float64)
+        n = np.asarray(n, dtype=np.float64)
+        prior = np.divide(target_sum, n, out=np.zeros_like(target_sum), where=n > 0)[..., None]
+        denominator = counts + self.smoothing
+        means = np.divide(sums + self.smoothing * prior, denominator, out=np.broadcast_to(prior, sums.shape).copy(), where=denominator > 0)
+        return np.concatenate([means, prior], axis=-1)
+
+
+def _grow(stats: np.ndarray, size: int) -> np.ndarray:
+    """Pad per-fold level statistics with zero columns for newly seen levels."""
+    if stats.shape[1] == size:
+        return stats
+    return np.pad(stats, ((0, 0), (0, size - stats.shape[1])))
+
+
+__all__ = ["TargetEncoder"]
@@ -0,0 +1,62 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import components.registry as registry_mod
+from components.registry import ComponentRegistry
+
+
+def _write_block(path: Path, name: str, kind: str, hyperparameters: str = "{}") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "import a_library_that_is_not_installed\n"
+        "from components.base import BaseEstimatorBlock\n\n\n"
+        f"class {name}Block(BaseEstimatorBlock):\n"
+        f"    signature = {{'type': '{kind}', 'name': '{name}', 'hyperparameters': {hyperparameters}}}\n"
+    )
+
+
+def test_index_reads_signatures_without_importing(tmp_path, monkeypatch):
+    root = tmp_path / "components"
+    _write_block(root / "models" / "Heavy.py", "Heavy", "model", "{'depth': 'int'}")
+    _write_block(root / "preprocessors" / "outliers" / "Filter.py", "Filter", "preprocessor")
+    (root / "models" / "__init__.py").write_text("")
+
+    calls = []
+    parse = registry_mod.parse_module
+    monkeypatch.setattr(registry_mod, "parse_module", lambda *a, **k: calls.append(a[0].name) or parse(*a, **k))
+
+    cache = tmp_path / "index.json"
+    registry = ComponentRegistry(root, cache_path=cache)
+    assert registry.names("model") == ["Heavy"]
+    assert registry.names("preprocessor") == ["Filter"]
+    assert registry.search_space("model") == {"Heavy": {"depth": "int"}}
+    spec = registry.get("Filter")
+    assert (spec.module, spec.class_name, spec.category) == ("components.preprocessors.outliers.Filter", "FilterBlock", "outliers")
+    assert sorted(calls) == ["Filter.py", "Heavy.py"] and cache.is_file()
+
+    # A fresh registry is served from the cache; only changed files are re-parsed.
+    calls.clear()
+    assert ComponentRegistry(root, cache_path=cache).names() == ["Filter", "Heavy"]
+    assert calls == []
+    _write_block(root / "models" / "Heavy.py", "Heavy", "model", "{'depth': 'int', 'eta': 'float'}")
+    assert ComponentRegistry(root, cache_path=cache).get("Heavy").hyperparameters == {"depth": "int", "eta": "float"}
+    assert calls == ["Heavy.py"]
+
+    with pytest.raises(KeyError, match="Unknown component 'Missing'"):
+        registry.get("Missing")
+
+
+def test_blocks_load_lazily_on_first_use(tmp_path):
+    registry = ComponentRegistry(cache_path=tmp_path / "index.json")
+    assert {"Ridge", "XGBoost", "LightGBM"} <= set(registry.names("model"))
+    assert registry.get("KMeansOutlier").category == "outliers"
+
+    ridge = registry.load("Ridge")
+    assert ridge.__name__ == "RidgeBlock" and registry.load("Ridge") is ridge
+    assert registry.signature("Ridge") == ridge.get_signature()
+    assert registry.create("KMeansOutlier", n_clusters=3).n_clusters == 3
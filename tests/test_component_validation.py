@@ -39,7 +39,7 @@ def load_orchestrator(monkeypatch):
         return None, None
     dl_mod.load_data = load_data
     fe_mod = types.ModuleType('scripts.feature_engineering')
-    fe_mod.engineer_features = lambda X, y=None: (
+    fe_mod.engineer_features = lambda X, y=None, **kwargs: (
         X,
         types.SimpleNamespace(named_steps={'pca': types.SimpleNamespace(n_components_=1)}),
     )
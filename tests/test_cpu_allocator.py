@@ -0,0 +1,58 @@
+from pathlib import Path
+import os
+import sys
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.cpu_allocator import CoreAllocator, available_cores, pin_process, thread_env
+
+
+def test_even_and_weighted_partitions_are_disjoint():
+    even = CoreAllocator(range(16)).allocate(["a", "b", "c"])
+    assert [len(c) for c in even.values()] == [6, 5, 5]
+    assert sorted(c for cores in even.values() for c in cores) == list(range(16))
+
+    weighted = CoreAllocator(range(16), weights={"a": 2, "b": 1, "c": 1}).allocate(["a", "b", "c"])
+    assert [len(c) for c in weighted.values()] == [8, 4, 4]
+
+
+def test_more_engines_than_cores_share_round_robin():
+    assert CoreAllocator([0, 1]).allocate(["a", "b", "c"]) == {"a": [0], "b": [1], "c": [0]}
+
+
+def test_release_hands_freed_cores_to_running_engines():
+    allocator = CoreAllocator(range(12))
+    before = allocator.allocate(["a", "b", "c"])
+
+    changed = allocator.release("a")
+
+    assert set(changed) == {"b", "c"}
+    for name in ("b", "c"):
+        assert changed[name][: len(before[name])] == before[name]  # keeps its own cores
+    assert sorted(c for cores in allocator.assignments.values() for c in cores) == list(range(12))
+    allocator.release("b")
+    assert sorted(allocator.assignments["c"]) == list(range(12))
+
+
+def test_thread_env_is_restored(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "16")
+    monkeypatch.delenv("MKL_NUM_THREADS", raising=False)
+    with thread_env(3):
+        assert os.environ["OMP_NUM_THREADS"] == "3"
+        assert os.environ["MKL_NUM_THREADS"] == "3"
+    assert os.environ["OMP_NUM_THREADS"] == "16"
+    assert "MKL_NUM_THREADS" not in os.environ
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="no CPU affinity API")
+def test_pin_process_restricts_affinity():
+    original = os.sched_getaffinity(0)
+    try:
+        core = available_cores(1)
+        assert pin_process(os.getpid(), core, include_children=False)
+        assert os.sched_getaffinity(0) == set(core)
+    finally:
+        pin_process(os.getpid(), sorted(original), include_children=False)
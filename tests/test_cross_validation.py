@@ -0,0 +1,80 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import make_scorer, r2_score
+from sklearn.model_selection import RepeatedKFold, cross_validate
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.cross_validation import fold_parallelism, parallel_cross_validate
+
+
+@pytest.mark.parametrize("n_cpus, expected", [(1, (1, 1)), (4, (4, 1)), (32, (15, 2))])
+def test_fold_parallelism_never_oversubscribes(n_cpus, expected):
+    assert fold_parallelism(n_cpus, 15) == expected
+
+
+@pytest.mark.parametrize("n_cpus", [1, 3])
+def test_matches_sklearn_cross_validate(n_cpus):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 3))
+    y = X @ np.array([1.0, -2.0, 0.5]) + rng.normal(scale=0.1, size=60)
+    cv = RepeatedKFold(n_splits=5, n_repeats=2, random_state=0)
+    scoring = {"r2": make_scorer(r2_score)}
+
+    expected = cross_validate(LinearRegression(), X, y, cv=cv, scoring=scoring)
+    result = parallel_cross_validate(LinearRegression(), X, y, cv=cv, scoring=scoring, n_cpus=n_cpus, backend="threading")
+
+    np.testing.assert_allclose(result["test_r2"], expected["test_r2"])
+    assert result["fold_time"].shape == (10,)
+    assert result["n_jobs"] == n_cpus
+
+
+def test_fused_scorer_predicts_once_per_fold():
+    from sklearn.metrics import mean_absolute_error, mean_squared_error
+
+    from scripts.scoring import FusedScorer
+
+    class CountingRegression(LinearRegression):
+        calls = 0
+
+        def predict(self, X):
+            type(self).calls += 1
+            return super().predict(X)
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(40, 2))
+    y = X.sum(axis=1) + rng.normal(scale=0.3, size=40)
+    cv = RepeatedKFold(n_splits=4, n_repeats=1, random_state=0)
+    scorer = FusedScorer(("r2", "rmse", "mae", "neg_mean_squared_error", "r2"))
+
+    result = parallel_cross_validate(CountingRegression(), X, y, cv=cv, scoring=scorer)
+
+    assert CountingRegression.calls == 4
+    assert scorer.metrics == ("r2", "rmse", "mae", "neg_mean_squared_error")
+    train, test = next(cv.split(X, y))
+    y_pred = LinearRegression().fit(X[train], y[train]).predict(X[test])
+    assert result["test_r2"][0] == pytest.approx(r2_score(y[test], y_pred))
+    assert result["test_rmse"][0] == pytest.approx(np.sqrt(mean_squared_error(y[test], y_pred)))
+    assert result["test_mae"][0] == pytest.approx(mean_absolute_error(y[test], y_pred))
+    assert result["test_neg_mean_squared_error"][0] == pytest.approx(-mean_squared_error(y[test], y_pred))
+
+
+def test_out_of_fold_predictions_average_the_repeats():
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(30, 2))
+    y = X[:, 0] - X[:, 1]
+    cv = RepeatedKFold(n_splits=3, n_repeats=2, random_state=0)
+
+    result = parallel_cross_validate(
+        LinearRegression(), X, y, cv=cv, scoring={"r2": make_scorer(r2_score)}, return_predictions=True
+    )
+
+    expected = np.zeros(len(y))
+    for train, test in cv.split(X, y):
+        expected[test] += LinearRegression().fit(X[train], y[train]).predict(X[test]) / 2
+    np.testing.assert_allclose(result["oof_predictions"], expected)
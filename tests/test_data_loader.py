@@ -0,0 +1,135 @@
+from pathlib import Path
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.data_loader import load_data, sidecar_path
+
+pytest.importorskip("pyarrow")
+
+
+def _write_csvs(tmp_path):
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4, 5, 6], "c": ["x", "y", "z"]})
+    y = pd.DataFrame({"target": [0.5, 1.5, 2.5]})
+    X.to_csv(tmp_path / "p.csv", index=False)
+    y.to_csv(tmp_path / "t.csv", index=False)
+    return X, y["target"]
+
+
+def test_parquet_and_feather_with_column_projection(tmp_path):
+    X, y = _write_csvs(tmp_path)
+    X.to_parquet(tmp_path / "p.parquet")
+    X.to_feather(tmp_path / "p.feather")
+    y.to_frame().to_parquet(tmp_path / "t.parquet")
+
+    for name in ("p.parquet", "p.feather"):
+        X_loaded, y_loaded = load_data(tmp_path / name, tmp_path / "t.parquet", columns=["a", "c"])
+        pd.testing.assert_frame_equal(X_loaded, X[["a", "c"]])
+        pd.testing.assert_series_equal(y_loaded, y)
+
+
+def test_csv_sidecar_written_reused_and_invalidated(tmp_path, monkeypatch):
+    X, _ = _write_csvs(tmp_path)
+    csv = tmp_path / "p.csv"
+
+    X_first, _ = load_data(csv, tmp_path / "t.csv")
+    side = sidecar_path(csv)
+    assert side.exists()
+    pd.testing.assert_frame_equal(X_first, X)
+
+    stat = csv.stat()
+    with monkeypatch.context() as m:
+        m.setattr(pd, "read_csv", lambda *a, **k: pytest.fail("CSV re-parsed despite valid sidecar"))
+        X_cached, _ = load_data(csv, tmp_path / "t.csv", columns=["b"])
+    pd.testing.assert_frame_equal(X_cached, X[["b"]])
+
+    # Rewriting the CSV changes its fingerprint, so the sidecar is rebuilt.
+    X2 = X.assign(a=[7.0, 8.0, 9.0])
+    X2.to_csv(csv, index=False)
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    X_fresh, _ = load_data(csv, tmp_path / "t.csv")
+    pd.testing.assert_frame_equal(X_fresh, X2)
+
+
+def test_unsupported_format(tmp_path):
+    _write_csvs(tmp_path)
+    (tmp_path / "p.txt").write_text("a\n1\n")
+    with pytest.raises(ValueError):
+        load_data(tmp_path / "p.txt", tmp_path / "t.csv")
+
+
+def test_mmap_load_is_read_only_and_cached(tmp_path):
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4, 5, 6]})
+    X.to_csv(tmp_path / "p.csv", index=False)
+    pd.DataFrame({"target": [0.5, 1.5, 2.5]}).to_csv(tmp_path / "t.csv", index=False)
+
+    from scripts.array_store import backing_file
+    from scripts.data_loader import mmap_cache_path
+
+    X_mm, _ = load_data(tmp_path / "p.csv", tmp_path / "t.csv", mmap_dtype="float32")
+    assert backing_file(X_mm) == mmap_cache_path(tmp_path / "p.csv", "float32")
+    assert not X_mm.to_numpy().flags.writeable
+    pd.testing.assert_frame_equal(X_mm, X.astype("float32"))
+
+    X_again, _ = load_data(tmp_path / "p.csv", tmp_path / "t.csv", mmap_dtype="float32")
+    assert backing_file(X_again) == backing_file(X_mm)
+
+
+def test_mmap_rejects_non_numeric(tmp_path):
+    _write_csvs(tmp_path)
+    with pytest.raises(ValueError):
+        load_data(tmp_path / "p.csv", tmp_path / "t.csv", mmap_dtype="float64")
+
+
+def test_downcast_dtypes_reports_savings():
+    from scripts.data_loader import downcast_dtypes
+
+    X = pd.DataFrame({
+        "f": [0.5, 1.5, 2.5, 3.5],
+        "i": [1, 2, 3, 4],
+        "low": ["a", "b", "a", "b"],
+        "high": ["w", "x", "y", "z"],
+    })
+    X_small, report = downcast_dtypes(X, "float32")
+    assert X_small["f"].dtype == "float32"
+    assert X_small["i"].dtype == "int8"
+    assert X_small["low"].dtype == "category"
+    assert X_small["high"].dtype == object
+    assert report["bytes_saved"] == report["bytes_before"] - report["bytes_after"] > 0
+    assert X["f"].dtype == "float64"  # input left untouched
+
+
+def test_iter_data_chunks_aligns_and_validates(tmp_path):
+    from scripts.data_loader import iter_data_chunks
+
+    X, y = _write_csvs(tmp_path)
+    X.to_parquet(tmp_path / "p.parquet")
+    for name in ("p.csv", "p.parquet"):
+        chunks = list(iter_data_chunks(tmp_path / name, tmp_path / "t.csv", chunk_rows=2))
+        assert [len(X_chunk) for X_chunk, _ in chunks] == [2, 1]
+        pd.testing.assert_frame_equal(pd.concat([c for c, _ in chunks]), X)
+        for X_chunk, y_chunk in chunks:
+            assert y_chunk.index.equals(X_chunk.index) and y_chunk.name == "target"
+
+    # Arrow record batches that do not divide chunk_rows are regrouped.
+    pa = pytest.importorskip("pyarrow")
+    wide = pd.DataFrame({"a": np.arange(10.0), "b": np.arange(10, 20)})
+    pd.DataFrame({"target": np.arange(10.0)}).to_csv(tmp_path / "t10.csv", index=False)
+    with pa.OSFile(str(tmp_path / "p.arrow"), "wb") as sink:
+        table = pa.Table.from_pandas(wide, preserve_index=False)
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=3)
+    chunks = list(iter_data_chunks(tmp_path / "p.arrow", tmp_path / "t10.csv", chunk_rows=4))
+    assert [len(X_chunk) for X_chunk, _ in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat([c for c, _ in chunks]), wide)
+    np.testing.assert_array_equal(pd.concat([t for _, t in chunks]).to_numpy(), np.arange(10.0))
+
+    pd.DataFrame({"target": [1.0, 2.0]}).to_csv(tmp_path / "short.csv", index=False)
+    with pytest.raises(ValueError, match="different row counts"):
+        list(iter_data_chunks(tmp_path / "p.csv", tmp_path / "short.csv", chunk_rows=2))
@@ -0,0 +1,101 @@
+from pathlib import Path
+import json
+import subprocess
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _fresh_interpreter(code: str) -> dict:
+    """Run *code* in a clean interpreter (other tests stub ``engines``)."""
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_engine_specs_import_no_wrappers():
+    result = _fresh_interpreter(
+        "import json, sys\n"
+        "from engines import engine_specs, get_spec\n"
+        "specs = engine_specs(['tpot', 'autogluon_wrapper'])\n"
+        "print(json.dumps({\n"
+        "    'names': list(specs),\n"
+        "    'alias': get_spec('autosklearn').name,\n"
+        "    'loaded': sorted(m for m in sys.modules if m.startswith('engines.') or m.split('.')[0] == 'sklearn'),\n"
+        "}))\n"
+    )
+    assert result["names"] == ["tpot_wrapper", "autogluon_wrapper"]
+    assert result["alias"] == "auto_sklearn_wrapper"
+    assert result["loaded"] == []
+
+
+def test_orchestrator_import_is_light():
+    result = _fresh_interpreter(
+        "import json, logging, sys\n"
+        "import orchestrator\n"
+        "print(json.dumps({\n"
+        "    'loaded': sorted(m for m in sys.modules if m.startswith('engines.') or m.split('.')[0] == 'sklearn'),\n"
+        "    'handlers': len(logging.getLogger().handlers),\n"
+        "}))\n"
+    )
+    assert result["loaded"] == []
+    # Logging handlers are attached by the CLI, not on import.
+    assert result["handlers"] == 0
+
+
+def test_get_spec_rejects_unknown_engine():
+    result = _fresh_interpreter(
+        "import json\n"
+        "from engines import get_spec\n"
+        "try:\n"
+        "    get_spec('h2o')\n"
+        "except ValueError as exc:\n"
+        "    print(json.dumps({'error': str(exc)}))\n"
+    )
+    assert "Unknown AutoML engine" in result["error"]
+
+
+def test_engine_selection_resolves_aliases_and_overrides():
+    result = _fresh_interpreter(
+        "import json, sys\n"
+        "from engines import EngineSelection\n"
+        "sel = EngineSelection.resolve(['tpot', 'autogluon'], time_budgets={'tpot': 60}, cpu_weights={'autogluon_wrapper': 2})\n"
+        "errors = []\n"
+        "for kwargs in ({'time_budgets': {'autosklearn': 10}}, {'cpu_weights': {'tpot': 0}}):\n"
+        "    try:\n"
+        "        EngineSelection.resolve(['tpot'], **kwargs)\n"
+        "    except ValueError as exc:\n"
+        "        errors.append(str(exc))\n"
+        "print(json.dumps({\n"
+        "    'names': list(sel.specs()),\n"
+        "    'budgets': [sel.time_budget('tpot_wrapper', 5), sel.time_budget('autogluon_wrapper', 5)],\n"
+        "    'weights': sel.cpu_weights,\n"
+        "    'errors': errors,\n"
+        "    'loaded': sorted(m for m in sys.modules if m.startswith('engines.')),\n"
+        "}))\n"
+    )
+    assert result["names"] == ["tpot_wrapper", "autogluon_wrapper"]
+    assert result["budgets"] == [60.0, 5]
+    assert result["weights"] == {"autogluon_wrapper": 2.0}
+    assert len(result["errors"]) == 2
+    assert result["loaded"] == []
+
+
+def test_native_engine_is_opt_in():
+    result = _fresh_interpreter(
+        "import json\n"
+        "from engines import EngineSelection, engine_specs, get_spec\n"
+        "print(json.dumps({\n"
+        "    'default': list(engine_specs()),\n"
+        "    'resolved': list(EngineSelection.resolve(['native', 'tpot']).names),\n"
+        "    'native': get_spec('native').name,\n"
+        "}))\n"
+    )
+    assert "native_wrapper" not in result["default"]
+    assert result["resolved"] == ["tpot_wrapper", "native_wrapper"]
+    assert result["native"] == "native_wrapper"
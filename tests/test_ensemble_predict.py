@@ -0,0 +1,58 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.ensemble_predict import weighted_predict
+
+
+class _Constant:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return np.full(len(X), self.value)
+
+
+def _models():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(101, 3)), columns=list("abc"))
+    y1 = X.to_numpy() @ np.array([1.0, 2.0, 3.0])
+    y2 = X.to_numpy() @ np.array([-1.0, 0.5, 0.0])
+    return X, [LinearRegression().fit(X, y1), LinearRegression().fit(X, y2)]
+
+
+def test_default_is_plain_mean():
+    X, models = _models()
+    expected = np.mean([m.predict(X) for m in models], axis=0)
+    np.testing.assert_allclose(weighted_predict(models, X), expected)
+
+
+@pytest.mark.parametrize("executor, n_jobs", [("thread", 1), ("thread", 3), ("process", 2)])
+def test_batched_weighted_prediction_matches_reference(executor, n_jobs):
+    X, models = _models()
+    expected = 0.25 * models[0].predict(X) + 0.75 * models[1].predict(X)
+
+    result = weighted_predict(models, X, weights=[1, 3], n_jobs=n_jobs, executor=executor, batch_size=17)
+
+    np.testing.assert_allclose(result, expected)
+
+
+def test_zero_weight_models_are_not_called():
+    unused = _Constant(100.0)
+    result = weighted_predict([_Constant(2.0), unused], np.zeros((5, 1)), weights=[1.0, 0.0], batch_size=2)
+    assert unused.calls == 0
+    np.testing.assert_allclose(result, 2.0)
+
+
+def test_invalid_weights_are_rejected():
+    with pytest.raises(ValueError):
+        weighted_predict([_Constant(1.0)], np.zeros((2, 1)), weights=[1.0, 2.0])
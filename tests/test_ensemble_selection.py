@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.ensemble_selection import greedy_ensemble_selection
+from scripts.oof_store import OOFStore
+
+
+def test_greedy_selection_weights_complementary_models():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=500)
+    noise = rng.normal(scale=0.5, size=500)
+    # Two models with opposite errors average to the truth; the third is useless.
+    P = np.column_stack([y + noise, y - noise, rng.normal(size=500)])
+
+    selection = greedy_ensemble_selection(P, y, names=["a", "b", "c"], metric="rmse", n_iterations=20)
+
+    assert selection.weights.sum() == pytest.approx(1.0)
+    assert selection.as_dict() == {"a": 0.5, "b": 0.5}
+    assert selection.score == pytest.approx(0.0, abs=1e-12)
+    assert min(selection.history) == pytest.approx(selection.score)
+
+
+def test_selection_ignores_rows_never_held_out():
+    y = np.array([1.0, 2.0, 3.0, 4.0])
+    P = np.array([[1.0, 0.0], [2.0, 0.0], [np.nan, 0.0], [4.0, 0.0]])
+
+    selection = greedy_ensemble_selection(P, y, n_iterations=3)
+
+    assert selection.weights.tolist() == [1.0, 0.0]
+    assert selection.score == pytest.approx(1.0)
+
+
+def test_oof_store_round_trip(tmp_path):
+    store = OOFStore.for_run(tmp_path)
+    store.save("b", np.arange(4))
+    store.save("a", np.ones(4))
+
+    assert store.names() == ["a", "b"]
+    np.testing.assert_array_equal(store.matrix(["b", "a"]), np.column_stack([np.arange(4), np.ones(4)]))
+    store.save("short", np.ones(3))
+    with pytest.raises(ValueError):
+        store.matrix()
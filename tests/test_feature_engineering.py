@@ -0,0 +1,129 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.feature_engineering import engineer_features
+
+
+def _data(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        "a": rng.normal(size=n),
+        "b": rng.normal(size=n),
+        "c": rng.integers(0, 100, size=n),
+        "d": rng.normal(size=n),
+        "cat": rng.choice(["x", "y", "z"], size=n),
+    })
+    y = pd.Series(2 * X["a"] + rng.normal(scale=0.1, size=n), name="y")
+    return X, y
+
+
+def test_float32_input_stays_float32():
+    from scripts.data_loader import downcast_dtypes
+
+    X, y = _data()
+    X32, _ = downcast_dtypes(X, "float32")
+    X_fe, _ = engineer_features(X32, y)
+    assert set(X_fe.dtypes) == {np.dtype("float32")}
+
+    X_fe64, _ = engineer_features(X, y)
+    assert set(X_fe64.dtypes) == {np.dtype("float64")}
+
+
+def test_transform_replays_fit_on_new_rows():
+    from scripts.feature_engineering import FeatureEngineer
+
+    X, y = _data(n=80)
+    engineer = FeatureEngineer()
+    X_fit = engineer.fit_transform(X.iloc[:60], y.iloc[:60])
+
+    # Training rows carry out-of-fold encodings; transform reproduces them on request.
+    np.testing.assert_allclose(engineer.transform(X.iloc[:60], out_of_fold=True).to_numpy(), X_fit.to_numpy())
+    new_rows = X.iloc[60:].copy()
+    new_rows.loc[new_rows.index[0], "cat"] = "unseen"
+    X_new = engineer.transform(new_rows)
+    assert list(X_new.columns) == list(X_fit.columns)
+    assert len(X_new) == 20 and np.isfinite(X_new.to_numpy()).all()
+    assert ("a", "b") in engineer.interactions_.combinations_
+    assert engineer.encoder_.columns_ == ["cat"]
+
+
+def test_cached_transformer_is_reused(tmp_path, monkeypatch):
+    from scripts import feature_engineering as fe
+
+    X, y = _data()
+    X_first, first = engineer_features(X, y, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    def _no_refit(*args, **kwargs):
+        raise AssertionError("cached transformer should not be refitted")
+
+    monkeypatch.setattr(fe.FeatureEngineer, "fit_transform", _no_refit)
+    X_second, second = engineer_features(X, y, cache_dir=tmp_path)
+    np.testing.assert_allclose(X_second.to_numpy(), X_first.to_numpy())
+    assert second.named_steps["pca"].n_components_ == first.named_steps["pca"].n_components_
+
+
+def test_streaming_fit_matches_in_memory(tmp_path):
+    from functools import partial
+
+    from scripts.array_store import backing_file
+    from scripts.data_loader import iter_data_chunks
+    from scripts.feature_engineering import FeatureEngineer, engineer_features_streaming
+
+    X, y = _data(n=203)
+    X.to_csv(tmp_path / "X.csv", index=False)
+    y.to_frame().to_csv(tmp_path / "y.csv", index=False)
+    reference = FeatureEngineer().fit(pd.read_csv(tmp_path / "X.csv"), y)
+    expected = np.abs(reference.transform(X).to_numpy())
+
+    for backend in ("auto", "incremental"):
+        chunks = partial(iter_data_chunks, tmp_path / "X.csv", tmp_path / "y.csv", chunk_rows=50)
+        engineer = FeatureEngineer(pca_backend=backend).fit_stream(chunks)
+        X_fe, y_fe = engineer.transform_to_store(chunks, tmp_path / f"{backend}.npy")
+        # Components are defined up to sign.
+        np.testing.assert_allclose(np.abs(X_fe.to_numpy()), expected, atol=1e-8)
+        np.testing.assert_allclose(y_fe.to_numpy(), y.to_numpy())
+        assert backing_file(X_fe) == tmp_path / f"{backend}.npy"
+        assert X_fe.to_numpy().flags.f_contiguous
+        X_oof, _ = engineer.transform_to_store(chunks, tmp_path / "oof.npy", out_of_fold=True)
+        np.testing.assert_allclose(
+            np.abs(X_oof.to_numpy()), np.abs(reference.transform(X, out_of_fold=True).to_numpy()), atol=1e-8
+        )
+
+    X_first, _, _ = engineer_features_streaming(
+        tmp_path / "X.csv", tmp_path / "y.csv", out_path=tmp_path / "a.npy", chunk_rows=50, cache_dir=tmp_path / "cache"
+    )
+    X_second, _, _ = engineer_features_streaming(
+        tmp_path / "X.csv", tmp_path / "y.csv", out_path=tmp_path / "b.npy", chunk_rows=50, cache_dir=tmp_path / "cache"
+    )
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+    np.testing.assert_allclose(X_second.to_numpy(), X_first.to_numpy())
+
+
+def test_interaction_stage_is_configurable():
+    from scripts.interactions import InteractionGenerator
+
+    rng = np.random.default_rng(1)
+    X = pd.DataFrame(rng.normal(size=(500, 6)), columns=list("abcdef"))
+    X["n"] = rng.integers(0, 100, size=500).astype("int16")
+    y = X["c"] * X["e"] + rng.normal(scale=0.1, size=500)
+
+    default = InteractionGenerator().fit(X)
+    assert default.combinations_ == [("a", "b"), ("a", "c"), ("b", "c")]
+
+    screened = InteractionGenerator(n_columns=None, degree=3, max_features=4, screen="correlation").fit(X, y)
+    assert len(screened.combinations_) == 4
+    assert screened.combinations_[0] == ("c", "e")
+    products = screened.transform(X)
+    for i, combo in enumerate(screened.combinations_):
+        np.testing.assert_allclose(products[:, i], np.prod([X[c].astype(float) for c in combo], axis=0))
+
+    _, engineer = engineer_features(X.assign(cat="k"), y, max_interactions=2, interaction_screen="correlation")
+    assert engineer.interactions_.combinations_[0] == ("c", "e")
+    assert len(engineer.interactions_.combinations_) == 2
@@ -2,6 +2,7 @@ import importlib.util
 from pathlib import Path
 import sys
 
+import numpy as np
 import pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -22,4 +23,39 @@ def test_tune_random_forest_runs():
     y = pd.Series(range(10))
     _, params, score = tune_random_forest(X, y, n_iter=1)
     assert isinstance(params, dict)
-    assert isinstance(score, float) 
\ No newline at end of file
+    assert isinstance(score, float) 
+
+def test_hyperband_brackets_end_on_full_resource():
+    brackets = tuner.hyperband_brackets(900, 100, 3, n_iter=20)
+    assert brackets == [(9, 100), (5, 300), (3, 900)]
+    # Too few rows for any halving: a single full-resource bracket.
+    assert tuner.hyperband_brackets(60, 100, 3, n_iter=20) == [(1, 60)]
+
+
+def test_capped_hyperband_bracket_reaches_full_resource(monkeypatch):
+    monkeypatch.setattr(tuner, "PARAM_DIST", {"n_estimators": [5], "max_depth": list(range(2, 14))})
+    # n_iter caps the most aggressive bracket at 9 candidates: two halvings.
+    n_candidates, min_resources = tuner.hyperband_brackets(900, 10, 3, n_iter=9)[0]
+    assert (n_candidates, min_resources) == (9, 100)
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(900, 2)), columns=["a", "b"])
+    y = pd.Series(X["a"] + rng.normal(scale=0.1, size=900))
+    search = tuner._halving_search(
+        X, y, n_candidates=n_candidates, resource="n_samples", factor=3, min_resources=min_resources, seed=0
+    )
+    assert search.n_resources_[-1] == 900
+
+
+def test_halving_search_reports_compute_saved():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, 3)), columns=["a", "b", "c"])
+    y = pd.Series(X["a"] * 2 + rng.normal(scale=0.1, size=300))
+    model, params, score, cost = tuner.search_random_forest(
+        X, y, n_iter=3, strategy="halving", resource="n_estimators"
+    )
+    assert params["n_estimators"] <= 300
+    assert model.n_estimators == params["n_estimators"]
+    assert isinstance(score, float)
+    assert cost.candidates == 3
+    assert cost.fits < 2 * cost.exhaustive_fits
+    assert 0.0 < cost.saved < 1.0
@@ -0,0 +1,105 @@
+from pathlib import Path
+import json
+import subprocess
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _fresh_interpreter(code: str) -> dict:
+    """Run *code* in a clean interpreter (other tests stub ``engines``)."""
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_native_engine_halves_and_returns_clonable_pipeline(tmp_path):
+    result = _fresh_interpreter(
+        "import json\n"
+        "import pandas as pd\n"
+        "from sklearn.base import clone\n"
+        "from sklearn.datasets import make_regression\n"
+        "from engines.native_wrapper import NativeEngine\n"
+        "X, y = make_regression(n_samples=600, n_features=5, noise=1.0, random_state=0)\n"
+        "X = pd.DataFrame(X, columns=[f'f{i}' for i in range(5)]); y = pd.Series(y)\n"
+        f"engine = NativeEngine(seed=0, timeout_sec=8, run_dir={str(tmp_path)!r}, n_cpus=1, min_rows=50, max_candidates=9)\n"
+        "model = engine.fit(X, y, model_families=['Ridge', 'DecisionTree'], prep_steps=['StandardScaler', 'IsolationForest'])\n"
+        "clone(model).fit(X, y)\n"
+        f"engine.export({str(tmp_path)!r})\n"
+        "history = engine.history_\n"
+        "first = [r for r in history if r['bracket'] == 0]\n"
+        "print(json.dumps({\n"
+        "    'sizes': engine.rung_sizes(480),\n"
+        "    'rung_counts': [sum(r['rung'] == k for r in first) for k in range(3)],\n"
+        "    'steps': [name for name, _ in model.steps],\n"
+        "    'score': engine.best_pipeline_info['score'],\n"
+        "    'predictions': len(engine.predict(X)),\n"
+        "}))\n"
+    )
+    assert result["sizes"] == [53, 160, 480]
+    # The first bracket starts 9 candidates and keeps a third at each rung.
+    assert result["rung_counts"] == [9, 3, 1]
+    assert result["steps"][-1] in {"Ridge", "DecisionTree"}
+    assert result["score"] > 0.9
+    assert result["predictions"] == 600
+    assert (tmp_path / "native_pipeline.pkl").exists()
+    assert json.loads((tmp_path / "evaluation.json").read_text())["evaluations"] > 0
+
+
+def test_native_engine_stays_within_budget_and_sizes_refit_reserve(tmp_path):
+    result = _fresh_interpreter(
+        "import json, time\n"
+        "import pandas as pd\n"
+        "from sklearn.datasets import make_regression\n"
+        "from engines.native_wrapper import NativeEngine\n"
+        "if __name__ == '__main__':\n"
+        "    X, y = make_regression(n_samples=3000, n_features=20, noise=1.0, random_state=0)\n"
+        "    X = pd.DataFrame(X, columns=[f'f{i}' for i in range(20)]); y = pd.Series(y)\n"
+        f"    engine = NativeEngine(seed=0, timeout_sec=6, run_dir={str(tmp_path)!r}, n_cpus=2)\n"
+        "    start = time.perf_counter()\n"
+        "    engine.fit(X, y, model_families=['MLP', 'RandomForest', 'Ridge'])\n"
+        "    wall = time.perf_counter() - start\n"
+        "    # Reserve before any full-pool fit: capped share of the budget.\n"
+        "    probe = NativeEngine(seed=0, timeout_sec=100, run_dir='.')\n"
+        "    probe._n_rows, probe._full_rows = 1000, 800\n"
+        "    record = {'error': None, 'score': 0.5, 'candidate_id': 0, 'rung': 0}\n"
+        "    probe.history_ = [dict(record, rows=100, seconds=5.0)]\n"
+        "    early = probe.refit_reserve()\n"
+        "    # Then: the best full-pool candidate's time, extrapolated to every row.\n"
+        "    probe.history_ += [dict(record, rows=800, seconds=2.0, score=0.9), dict(record, rows=800, seconds=8.0)]\n"
+        "    print(json.dumps({'wall': wall, 'early': early, 'full': probe.refit_reserve()}))\n"
+    )
+    assert result["wall"] < 6 + 0.5
+    assert result["early"] == 15.0
+    assert result["full"] == 1.5 * 2.0 * 1000 / 800
+
+
+def test_native_engine_halves_small_data_across_the_pool(tmp_path):
+    result = _fresh_interpreter(
+        "import json\n"
+        "import pandas as pd\n"
+        "from sklearn.datasets import make_regression\n"
+        "from engines.native_wrapper import NativeEngine\n"
+        "if __name__ == '__main__':\n"
+        "    X, y = make_regression(n_samples=500, n_features=5, noise=1.0, random_state=0)\n"
+        "    X = pd.DataFrame(X, columns=[f'f{i}' for i in range(5)]); y = pd.Series(y)\n"
+        f"    engine = NativeEngine(seed=0, timeout_sec=8, run_dir={str(tmp_path)!r}, n_cpus=2)\n"
+        "    engine.fit(X, y, model_families=['Ridge', 'DecisionTree'], prep_steps=['StandardScaler'])\n"
+        "    first = [r for r in engine.history_ if r['bracket'] == 0]\n"
+        "    spans = sorted((r['started'], r['started'] + r['seconds']) for r in engine.history_)\n"
+        "    overlaps = sum(later[0] < earlier[1] for earlier, later in zip(spans, spans[1:]))\n"
+        "    print(json.dumps({\n"
+        "        'sizes': engine.rung_sizes(400),\n"
+        "        'rung_counts': [sum(r['rung'] == k for r in first) for k in range(3)],\n"
+        "        'overlaps': overlaps,\n"
+        "    }))\n"
+    )
+    # 400 training rows are fewer than eta * min_rows, yet the search still halves.
+    assert result["sizes"] == [44, 133, 400]
+    assert result["rung_counts"] == [9, 3, 1]
+    assert result["overlaps"] > 0
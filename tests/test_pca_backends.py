@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pytest
+from sklearn.decomposition import PCA
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.pca_backends import VariancePCA, choose_backend
+
+
+def _low_rank(n=1500, p=120, rank=12, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, rank)) @ rng.normal(size=(rank, p)) + 0.05 * rng.normal(size=(n, p))
+    return (X - X.mean(0)) / X.std(0)
+
+
+@pytest.mark.parametrize("backend", ["full", "randomized", "incremental"])
+def test_backends_match_full_pca(backend):
+    X = _low_rank()
+    reference = PCA(n_components=0.95).fit(X)
+    model = VariancePCA(0.95, backend=backend, batch_size=400).fit(X)
+
+    assert model.backend_ == backend
+    assert model.n_components_ == reference.n_components_
+    assert model.explained_variance_ratio_.sum() >= 0.95
+    # Components are defined up to sign.
+    np.testing.assert_allclose(np.abs(model.transform(X)), np.abs(reference.transform(X)), atol=1e-6)
+
+
+def test_randomized_falls_back_to_full_when_most_components_are_needed():
+    X = np.random.default_rng(1).normal(size=(200, 20))
+    model = VariancePCA(0.99, backend="randomized").fit(X)
+    assert model.backend_ == "full"
+
+
+def test_float32_input_stays_float32():
+    X = _low_rank().astype(np.float32)
+    assert VariancePCA(0.9, backend="incremental").fit(X).transform(X).dtype == np.float32
+
+
+def test_choose_backend_uses_shape_and_memory():
+    assert choose_backend(1_000, 50, memory_bytes=16 * 2**30) == "full"
+    assert choose_backend(50_000, 800, memory_bytes=16 * 2**30) == "full"
+    assert choose_backend(100_000, 2_000, memory_bytes=64 * 2**30) == "randomized"
+    assert choose_backend(100_000, 2_000, memory_bytes=2**30) == "incremental"
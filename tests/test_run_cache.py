@@ -0,0 +1,81 @@
+from pathlib import Path
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.run_cache import RunCache, cache_key, fingerprint_data
+
+
+def test_fingerprint_tracks_values_and_columns():
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    y = pd.Series([1.0, 0.0, 1.0], name="t")
+    base = fingerprint_data(X, y)
+
+    assert fingerprint_data(X.copy(), y.copy()) == base
+    changed = X.copy()
+    changed.iloc[1, 0] = 2.5
+    assert fingerprint_data(changed, y) != base
+    assert fingerprint_data(X.rename(columns={"b": "c"}), y) != base
+    assert fingerprint_data(X.to_numpy(), y.to_numpy()) == fingerprint_data(X.to_numpy(), y.to_numpy())
+
+
+def test_cache_key_depends_on_engine_version_and_config():
+    key = cache_key(data="d", engine="tpot_wrapper", engine_version="1.0", config={"metric": "r2", "seed": 42})
+    assert key == cache_key(data="d", engine="tpot_wrapper", engine_version="1.0", config={"seed": 42, "metric": "r2"})
+    assert key != cache_key(data="d", engine="tpot_wrapper", engine_version="1.1", config={"metric": "r2", "seed": 42})
+    assert key != cache_key(data="d", engine="tpot_wrapper", engine_version="1.0", config={"metric": "mae", "seed": 42})
+
+
+def test_round_trip_and_lru_eviction(tmp_path):
+    cache = RunCache(tmp_path / ".cache", max_bytes=10**9)
+    oof = np.arange(1000, dtype=np.float64)
+    cache.put("first", {"model": 1}, {"r2_mean": 0.5}, oof)
+    hit = cache.get("first")
+    assert hit.model == {"model": 1} and hit.metrics == {"r2_mean": 0.5}
+    np.testing.assert_array_equal(hit.oof_predictions, oof.astype(np.float32))
+    assert cache.get("missing") is None
+
+    cache.put("second", {"model": 2}, {"r2_mean": 0.6}, oof)
+    # Make "second" the least recently used entry.
+    os.utime(cache.path("second"), (1, 1))
+    entry_size = cache.size_bytes() // 2
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    cache.put("third", {"model": 3}, {"r2_mean": 0.7}, oof)
+
+    assert cache.keys()[-1] == "third"
+    assert set(cache.keys()) == {"first", "third"}
+
+
+def test_feature_engineering_pickles_count_and_are_evicted(tmp_path):
+    cache = RunCache(tmp_path / ".cache", max_bytes=10**9)
+    cache.features_dir.mkdir(parents=True)
+    for i in range(4):
+        (cache.features_dir / f"fe{i}.pkl").write_bytes(b"x" * 4000)
+        os.utime(cache.features_dir / f"fe{i}.pkl", (i + 1, i + 1))
+    assert cache.keys() == [f"features/fe{i}.pkl" for i in range(4)]
+    assert cache.size_bytes() == 16_000
+
+    cache.max_bytes = 10_000
+    cache.put("run", {"model": 1}, {"r2_mean": 0.5})
+    # The oldest pickles go first; the run just stored is kept.
+    assert cache.keys() == ["features/fe2.pkl", "features/fe3.pkl", "run"]
+    assert not (cache.features_dir / "fe0.pkl").exists()
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_feature_cache_hit_refreshes_last_use(tmp_path):
+    from scripts.feature_engineering import engineer_features
+
+    cache = RunCache(tmp_path / ".cache")
+    X = pd.DataFrame({"a": np.arange(40.0), "b": np.arange(40.0) ** 2, "c": np.sin(np.arange(40.0))})
+    y = pd.Series(np.arange(40.0), name="t")
+    engineer_features(X, y, cache_dir=cache.features_dir)
+    (key,) = cache.keys()
+    os.utime(cache.path(key), (1, 1))
+    engineer_features(X, y, cache_dir=cache.features_dir)
+    assert cache.path(key).stat().st_mtime > 1
@@ -0,0 +1,138 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.preprocessing import StandardScaler
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from components.pipeline import SampleMaskPipeline
+from components.preprocessors.outliers.IsolationForest import IsolationForestBlock
+from components.preprocessors.outliers.KMeansOutlier import KMeansOutlierBlock
+from components.preprocessors.outliers.LocalOutlierFactor import LOFBlock
+
+
+def _data(n=300, n_outliers=6, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 3))
+    X[:n_outliers] += 25.0
+    y = X @ np.array([1.0, -2.0, 0.5]) + rng.normal(scale=0.1, size=n)
+    y[:n_outliers] = 1_000.0  # corrupt targets that only the filter can remove
+    return X, y
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        KMeansOutlierBlock(n_clusters=2, min_cluster_size_ratio=0.05, random_state=0),
+        IsolationForestBlock(contamination=0.02, random_state=0),
+        LOFBlock(n_neighbors=20, contamination=0.02),
+    ],
+)
+def test_pipeline_drops_rows_from_x_y_and_weights(block):
+    X, y = _data()
+    weights = np.linspace(1.0, 2.0, len(y))
+    pipe = SampleMaskPipeline([("scale", StandardScaler()), ("outliers", block), ("model", LinearRegression())])
+    pipe.fit(X, y, sample_weight=weights)
+
+    mask = pipe.sample_mask_
+    assert not mask[:6].any() and mask.sum() >= len(y) - 10
+    np.testing.assert_array_equal(mask, block.get_support_mask())
+    expected = LinearRegression().fit(StandardScaler().fit(X).transform(X)[mask], y[mask], sample_weight=weights[mask])
+    np.testing.assert_allclose(pipe.named_steps["model"].coef_, expected.coef_)
+
+    # Prediction is a pass-through: every row, including outliers, is scored.
+    assert pipe.predict(X).shape == (len(X),)
+    assert block.transform(X) is X
+
+
+def test_model_blocks_take_filtered_sample_weights():
+    from sklearn.neighbors import KNeighborsRegressor
+
+    from components.models.MLP import MLPBlock
+    from components.models.RandomForest import RandomForestBlock
+
+    X, y = _data()
+    weights = np.linspace(1.0, 2.0, len(y))
+    pipe = SampleMaskPipeline(
+        [("outliers", IsolationForestBlock(contamination=0.02, random_state=0)), ("model", RandomForestBlock(n_estimators=10))]
+    )
+    pipe.fit(X, y, sample_weight=weights)
+    mask = pipe.sample_mask_
+    expected = RandomForestBlock(n_estimators=10).fit(X[mask], y[mask], sample_weight=weights[mask])
+    np.testing.assert_allclose(pipe.predict(X), expected.predict(X))
+
+    # Models whose estimator cannot weight rows say so instead of failing deep in fit.
+    with pytest.raises(TypeError, match="sample_weight"):
+        MLPBlock().fit(X, y, sample_weight=weights)
+    with pytest.raises(TypeError, match="sample_weight"):
+        SampleMaskPipeline([("model", KNeighborsRegressor())]).fit(X, y, sample_weight=weights)
+
+
+def test_fit_resample_keeps_pandas_alignment():
+    X, y = _data()
+    X_df = pd.DataFrame(X, index=np.arange(len(X)) + 100)
+    y_s = pd.Series(y, index=X_df.index)
+    X_kept, y_kept = KMeansOutlierBlock(random_state=0).fit_resample(X_df, y_s)
+    assert X_kept.index.equals(y_kept.index)
+    assert 100 not in X_kept.index and len(X_kept) == len(X) - 6
+
+
+def test_filters_work_with_get_params_and_clone():
+    from sklearn.base import clone
+
+    pipe = SampleMaskPipeline([("outliers", IsolationForestBlock(n_estimators=10)), ("model", LinearRegression())])
+    assert pipe.get_params()["outliers__n_estimators"] == 10
+    assert clone(pipe).named_steps["outliers"].n_estimators == 10
+
+
+@pytest.mark.parametrize("mode", ["minibatch", "subsample"])
+def test_kmeans_scalable_modes_match_full_fit(mode):
+    X, y = _data(n=2_000, n_outliers=40)
+    full = KMeansOutlierBlock(random_state=0, mode="full").fit(X).get_support_mask()
+    block = KMeansOutlierBlock(random_state=0, mode=mode, sample_size=500, n_init=3, batch_size=256).fit(X)
+    assert block.mode_ == mode
+    np.testing.assert_array_equal(block.get_support_mask(), full)
+
+    assert KMeansOutlierBlock(sample_size=500).fit(X).mode_ == "subsample"
+    assert KMeansOutlierBlock().fit(X).mode_ == "full"
+    with pytest.raises(ValueError, match="Unknown KMeansOutlier mode"):
+        KMeansOutlierBlock(mode="exact").fit(X)
+
+
+def test_lof_backends_and_novelty_scoring():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(600, 12))
+    X[:10] += 8.0
+    exact = LOFBlock(contamination=0.02, algorithm="brute").fit(X).get_support_mask()
+    assert not exact[:10].any()
+    np.testing.assert_array_equal(LOFBlock(contamination=0.02, algorithm="kd_tree", n_jobs=2).fit(X).get_support_mask(), exact)
+    approx = LOFBlock(contamination=0.02, algorithm="random_projection", projection_dim=6, random_state=0).fit(X)
+    assert not approx.get_support_mask()[:10].any()
+
+    novel = LOFBlock(algorithm="random_projection", projection_dim=6, novelty=True, random_state=0).fit(X[10:])
+    new_rows = np.vstack([rng.normal(size=(5, 12)), rng.normal(size=(5, 12)) + 8.0])
+    np.testing.assert_array_equal(novel.predict(new_rows), [1] * 5 + [-1] * 5)
+    assert novel.score_samples(new_rows).shape == (10,)
+    with pytest.raises(RuntimeError, match="novelty=True"):
+        approx.predict(new_rows)
+
+
+def test_isolation_forest_scores_once_and_scores_new_rows():
+    X, _ = _data(n=3_000, n_outliers=30)
+    reference = IsolationForestBlock(contamination=0.01, random_state=0).fit(X)
+    chunked = IsolationForestBlock(contamination=0.01, random_state=0, chunk_rows=700, n_jobs=2).fit(X)
+    np.testing.assert_allclose(chunked.scores_, reference.scores_)
+    np.testing.assert_array_equal(chunked.get_support_mask(), reference.get_support_mask())
+    assert not reference.get_support_mask()[:30].any()
+
+    sampled = IsolationForestBlock(contamination=0.01, sample_size=500, random_state=0).fit(X)
+    assert sampled.get_support_mask().sum() == len(X) - 30
+
+    new_rows = np.vstack([np.zeros((3, 3)), np.full((3, 3), 25.0)])
+    np.testing.assert_array_equal(sampled.predict(new_rows), [1, 1, 1, -1, -1, -1])
+    np.testing.assert_allclose(sampled.score_samples(X[:5]), sampled.scores_[:5])
@@ -0,0 +1,85 @@
+from pathlib import Path
+import multiprocessing as mp
+import sys
+import time
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.scheduler import (
+    Deadline,
+    EngineScheduler,
+    phase_message,
+    result_message,
+    split_budget,
+)
+
+
+def _reports(name, q):
+    q.put(phase_message(name, "search"))
+    q.put(result_message(name, "model", {"r2_mean": 1.0}))
+
+
+def _hangs(name, q):
+    q.put(phase_message(name, "cv"))
+    time.sleep(60)
+
+
+def _dies(name, q):
+    q.put(phase_message(name, "search"))
+    sys.exit(3)
+
+
+@pytest.fixture
+def ctx():
+    return mp.get_context("spawn")
+
+
+def test_split_budget_reserves_cv_time():
+    budget = split_budget(100, cv_fraction=0.25)
+    assert (budget.search_seconds, budget.cv_seconds) == (75, 25)
+    assert split_budget(1).search_seconds == 1
+
+
+def test_deadline_with_fake_clock():
+    now = [10.0]
+    deadline = Deadline(5, clock=lambda: now[0])
+    now[0] = 13.0
+    assert deadline.remaining() == pytest.approx(2.0)
+    now[0] = 15.0
+    assert deadline.expired()
+    assert not Deadline(None).expired()
+
+
+def test_scheduler_collects_results_and_stops_bad_workers(ctx):
+    q = ctx.Queue()
+    scheduler = EngineScheduler(q, grace_seconds=1, poll_interval=0.1)
+    for name, target in (("ok", _reports), ("hung", _hangs), ("dead", _dies)):
+        scheduler.start(name, ctx.Process(target=target, args=(name, q)), budget_seconds=3)
+
+    start = time.monotonic()
+    runs = scheduler.run()
+
+    assert time.monotonic() - start < 30
+    assert runs["ok"].status == "ok" and runs["ok"].model == "model"
+    summary = runs["ok"].summary()
+    assert summary["r2_mean"] == 1.0 and summary["status"] == "ok"
+    assert summary["startup_seconds"] >= 0
+    assert runs["hung"].summary()["status"] == "timeout"
+    assert runs["hung"].summary()["phase"] == "cv"
+    assert runs["dead"].summary()["status"] == "died"
+    assert runs["dead"].summary()["exitcode"] == 3
+    assert not any(run.process.is_alive() for run in runs.values())
+
+
+def test_global_deadline_cancels_unfinished_workers(ctx):
+    q = ctx.Queue()
+    scheduler = EngineScheduler(q, global_deadline=Deadline(2), grace_seconds=1, poll_interval=0.1)
+    scheduler.start("hung", ctx.Process(target=_hangs, args=("hung", q)), budget_seconds=None)
+
+    runs = scheduler.run()
+
+    assert runs["hung"].status == "cancelled"
+    assert not runs["hung"].process.is_alive()
@@ -0,0 +1,75 @@
+from pathlib import Path
+import multiprocessing as mp
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.shared_data import SharedDataset
+
+
+def _frame():
+    X = pd.DataFrame(
+        {
+            "a": np.arange(6, dtype=np.float64),
+            "b": np.linspace(0, 1, 6),
+            "n": np.arange(6, dtype=np.int64),
+            "s": list("uvwxyz"),
+        },
+        index=[5, 3, 1, 0, 2, 4],
+    )
+    y = pd.Series(np.arange(6, dtype=np.float64) * 2, index=X.index, name="target")
+    return X, y
+
+
+def _child_sum(handle, q):
+    shared = SharedDataset.attach(handle)
+    q.put((float(shared.X["a"].sum()), float(shared.y.sum()), list(shared.X.columns)))
+
+
+def test_attach_round_trip_is_zero_copy_and_read_only():
+    X, y = _frame()
+    with SharedDataset.from_frame(X, y) as owner:
+        attached = SharedDataset.attach(owner.handle)
+        X_view, y_view = attached.X, attached.y
+
+        pd.testing.assert_frame_equal(X_view, X)
+        pd.testing.assert_series_equal(y_view, y)
+        float_block = attached._view(owner.handle.blocks[0], attached._segments[0])
+        assert np.shares_memory(X_view["a"].to_numpy(), float_block)
+        with pytest.raises(ValueError):
+            y_view.to_numpy()[0] = 1.0
+
+        del X_view, y_view, float_block
+        attached.close()
+
+
+def test_spawned_worker_reads_shared_data():
+    X, y = _frame()
+    ctx = mp.get_context("spawn")
+    q = ctx.Queue()
+    with SharedDataset.from_frame(X, y) as owner:
+        proc = ctx.Process(target=_child_sum, args=(owner.handle, q))
+        proc.start()
+        a_sum, y_sum, columns = q.get(timeout=60)
+        proc.join()
+    assert a_sum == X["a"].sum()
+    assert y_sum == y.sum()
+    assert columns == list(X.columns)
+
+
+def test_memmapped_frame_is_shared_by_file(tmp_path):
+    from scripts.array_store import memmap_frame, write_npy
+
+    values = write_npy(tmp_path / "x.npy", np.arange(12, dtype=np.float32).reshape(6, 2))
+    X = memmap_frame(values, ["a", "b"])
+    y = pd.Series(np.ones(6))
+    with SharedDataset.from_frame(X, y) as owner:
+        assert owner.handle.blocks[0].path == str(tmp_path / "x.npy")
+        assert owner.handle.nbytes == y.nbytes
+        attached = SharedDataset.attach(owner.handle)
+        pd.testing.assert_frame_equal(attached.X, X)
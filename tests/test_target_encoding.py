@@ -0,0 +1,70 @@
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.target_encoding import TargetEncoder
+
+
+def _data(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        "a": rng.choice(["x", "y", "z"], size=n),
+        "b": pd.Categorical(rng.choice(["p", "q", None], size=n)),
+        "num": rng.normal(size=n),
+    })
+    y = pd.Series(rng.normal(size=n) + (X["a"] == "x"), name="y")
+    return X, y
+
+
+def test_unsmoothed_encoding_matches_groupby_means():
+    X, y = _data()
+    encoder = TargetEncoder(smoothing=0, cv=1).fit(X, y)
+    assert encoder.columns_ == ["a", "b"]
+
+    encoded = encoder.transform(X)
+    np.testing.assert_allclose(encoded[:, 0], X["a"].map(y.groupby(X["a"]).mean()))
+    expected_b = X["b"].map(y.groupby(X["b"], observed=True).mean()).astype(float).fillna(y.mean())
+    np.testing.assert_allclose(encoded[:, 1], expected_b)
+
+    unseen = encoder.transform(pd.DataFrame({"a": ["w"], "b": ["p"]}))
+    assert unseen[0, 0] == encoder.global_mean_
+
+
+def test_out_of_fold_rows_exclude_their_own_fold():
+    X, y = _data()
+    encoded = TargetEncoder(smoothing=3.0, cv=4).fit_transform(X, y)
+
+    row = 7
+    train = np.arange(len(X)) % 4 != row % 4
+    same_level = train & (X["a"] == X["a"].iloc[row]).to_numpy()
+    prior = y[train].mean()
+    expected = (y[same_level].sum() + 3.0 * prior) / (same_level.sum() + 3.0)
+    np.testing.assert_allclose(encoded[row, 0], expected)
+
+
+def test_chunked_fit_matches_single_fit():
+    X, y = _data(n=1000)
+    reference = TargetEncoder(cv=5).fit_transform(X, y)
+
+    encoder = TargetEncoder(cv=5)
+    for start in range(0, len(X), 300):
+        encoder.partial_fit(X.iloc[start:start + 300], y.iloc[start:start + 300])
+    chunked = np.vstack([
+        encoder.transform(X.iloc[start:start + 300], out_of_fold=True, start=start)
+        for start in range(0, len(X), 300)
+    ])
+    np.testing.assert_allclose(chunked, reference)
+    np.testing.assert_allclose(encoder.transform(X), TargetEncoder(cv=5).fit(X, y).transform(X))
+
+
+def test_no_categorical_columns_encodes_nothing():
+    X, y = _data()
+    encoder = TargetEncoder()
+    assert encoder.fit_transform(X[["num"]], y).shape == (len(X), 0)
+    assert encoder.transform(X[["num"]]).shape == (len(X), 0)
+    assert encoder.encodings_ == {}
@@ -49,7 +49,7 @@ def load_orchestrator(monkeypatch):
     data_loader.load_data = lambda *a, **k: (None, None)
     monkeypatch.setitem(sys.modules, "scripts.data_loader", data_loader)
     fe_mod = types.ModuleType("scripts.feature_engineering")
-    fe_mod.engineer_features = lambda X, y=None: (
+    fe_mod.engineer_features = lambda X, y=None, **kwargs: (
         X,
         types.SimpleNamespace(named_steps={"pca": types.SimpleNamespace(n_components_=1)}),
     )